@@ -0,0 +1,105 @@
+"""Voice-mode audio preprocessing: inline vs. the worker process pool.
+
+Builds synthetic browser-style recordings (44.1 kHz stereo WAV, alternating tone and silence) and runs
+the CPU-bound transcription stages (decode, resample to 16 kHz mono, WAV export, pause detection) from
+several concurrent "sessions". For each mode it reports per-clip latency and the worst stall of a
+ticker thread that stands in for the server's other requests: inline work holds the GIL, pooled work
+does not. Speech recognition itself is a network call and is not timed here.
+
+Usage:
+    python benchmarks/bench_audio_pool.py [--seconds 20] [--clips 24] [--sessions 4] [--workers 2]
+"""
+import argparse
+import io
+import math
+import statistics
+import struct
+import sys
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils.audio_manager import AudioManager, prepare_speech  # noqa: E402
+
+RATE = 44100
+TICK_SECONDS = 0.005
+
+def synthetic_recording(seconds: float) -> bytes:
+    """Stereo 16-bit WAV: one second of a 220 Hz tone, one second of silence, repeated."""
+    one_second = b"".join(struct.pack("<hh", v, v) for v in
+                          (int(8000 * math.sin(2 * math.pi * 220 * i / RATE)) for i in range(RATE)))
+    silence = bytes(len(one_second))
+    frames = b"".join(one_second if s % 2 == 0 else silence for s in range(int(seconds)))
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(RATE)
+        w.writeframes(frames)
+    return buf.getvalue()
+
+def run(manager: AudioManager, clip: bytes, clips: int, sessions: int) -> dict:
+    stalls, stop = [], threading.Event()
+
+    def ticker():
+        while not stop.is_set():
+            start = time.perf_counter()
+            time.sleep(TICK_SECONDS)
+            stalls.append(time.perf_counter() - start - TICK_SECONDS)
+
+    def one(_):
+        start = time.perf_counter()
+        _, extra = manager._run(prepare_speech, clip)
+        manager._record("speech_to_text", extra["stages"])
+        return time.perf_counter() - start
+
+    tick = threading.Thread(target=ticker, daemon=True)
+    tick.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as sessions_pool:
+        latencies = sorted(sessions_pool.map(one, range(clips)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    tick.join()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "clips_per_s": clips / elapsed,
+        "max_stall_ms": max(stalls) * 1000
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--clips", type=int, default=24)
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    clip = synthetic_recording(args.seconds)
+    print(f"{args.clips} clips of {args.seconds:.0f}s ({len(clip) / 1e6:.1f} MB) from {args.sessions} sessions\n")
+    print(f"{'Mode':<12}{'p50':>10}{'p95':>10}{'clips/s':>10}{'max stall':>12}")
+    pooled = None
+    for name, workers in (("inline", 0), (f"pool x{args.workers}", args.workers)):
+        manager = AudioManager(workers=workers)
+        if workers:
+            # Start the workers outside the timed run.
+            manager._run(prepare_speech, clip)
+            pooled = manager
+        result = run(manager, clip, args.clips, args.sessions)
+        print(f"{name:<12}{result['p50_ms']:>8.1f}ms{result['p95_ms']:>8.1f}ms"
+              f"{result['clips_per_s']:>10.1f}{result['max_stall_ms']:>10.1f}ms")
+
+    stats = pooled.get_stats()
+    print("\nPooled stages (mean / p95):")
+    for stage, summary in stats["stages"].items():
+        print(f"  {stage:<28}{summary['mean_ms']:>8.2f}ms{summary['p95_ms']:>8.2f}ms")
+    print(f"Pool: {stats['pool']}")
+    pooled.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Cohort analytics latency over the columnar score store.
+
+Fills a temporary store with synthetic interviews, then times the analytics queries the API and the
+report view use: cohort summary, score histogram, per role/level breakdown and a report's
+percentile rank.
+
+Usage:
+    python benchmarks/bench_cohort.py [--rows 50000] [--repeat 200]
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils.score_store import ScoreStore, SCORE_COLUMNS  # noqa: E402
+
+ROLES = ["Software Engineer", "Sales Representative", "Retail Associate"]
+LEVELS = ["Entry", "Mid", "Senior"]
+DECISIONS = ["HIRE", "NO HIRE", "STRONG HIRE"]
+PERSONAS = ["Professional", "Efficient", "Chatty", "Nervous", "Evasive"]
+
+def synthetic_records(n: int, rng: random.Random):
+    for i in range(n):
+        base = rng.gauss(65, 12)
+        yield {
+            "role": rng.choice(ROLES),
+            "level": rng.choice(LEVELS),
+            "scores": {name: int(min(max(rng.gauss(base, 8), 0), 100)) for name in SCORE_COLUMNS},
+            "decision": rng.choice(DECISIONS),
+            "persona": rng.choice(PERSONAS),
+            "ended_at": 1.7e9 + i * 60
+        }
+
+def timed(fn, repeat: int) -> tuple:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.median(samples) * 1000, samples[int(len(samples) * 0.99) - 1] * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ScoreStore(root)
+        start = time.perf_counter()
+        store.append_many(synthetic_records(args.rows, random.Random(7)))
+        print(f"Bulk append of {len(store)} rows: {(time.perf_counter() - start) * 1000:.0f}ms")
+
+        start = time.perf_counter()
+        for record in synthetic_records(100, random.Random(8)):
+            store.append(record["role"], record["level"], record["scores"], record["decision"],
+                         record["persona"], record["ended_at"])
+        print(f"Single append: {(time.perf_counter() - start) * 10:.2f}ms each\n")
+
+        scores = {name: 70 for name in SCORE_COLUMNS}
+        queries = [
+            ("summary (all)", lambda: store.summary()),
+            ("summary (role+level)", lambda: store.summary("Software Engineer", "Senior")),
+            ("distribution", lambda: store.distribution("overall", "Sales Representative")),
+            ("breakdown", lambda: store.breakdown()),
+            ("percentile_rank", lambda: store.percentile_rank(scores, "Retail Associate", "Mid"))
+        ]
+        print(f"{'Query':<24}{'p50':>10}{'p99':>10}")
+        for name, fn in queries:
+            p50, p99 = timed(fn, args.repeat)
+            print(f"{name:<24}{p50:>8.2f}ms{p99:>8.2f}ms")
+
+if __name__ == "__main__":
+    main()
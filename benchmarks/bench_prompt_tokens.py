@@ -0,0 +1,168 @@
+"""Prompt sizes before and after the resume digest and the local evidence table.
+
+Per turn: builds the Brain (reasoning) and response-generation prompts for a simulated interview
+twice, once the way they were built before the digest (full resume in the response prompt, first
+1000 characters in the reasoning prompt) and once with the digest.
+
+Evaluation: builds the report prompt from the full transcript, and from clipped excerpts plus the
+locally matched claim evidence table (InterviewEvaluator._build_prompt).
+
+Tokens are estimated as word and punctuation pieces, which tracks BPE counts closely enough for a
+before/after ratio.
+
+Usage:
+    python benchmarks/bench_prompt_tokens.py [--resume path.pdf|path.txt ...] [--turns 10]
+"""
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from prompts.system_prompts import get_interviewer_prompt, get_reasoning_prompt  # noqa: E402
+from prompts.system_prompts import get_robust_evaluation_prompt  # noqa: E402
+from utils.resume_digest import build_resume_digest, format_digest  # noqa: E402
+from agents.evaluator import InterviewEvaluator  # noqa: E402
+
+SAMPLE_RESUME = """Alex Morgan
+alex.morgan@example.com | +1 555 0100 | linkedin.com/in/alexmorgan
+PROFESSIONAL SUMMARY
+Software engineer with 8 years of experience designing and operating distributed backend systems,
+data pipelines and developer tooling. Comfortable across the stack, happiest owning reliability.
+EXPERIENCE
+Staff Software Engineer, Northwind Logistics                 Jan 2022 - Present
+- Led the re-architecture of the shipment tracking platform into 12 services on Kubernetes, cutting p99 latency by 65%
+- Designed a Kafka event backbone processing 40M events/day with exactly-once delivery guarantees
+- Owned the on-call rotation and incident review process for 6 teams; reduced pages per week from 30 to 8
+- Mentored 5 engineers, two of whom were promoted to senior
+- Partnered with product and data science on routing experiments that saved $1.2M annually
+Senior Software Engineer, Contoso Payments                  Mar 2018 - Dec 2021
+- Built the card tokenization service in Go handling 3k requests per second at 99.99% availability
+- Migrated 200+ cron jobs to Airflow, adding lineage and alerting
+- Implemented PCI-compliant audit logging across 30 services
+- Improved CI pipeline time from 45 minutes to 11 minutes by caching and test sharding
+- Participated in hiring loops and designed the system design interview rubric
+Software Engineer, Fabrikam Analytics                        Jun 2015 - Feb 2018
+- Developed REST APIs in Django and PostgreSQL for the reporting product
+- Created a Spark job that replaced a nightly batch process, reducing runtime from 6h to 40m
+- Worked on front-end features in React and improved dashboard load time by 3x
+PROJECTS
+pgwatch-lite
+- Open-source Postgres monitoring agent written in Rust, 900 GitHub stars
+queue-sim
+- Discrete-event simulator for capacity planning of message queues, used internally by 3 teams
+SKILLS
+Languages: Python, Go, Rust, SQL, TypeScript
+Infrastructure: AWS, GCP, Kubernetes, Terraform, Docker, Linux
+Data: Kafka, Spark, Airflow, PostgreSQL, Redis, Snowflake
+Practices: Distributed systems, Observability, Incident management, CI/CD, Code review
+EDUCATION
+M.S. Computer Science, University of Washington, 2015
+B.S. Computer Engineering, University of Arizona, 2013
+CERTIFICATIONS
+AWS Certified Solutions Architect - Professional
+Certified Kubernetes Administrator
+"""
+
+FOCUS_AREAS = [
+    {"topic": "Kafka exactly-once", "reason": "Strong claim that needs depth", "suggested_question": "How did you guarantee exactly-once?"},
+    {"topic": "Leadership", "reason": "Staff-level scope", "suggested_question": "How do you influence without authority?"}
+]
+
+ANSWER = ("In that project I was responsible for the consumer side, we used idempotent producers and "
+          "transactional writes, and I wrote the reconciliation job that caught the remaining duplicates.")
+QUESTION = "Can you walk me through a specific failure you hit with that design and how you diagnosed it?"
+
+# Longer, varied answers for the evaluation transcript (a typical spoken answer is 80-200 words).
+LONG_ANSWERS = [
+    "Sure. The tracking platform started as a single Rails app and by 2021 deploys took almost an hour and "
+    "one bad migration could take everything down. I proposed splitting along the shipment lifecycle, so "
+    "intake, routing, tracking and billing became separate services with their own Postgres databases. The "
+    "hardest part was the data migration: we ran dual writes for six weeks and compared nightly snapshots "
+    "before cutting reads over. In the end we had 12 services on Kubernetes and p99 latency went down by "
+    "about 65 percent, mostly because tracking reads no longer competed with billing batch jobs.",
+    "We used Kafka with idempotent producers and transactional writes on the consumer side. Each consumer "
+    "committed offsets in the same transaction as its database write, so a crash replayed at most one batch. "
+    "Honestly we still saw duplicates when a partition rebalanced mid-transaction, so I wrote a reconciliation "
+    "job keyed on event id that ran every ten minutes and caught the remaining few per day. Throughput peaked "
+    "around 40 million events a day and we never lost an event that I know of.",
+    "On-call was rough when I joined: thirty pages a week and most were noise. I grouped every alert by "
+    "owner and by whether anyone had acted on it in the last quarter, deleted about half, and turned the rest "
+    "into SLO burn-rate alerts. We also started blameless incident reviews with a fixed template. After two "
+    "quarters we were at roughly eight pages a week and people stopped dreading their rotation.",
+    "I mentor by pairing on real tickets rather than giving lectures. With one engineer we picked a flaky "
+    "integration test suite and spent a few afternoons bisecting it together; she ended up owning the test "
+    "infrastructure and was promoted the next cycle. I also run a monthly design review where juniors present."
+]
+
+_PIECES = re.compile(r"\w+|[^\w\s]")
+
+def estimate_tokens(text: str) -> int:
+    return len(_PIECES.findall(text))
+
+def load_resume(path: Path) -> str:
+    if path.suffix.lower() == ".pdf":
+        from utils.resume_parser import ResumeParser
+        with open(path, "rb") as f:
+            return ResumeParser.extract_text(f)
+    return path.read_text()
+
+def simulate(resume_text: str, resume_context_before: str, resume_context_after: str, turns: int) -> tuple:
+    role, level = "Software Engineer", "Senior"
+    before = after = 0
+    history = [f"ASSISTANT: {QUESTION}"]
+    for _ in range(turns):
+        history.append(f"USER: {ANSWER}")
+        history_text = "\n".join(history[-10:])
+        before += estimate_tokens(get_reasoning_prompt(role, level, history_text, ANSWER, resume_context_before))
+        before += estimate_tokens(get_interviewer_prompt(role, level, resume_text, FOCUS_AREAS))
+        after += estimate_tokens(get_reasoning_prompt(role, level, history_text, ANSWER, resume_context_after))
+        after += estimate_tokens(get_interviewer_prompt(role, level, resume_context_after, FOCUS_AREAS))
+        history.append(f"ASSISTANT: {QUESTION}")
+    return before, after
+
+def simulate_evaluation(resume_text: str, turns: int) -> tuple:
+    role, level = "Software Engineer", "Senior"
+    plan = {"focus_areas": FOCUS_AREAS, "resume_digest": build_resume_digest(resume_text)}
+    history = []
+    for i in range(turns):
+        history.append({"role": "assistant", "content": QUESTION})
+        history.append({"role": "user", "content": LONG_ANSWERS[i % len(LONG_ANSWERS)]})
+
+    evaluator = InterviewEvaluator.__new__(InterviewEvaluator)
+    before = get_robust_evaluation_prompt(role, level, evaluator._format_conversation(history), plan)
+    start = time.perf_counter()
+    after, _ = evaluator._build_prompt(history, role, level, plan)
+    build_ms = (time.perf_counter() - start) * 1000
+    return estimate_tokens(before), estimate_tokens(after), build_ms
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resume", type=Path, nargs="*", default=[])
+    parser.add_argument("--turns", type=int, default=10)
+    args = parser.parse_args()
+
+    resumes = [(p.name, load_resume(p)) for p in args.resume] or [("built-in sample", SAMPLE_RESUME)]
+
+    print(f"{'Resume':<28}{'raw tok':>9}{'digest tok':>12}{'digest ms':>11}"
+          f"{'before/turn':>13}{'after/turn':>12}{'saved':>8}")
+    for name, text in resumes:
+        start = time.perf_counter()
+        context = format_digest(build_resume_digest(text))
+        digest_ms = (time.perf_counter() - start) * 1000
+
+        before, after = simulate(text, text[:1000], context, args.turns)
+        saved = 1 - after / before if before else 0.0
+        print(f"{name[:27]:<28}{estimate_tokens(text):>9}{estimate_tokens(context):>12}{digest_ms:>11.2f}"
+              f"{before // args.turns:>13}{after // args.turns:>12}{saved:>8.0%}")
+
+    print(f"\nEvaluation prompt for a {args.turns}-answer interview:")
+    print(f"{'Resume':<28}{'transcript':>12}{'evidence':>10}{'build ms':>10}{'saved':>8}")
+    for name, text in resumes:
+        before, after, build_ms = simulate_evaluation(text, args.turns)
+        print(f"{name[:27]:<28}{before:>12}{after:>10}{build_ms:>10.2f}{1 - after / before:>8.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Question bank build time and retrieval latency.
+
+Builds the full per-role index once, then times top-k searches with realistic queries (a focus
+topic plus resume skills) while a growing set of already-asked questions is excluded.
+
+Usage:
+    python benchmarks/bench_question_bank.py [--queries 2000] [--k 5]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agents.role_configs import ROLE_CONFIGURATIONS, ROLE_TOPICS  # noqa: E402
+from agents.question_bank import QuestionBank  # noqa: E402
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    bank = QuestionBank()
+    print(f"Index build: {(time.perf_counter() - start) * 1000:.0f}ms\n")
+
+    rng = random.Random(7)
+    print(f"{'Role':<24}{'questions':>10}{'p50':>10}{'p99':>10}")
+    for role, config in ROLE_CONFIGURATIONS.items():
+        topics = ROLE_TOPICS[role]
+        asked = []
+        samples = []
+        for i in range(args.queries):
+            query = " ".join(rng.sample(topics, 4))
+            categories = [config["categories"][i % len(config["categories"])]]
+            t = time.perf_counter()
+            results = bank.search(role, query, k=args.k, exclude=asked, categories=categories)
+            samples.append(time.perf_counter() - t)
+            # A typical interview asks ~10 bank questions; reset to model a new session.
+            asked = [] if len(asked) >= 10 else asked + [results[0]["id"]]
+        samples.sort()
+        p99 = samples[int(len(samples) * 0.99) - 1]
+        print(f"{role:<24}{bank.size(role):>10}{statistics.median(samples) * 1e6:>8.0f}us{p99 * 1e6:>8.0f}us")
+
+if __name__ == "__main__":
+    main()
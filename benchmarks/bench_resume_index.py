@@ -0,0 +1,82 @@
+"""Near-duplicate resume index: signature time, bulk load, lookup latency and recall.
+
+Fills a temporary index with synthetic MinHash signatures, then times lookups for near-duplicates
+of stored resumes (about 95% of signature values kept) and for unrelated ones.
+
+Usage:
+    python benchmarks/bench_resume_index.py [--rows 200000] [--queries 2000] [--resume path.txt]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils.resume_index import NUM_PERM, ResumeIndex, minhash_signature  # noqa: E402
+from bench_prompt_tokens import SAMPLE_RESUME  # noqa: E402
+
+ROLES = ["Software Engineer", "Sales Representative", "Retail Associate"]
+
+def percentiles_us(samples):
+    samples = sorted(samples)
+    return statistics.median(samples) * 1e6, samples[int(len(samples) * 0.99) - 1] * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--resume", type=Path, default=None)
+    args = parser.parse_args()
+
+    text = args.resume.read_text() if args.resume else SAMPLE_RESUME
+    samples = []
+    for _ in range(200):
+        start = time.perf_counter()
+        minhash_signature(text)
+        samples.append(time.perf_counter() - start)
+    p50, p99 = percentiles_us(samples)
+    print(f"Signature ({len(text.split())} words): p50 {p50:.0f}us, p99 {p99:.0f}us")
+
+    rng = np.random.default_rng(7)
+    signatures = rng.integers(0, 1 << 32, (args.rows, NUM_PERM), dtype=np.uint64).astype(np.uint32)
+    with tempfile.TemporaryDirectory() as root:
+        index = ResumeIndex(root)
+        start = time.perf_counter()
+        for lo in range(0, args.rows, 50000):
+            batch = signatures[lo:lo + 50000]
+            index.add_many((ROLES[(lo + i) % 3], sig, {"row": lo + i}) for i, sig in enumerate(batch))
+        print(f"Bulk load of {len(index)} rows: {time.perf_counter() - start:.1f}s")
+
+        reopened = ResumeIndex(root)
+        start = time.perf_counter()
+        reopened.query(signatures[0])
+        print(f"First lookup after open (maps and sorts the bands): {(time.perf_counter() - start) * 1000:.0f}ms\n")
+
+        hits, near, unrelated = 0, [], []
+        for q in range(args.queries):
+            row = int(rng.integers(args.rows))
+            query = signatures[row].copy()
+            changed = rng.random(NUM_PERM) < 0.05
+            query[changed] = rng.integers(0, 1 << 32, int(changed.sum()), dtype=np.uint64).astype(np.uint32)
+            start = time.perf_counter()
+            result = reopened.query(query, role=ROLES[row % 3], threshold=0.85)
+            near.append(time.perf_counter() - start)
+            hits += bool(result) and result[0]["row"] == row
+
+            query = rng.integers(0, 1 << 32, NUM_PERM, dtype=np.uint64).astype(np.uint32)
+            start = time.perf_counter()
+            reopened.query(query, role=ROLES[q % 3], threshold=0.85)
+            unrelated.append(time.perf_counter() - start)
+
+        print(f"{'Lookup':<22}{'p50':>10}{'p99':>10}")
+        for name, samples in (("near-duplicate", near), ("unrelated", unrelated)):
+            p50, p99 = percentiles_us(samples)
+            print(f"{name:<22}{p50:>8.0f}us{p99:>8.0f}us")
+        print(f"\nNear-duplicate recall: {hits / args.queries:.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Cold-start benchmark for new sessions and worker processes.
+
+Times each entry point in a fresh interpreter (median over --repeat runs, interpreter
+startup excluded) and prints an `-X importtime` breakdown of the heaviest top-level imports.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--top 12]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+TARGETS = {
+    "worker import (service.session_manager)": "import service.session_manager",
+    "api server import (server)": "import server",
+    "new chat session (mock API)": (
+        "from service.session_manager import InterviewSessionManager; "
+        "InterviewSessionManager().create_session('Software Engineer', 'Mid')"
+    ),
+    "deferred: audio stack": "from utils.audio_manager import AudioManager; AudioManager().recognizer",
+    "deferred: report chart": "import plotly.graph_objects as go; go.Figure(go.Scatterpolar(r=[50], theta=['x']))"
+}
+
+TIMER = "import time; _t = time.perf_counter(); {stmt}; print(time.perf_counter() - _t)"
+
+def _env(session_dir: str) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(SRC_DIR)
+    env["USE_MOCK_API"] = "true"
+    env["INTERVIEW_SESSION_DIR"] = session_dir
+    env["PYTHONWARNINGS"] = "ignore"
+    return env
+
+def time_statement(stmt: str, repeat: int, env: dict) -> float:
+    samples = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMER.format(stmt=stmt)],
+            capture_output=True, text=True, env=env, cwd=env["INTERVIEW_SESSION_DIR"]
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        samples.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+def import_breakdown(stmt: str, top: int, env: dict) -> list:
+    """Import self-time from `python -X importtime`, summed per root package (no double counting)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        capture_output=True, text=True, env=env, cwd=env["INTERVIEW_SESSION_DIR"]
+    )
+    totals = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        root = name.strip().split(".")[0]
+        totals[root] = totals.get(root, 0) + int(self_us)
+    return sorted(((us, root) for root, us in totals.items()), reverse=True)[:top]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=12)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as session_dir:
+        env = _env(session_dir)
+
+        print(f"{'Entry point':<45}{'median':>10}")
+        for label, stmt in TARGETS.items():
+            try:
+                seconds = time_statement(stmt, args.repeat, env)
+                print(f"{label:<45}{seconds * 1000:>8.0f}ms")
+            except RuntimeError as e:
+                print(f"{label:<45}{'failed':>10}  ({e})")
+
+        print(f"\nImport-time breakdown for a worker cold start (top {args.top} packages, self time):")
+        for self_us, package in import_breakdown("import service.session_manager", args.top, env):
+            print(f"  {self_us / 1000:>8.1f}ms  {package}")
+
+if __name__ == "__main__":
+    main()
@@ -2,34 +2,77 @@ import os
 import logging
 import re
 import json
-from typing import List, Dict, Any
-from prompts.system_prompts import get_robust_evaluation_prompt
-from utils.api_client import RobustAPIClient
+from typing import List, Dict, Any, Optional
+from prompts.system_prompts import get_robust_evaluation_prompt, EVALUATION_PROMPT_VERSION
+from utils.api_client import RobustAPIClient, make_deadline, deadline_passed
+from utils.schemas import EvaluationReport
+from utils.evidence_extractor import build_evidence, format_evidence_table, ground_evidence
+from utils.report_store import ReportStore, report_key
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound for producing a report, including the plain-text degradation attempt.
+DEFAULT_EVALUATION_BUDGET_SECONDS = 90.0
+
+# With a claim evidence table in the prompt, answers are clipped to this many characters.
+ANSWER_EXCERPT_CHARS = 160
+QUESTION_EXCERPT_CHARS = 100
+# Word and punctuation pieces; tracks BPE token counts well enough to pick the smaller prompt.
+_TOKEN_PIECES = re.compile(r"\w+|[^\w\s]")
+
 class InterviewEvaluator:
-    def __init__(self):
+    def __init__(self, report_store: Optional[ReportStore] = None):
         api_key = os.getenv("GROQ_API_KEY")
         self.api_client = RobustAPIClient(api_key)
+        self.evaluation_budget = float(os.getenv("INTERVIEW_EVAL_BUDGET_SECONDS", DEFAULT_EVALUATION_BUDGET_SECONDS))
+        self.report_store = report_store or ReportStore()
     
-    def generate_comprehensive_report(self, conversation_history: List[Dict], role: str, level: str, interview_plan: Dict = None) -> Dict[str, Any]:
-        conversation_text = self._format_conversation(conversation_history)
-        prompt = get_robust_evaluation_prompt(role, level, conversation_text, interview_plan)
+    def generate_comprehensive_report(self, conversation_history: List[Dict], role: str, level: str, interview_plan: Dict = None,
+                                      deadline: Optional[float] = None) -> Dict[str, Any]:
+        # Identical transcript, role, level, plan and prompt version: serve the stored report, no LLM call.
+        key = report_key(conversation_history, role, level, interview_plan, EVALUATION_PROMPT_VERSION)
+        artifact = self.report_store.get(key)
+        if artifact:
+            logger.info(f"Serving stored evaluation report {key[:12]}")
+            return dict(artifact["report"], artifact={"key": key, "cached": True})
+
+        deadline = deadline if deadline is not None else make_deadline(self.evaluation_budget)
+        prompt, evidence_rows = self._build_prompt(conversation_history, role, level, interview_plan)
         
-        result = self.api_client.generate_json_content(prompt)
+        result, repaired = self.api_client.generate_json_content_with_status(
+            prompt, call_type="evaluation", schema=EvaluationReport, deadline=deadline
+        )
         
         if result:
-            return result
+            result["evidence"] = ground_evidence(result.get("evidence", []), evidence_rows, conversation_history)
+            # Only full LLM reports become artifacts; repaired, defaulted and degraded ones are retried next time.
+            if repaired:
+                logger.info(f"Evaluation report {key[:12]} was repaired locally; not storing it")
+                return result
+            try:
+                self.report_store.put(key, result, role, level, EVALUATION_PROMPT_VERSION)
+            except OSError as e:
+                logger.warning(f"Could not store evaluation report {key[:12]}: {e}")
+                return result
+            return dict(result, artifact={"key": key, "cached": False})
         
+        # The degraded reports still carry the locally matched evidence.
+        local_evidence = ground_evidence([], evidence_rows, conversation_history)
+        if deadline_passed(deadline):
+            logger.warning("Evaluation deadline exceeded. Using fallback report.")
+            return dict(self._generate_fallback_report(), evidence=local_evidence)
+
+        # Only reached when every JSON attempt came back unrepairable.
         logger.warning("JSON Evaluation failed. Attempting text-based degradation.")
-        text_response = self.api_client.generate_content(prompt + "\n\nProvide the report in plain text.")
+        text_response = self.api_client.generate_content(
+            prompt + "\n\nProvide the report in plain text.", call_type="evaluation", deadline=deadline
+        )
         
         if text_response:
-            return self._graceful_degradation(text_response)
+            return dict(self._graceful_degradation(text_response), evidence=local_evidence)
             
-        return self._generate_fallback_report()
+        return dict(self._generate_fallback_report(), evidence=local_evidence)
 
     def _graceful_degradation(self, text: str) -> Dict[str, Any]:
         """Extracts scores from unstructured text if JSON parsing fails."""
@@ -50,8 +93,40 @@ class InterviewEvaluator:
                 
         return fallback
 
+    def _build_prompt(self, history: List[Dict], role: str, level: str, interview_plan: Optional[Dict]):
+        """Clipped excerpts plus the locally matched claim evidence replace the full transcript when that is smaller.
+
+        Short interviews keep the full transcript; the evidence rows still ground the report's quotes.
+        """
+        evidence_rows = build_evidence(history, interview_plan)
+        full_prompt = get_robust_evaluation_prompt(role, level, self._format_conversation(history), interview_plan)
+        if not evidence_rows:
+            return full_prompt, []
+        compact_prompt = get_robust_evaluation_prompt(
+            role, level, self._format_excerpts(history), interview_plan, format_evidence_table(evidence_rows)
+        )
+        return min(full_prompt, compact_prompt, key=lambda p: len(_TOKEN_PIECES.findall(p))), evidence_rows
+
     def _format_conversation(self, history: List[Dict]) -> str:
         return "\n".join([f"{msg['role'].upper()}: {msg['content']}" for msg in history])
+
+    def _format_excerpts(self, history: List[Dict]) -> str:
+        """Numbered Q/A pairs with clipped text; A# numbers match the evidence table."""
+        lines = []
+        answer_no = 0
+        for msg in history:
+            content = " ".join(msg["content"].split())
+            if msg["role"] == "user":
+                answer_no += 1
+                words = len(content.split())
+                lines.append(f"A{answer_no} ({words} words): {self._clip(content, ANSWER_EXCERPT_CHARS)}")
+            else:
+                lines.append(f"Q{answer_no + 1}: {self._clip(content, QUESTION_EXCERPT_CHARS)}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _clip(text: str, limit: int) -> str:
+        return text if len(text) <= limit else text[:limit - 3].rstrip() + "..."
     
     def _generate_fallback_report(self) -> Dict[str, Any]:
         return {
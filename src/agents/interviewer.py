@@ -1,15 +1,32 @@
 import os
 import logging
-from typing import List, Dict, Tuple, Optional
-from agents.role_configs import QUESTION_BANKS
+from typing import List, Dict, Tuple, Optional, Iterator
+from agents.role_configs import ROLE_CONFIGURATIONS
 from prompts.system_prompts import get_interviewer_prompt, get_reasoning_prompt
 from utils.persona_detector import PersonaDetector
 from utils.response_validator import ResponseValidator
-from utils.api_client import RobustAPIClient
+from utils.api_client import RobustAPIClient, deadline_passed, make_deadline, remaining_time
+from utils.schemas import ReasoningOutput
+from utils.resume_digest import build_resume_digest, format_digest
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+STATE_VERSION = 1
+
+VALID_STRATEGIES = {"DRILL_DOWN", "CLARIFY", "FOLLOW_UP", "MOVE_ON", "GUIDE"}
+VALID_PERSONAS = {"Professional", "Efficient", "Chatty", "Nervous", "Evasive"}
+# Below this self-reported confidence the fast-tier decision is re-run on the large model.
+REASONING_MIN_CONFIDENCE = 0.6
+
+# Upper bound for one turn (Brain + generation). Past it, the context-aware fallbacks answer instead.
+DEFAULT_TURN_BUDGET_SECONDS = 20.0
+# Share of the remaining turn budget the Brain may use, so generation still has time if reasoning stalls.
+REASONING_BUDGET_SHARE = 0.4
+
+# Strategy used when the local persona classifier is confident enough to skip the Brain entirely.
+LOCAL_STRATEGIES = {"Evasive": "DRILL_DOWN", "Chatty": "GUIDE"}
+
 class InterviewAgent:
     def __init__(self, role: str, experience_level: str, resume_text: str = "", interview_plan: Dict = None):
         self.role = role
@@ -19,6 +36,7 @@ class InterviewAgent:
         
         api_key = os.getenv("GROQ_API_KEY")
         self.api_client = RobustAPIClient(api_key)
+        self.turn_budget = float(os.getenv("INTERVIEW_TURN_BUDGET_SECONDS", DEFAULT_TURN_BUDGET_SECONDS))
         
         self.validator = ResponseValidator()
         self.persona_detector = PersonaDetector()
@@ -28,10 +46,73 @@ class InterviewAgent:
         self.topics_covered = set()
         self.last_brain_output = None
         self.focus_areas_covered = set()
+        self.asked_question_ids: List[str] = []
+        # (topic, question text, whether the text may be asked verbatim)
+        self._planned_question: Optional[Tuple[str, str, bool]] = None
         
         self.last_focus_topic = "your background"
         self.last_strategy = "OPENING"
+        self._resume_context: Optional[str] = None
         
+    def update_interview_plan(self, resume_text: str, interview_plan: Dict):
+        """Adopts a resume analysis that finished after the interview started."""
+        self.resume_text = resume_text or self.resume_text
+        self.interview_plan = interview_plan or {}
+        self._resume_context = None
+
+    @property
+    def resume_digest(self) -> Dict:
+        """Structured resume profile, digested once and kept in interview_plan["resume_digest"]."""
+        digest = self.interview_plan.get("resume_digest")
+        if not digest and self.resume_text:
+            digest = build_resume_digest(self.resume_text)
+            self.interview_plan["resume_digest"] = digest
+        return digest or {}
+
+    @property
+    def resume_context(self) -> str:
+        """The digest as the compact text block used in prompts."""
+        if self._resume_context is None:
+            self._resume_context = format_digest(self.resume_digest)
+        return self._resume_context
+
+    def to_state(self) -> Dict:
+        """Compact, JSON-safe snapshot of everything needed to resume this interview in another process."""
+        return {
+            "version": STATE_VERSION,
+            "role": self.role,
+            "experience_level": self.experience_level,
+            "resume_text": self.resume_text,
+            "interview_plan": self.interview_plan,
+            "conversation_history": self.conversation_history,
+            "question_count": self.question_count,
+            "topics_covered": sorted(self.topics_covered),
+            "focus_areas_covered": sorted(self.focus_areas_covered),
+            "asked_question_ids": self.asked_question_ids,
+            "last_brain_output": self.last_brain_output,
+            "last_focus_topic": self.last_focus_topic,
+            "last_strategy": self.last_strategy,
+            "persona": self.persona_detector.to_state()
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "InterviewAgent":
+        version = state.get("version")
+        if version != STATE_VERSION:
+            raise ValueError(f"Unsupported agent state version: {version}")
+
+        agent = cls(state["role"], state["experience_level"], state.get("resume_text", ""), state.get("interview_plan"))
+        agent.conversation_history = list(state.get("conversation_history", []))
+        agent.question_count = state.get("question_count", 0)
+        agent.topics_covered = set(state.get("topics_covered", []))
+        agent.focus_areas_covered = set(state.get("focus_areas_covered", []))
+        agent.asked_question_ids = list(state.get("asked_question_ids", []))
+        agent.last_brain_output = state.get("last_brain_output")
+        agent.last_focus_topic = state.get("last_focus_topic", agent.last_focus_topic)
+        agent.last_strategy = state.get("last_strategy", agent.last_strategy)
+        agent.persona_detector = PersonaDetector.from_state(state.get("persona", {}))
+        return agent
+
     def start_interview(self) -> str:
         focus_areas = self.interview_plan.get("focus_areas", [])
         
@@ -52,43 +133,137 @@ class InterviewAgent:
         self.conversation_history.append({"role": "assistant", "content": opening})
         return opening
     
-    def generate_next_question(self, user_response: str) -> Tuple[str, Optional[str]]:
+    def generate_next_question(self, user_response: str, deadline: Optional[float] = None,
+                               voice_stats: Optional[Dict] = None) -> Tuple[str, Optional[str]]:
+        """deadline (monotonic, see make_deadline) bounds the whole turn; defaults to the configured turn budget.
+
+        voice_stats (speaking rate, pauses) from a voice answer feed the local persona classifier.
+        """
+        deadline = deadline if deadline is not None else make_deadline(self.turn_budget)
+        error_msg = self._begin_turn(user_response, deadline, voice_stats)
+        if error_msg:
+            return error_msg, "validation_error"
+
+        next_question = self._generate_response_from_strategy(
+            self.last_strategy, 
+            self.last_focus_topic, 
+            self.last_brain_output,
+            deadline
+        )
+        
+        self._finish_turn(next_question)
+        return next_question, None
+
+    def stream_next_question(self, user_response: str, deadline: Optional[float] = None,
+                             voice_stats: Optional[Dict] = None) -> Iterator[str]:
+        """Streaming variant of generate_next_question: yields the reply in chunks as it is generated."""
+        deadline = deadline if deadline is not None else make_deadline(self.turn_budget)
+        error_msg = self._begin_turn(user_response, deadline, voice_stats)
+        if error_msg:
+            yield error_msg
+            return
+
+        prompt = self._build_response_prompt(self.last_strategy, self.last_focus_topic, self.last_brain_output)
+        chunks = []
+        for chunk in self.api_client.generate_content_stream(prompt, call_type="generation", deadline=deadline):
+            chunks.append(chunk)
+            yield chunk
+
+        next_question = "".join(chunks).strip()
+        if not next_question:
+            logger.warning("LLM Stream failed. Using Context-Aware Fallback.")
+            next_question = self._fallback_response(self.last_strategy, self.last_focus_topic)
+            yield next_question
+        elif deadline_passed(deadline):
+            # The stream was cut off at the turn deadline; the chunks already sent stay, and the
+            # fallback question finishes the turn.
+            logger.warning("LLM Stream cut off at the turn deadline. Appending Context-Aware Fallback.")
+            fallback = self._fallback_response(self.last_strategy, self.last_focus_topic)
+            yield f"\n\n{fallback}"
+            next_question = f"{next_question}\n\n{fallback}"
+
+        self._finish_turn(next_question)
+
+    def _begin_turn(self, user_response: str, deadline: Optional[float] = None,
+                    voice_stats: Optional[Dict] = None) -> Optional[str]:
+        """Validates and records the answer, then runs the Brain. Returns an error message for invalid input.
+
+        The local persona classifier runs first; obvious answers skip the Brain or keep it on the fast tier.
+        """
         is_valid, error_msg = self.validator.validate_user_response(user_response)
         if not is_valid:
-            return f"I didn't catch that. {error_msg}", "validation_error"
+            return f"I didn't catch that. {error_msg}"
         
         sanitized_response = self.validator.sanitize_response(user_response)
+        self._planned_question = None
         self.conversation_history.append({"role": "user", "content": sanitized_response})
 
-        brain_output = self._run_reasoning_step(sanitized_response)
+        local = self.persona_detector.observe(sanitized_response, voice_stats)
+        route = self.persona_detector.reasoning_route(local)
+        if route == "skip":
+            brain_output = self._local_brain_output(local)
+        else:
+            brain_output = self._run_reasoning_step(sanitized_response, deadline, escalate=route == "full")
         self.last_brain_output = brain_output
         
         self.last_strategy = brain_output.get("strategy", "MOVE_ON")
         self.last_focus_topic = brain_output.get("next_focus", self.last_focus_topic)
 
         self.persona_detector.update_from_llm_analysis(brain_output, sanitized_response)
+        return None
 
-        next_question = self._generate_response_from_strategy(
-            self.last_strategy, 
-            self.last_focus_topic, 
-            brain_output
-        )
-        
+    def _finish_turn(self, next_question: str):
         self.conversation_history.append({"role": "assistant", "content": next_question})
         self.question_count += 1
-        
-        return next_question, None
     
-    def _run_reasoning_step(self, last_response: str) -> Dict:
+    def _run_reasoning_step(self, last_response: str, deadline: Optional[float] = None, escalate: bool = True) -> Dict:
         history_text = self._format_conversation_limit(5)
-        prompt = get_reasoning_prompt(self.role, self.experience_level, history_text, last_response, self.resume_text)
-        result = self.api_client.generate_json_content(prompt)
+        prompt = get_reasoning_prompt(self.role, self.experience_level, history_text, last_response, self.resume_context)
+
+        remaining = remaining_time(deadline)
+        reasoning_deadline = None if remaining is None else min(deadline, make_deadline(remaining * REASONING_BUDGET_SHARE))
+        result = self.api_client.generate_json_content(
+            prompt, call_type="reasoning", validate=self._is_confident_reasoning,
+            schema=ReasoningOutput, deadline=reasoning_deadline, escalate=escalate
+        )
         return result or {"strategy": "MOVE_ON", "reasoning": "System Fallback", "detected_persona": "Neutral", "next_focus": "experience"}
 
-    def _generate_response_from_strategy(self, strategy: str, focus: str, analysis: Dict) -> str:
+    def _local_brain_output(self, local: Dict) -> Dict:
+        persona = local["persona"]
+        return {
+            "analysis": f"{persona} answer ({local['words']} words), classified locally.",
+            "detected_persona": persona,
+            "strategy": LOCAL_STRATEGIES[persona],
+            "reasoning": f"Local classifier is {local['confidence']:.0%} confident the answer is {persona.lower()}; "
+                         f"staying on {self.last_focus_topic}.",
+            "next_focus": self.last_focus_topic,
+            "confidence": local["confidence"],
+            "source": "local"
+        }
+
+    @staticmethod
+    def _is_confident_reasoning(result: Dict) -> bool:
+        if result.get("strategy") not in VALID_STRATEGIES or result.get("detected_persona") not in VALID_PERSONAS:
+            return False
+        try:
+            return float(result.get("confidence")) >= REASONING_MIN_CONFIDENCE
+        except (TypeError, ValueError):
+            return False
+
+    def _generate_response_from_strategy(self, strategy: str, focus: str, analysis: Dict, deadline: Optional[float] = None) -> str:
+        final_prompt = self._build_response_prompt(strategy, focus, analysis)
+        response = self.api_client.generate_content(final_prompt, call_type="generation", deadline=deadline)
+
+        if not response:
+            logger.warning("LLM Response failed. Using Context-Aware Fallback.")
+            return self._fallback_response(strategy, focus)
+                
+        return response
+
+    def _build_response_prompt(self, strategy: str, focus: str, analysis: Dict) -> str:
         focus_areas = self.interview_plan.get("focus_areas", [])
         
-        system_prompt = get_interviewer_prompt(self.role, self.experience_level, self.resume_text, focus_areas)
+        system_prompt = get_interviewer_prompt(self.role, self.experience_level, self.resume_context, focus_areas)
         history_text = self._format_conversation_limit(5)
         
         action_instruction = ""
@@ -99,24 +274,28 @@ class InterviewAgent:
             if next_strategic_topic:
                 action_instruction = f"Move on. The Architect flagged '{next_strategic_topic['topic']}' as a concern ({next_strategic_topic['reason']}). Probe this now."
             else:
-                topic = self._select_next_topic()
+                topic, question = self._select_next_question(focus)
                 action_instruction = f"Move on. Ask about {topic}."
+                if question:
+                    action_instruction += f' A strong question to adapt: "{question}"'
         else:
             action_instruction = f"Strategy: {strategy}. Focus: {focus}."
 
-        final_prompt = f"{system_prompt}\n\nHistory:\n{history_text}\n\nReasoning: {analysis.get('reasoning')}\nInstruction: {action_instruction}\nGenerate response:"
-        response = self.api_client.generate_content(final_prompt)
+        return f"{system_prompt}\n\nHistory:\n{history_text}\n\nReasoning: {analysis.get('reasoning')}\nInstruction: {action_instruction}\nGenerate response:"
 
-        if not response:
-            logger.warning("LLM Response failed. Using Context-Aware Fallback.")
-            if strategy == "DRILL_DOWN":
-                return f"Could you be more specific about {focus}? I'd like to hear a concrete example."
-            elif strategy == "CLARIFY":
-                return f"I'm not sure I understood that part about {focus}. Could you rephrase it?"
-            else:
-                return f"That's interesting. Let's shift gears. Tell me about your experience with {self._select_next_topic()}."
-                
-        return response
+    def _fallback_response(self, strategy: str, focus: str) -> str:
+        if strategy == "DRILL_DOWN":
+            return f"Could you be more specific about {focus}? I'd like to hear a concrete example."
+        elif strategy == "CLARIFY":
+            return f"I'm not sure I understood that part about {focus}. Could you rephrase it?"
+        else:
+            if self._planned_question is None:
+                self._select_next_question(focus)
+            topic, question, verbatim = self._planned_question or ("professional challenges", None, False)
+            # Template-generated bank questions are only seeds for the LLM; never ask them as-is.
+            if not verbatim:
+                question = None
+            return f"That's interesting. Let's shift gears. {question or f'Tell me about your experience with {topic}.'}"
 
     def _get_next_strategic_topic(self) -> Optional[Dict]:
         focus_areas = self.interview_plan.get("focus_areas", [])
@@ -126,14 +305,24 @@ class InterviewAgent:
                 return area
         return None
 
-    def _select_next_topic(self) -> str:
-        all_cats = QUESTION_BANKS.get(self.role, {}).keys()
-        remaining = [c for c in all_cats if c not in self.topics_covered and c != "opening"]
-        if remaining:
-            topic = remaining[0]
-            self.topics_covered.add(topic)
-            return topic
-        return "professional challenges"
+    def _select_next_question(self, focus: str = "") -> Tuple[str, Optional[str]]:
+        """Picks the best unasked bank question for the focus and resume from the next uncovered category."""
+        # Deferred: the bank pulls in NumPy and builds its index on first use.
+        from agents.question_bank import get_question_bank
+        categories = ROLE_CONFIGURATIONS.get(self.role, {}).get("categories", [])
+        remaining = [c for c in categories if c not in self.topics_covered]
+        # The focus is repeated so it outweighs any single resume skill in the query.
+        query = " ".join([focus, focus] + self.resume_digest.get("skills", []))
+        matches = get_question_bank().search(self.role, query, k=1, exclude=self.asked_question_ids,
+                                             categories=remaining[:1] or None)
+        if not matches:
+            return "professional challenges", None
+
+        match = matches[0]
+        self.topics_covered.add(match["category"])
+        self.asked_question_ids.append(match["id"])
+        self._planned_question = (match["topic"], match["text"], not match.get("generated", False))
+        return match["topic"], match["text"]
 
     def _format_conversation_limit(self, limit: int) -> str:
         msgs = self.conversation_history[-limit*2:] 
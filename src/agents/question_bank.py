@@ -0,0 +1,176 @@
+import os
+import re
+import json
+import math
+import hashlib
+import logging
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from agents.role_configs import QUESTION_BANKS, QUESTION_TEMPLATES, ROLE_CONFIGURATIONS, ROLE_TOPICS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_BANK_DIR = "data/question_bank"
+# Hand-written questions from QUESTION_BANKS win ties over template-generated ones.
+CURATED_PRIOR = 0.01
+# Score multiplier for questions sharing a template with one already asked, so phrasing varies.
+TEMPLATE_REPEAT_PENALTY = 0.5
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:[./-][a-z0-9+#]+)*")
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "did", "do", "does", "for", "from", "had", "has",
+    "have", "how", "i", "if", "in", "into", "is", "it", "its", "me", "my", "of", "on", "or", "so", "that",
+    "the", "their", "them", "then", "there", "this", "to", "was", "we", "were", "what", "when", "where",
+    "which", "who", "why", "with", "would", "you", "your", "about", "tell", "describe", "time"
+}
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in _STOPWORDS and len(t) > 1]
+
+class _RoleIndex:
+    """TF-IDF index over one role's questions, stored as per-term posting arrays."""
+
+    def __init__(self, entries: List[Dict]):
+        self.entries = entries
+        self.ids = [e["id"] for e in entries]
+        self.id_to_row = {qid: row for row, qid in enumerate(self.ids)}
+        categories = np.array([e["category"] for e in entries])
+        self.category_masks = {c: categories == c for c in set(categories.tolist())}
+        self.prior = np.array([CURATED_PRIOR if e.get("curated") else 0.0 for e in entries], dtype=np.float32)
+        self.templates = np.array([e.get("template", -1) for e in entries], dtype=np.int32)
+        self.n_templates = int(self.templates.max()) + 1 if entries else 0
+
+        doc_terms = [Counter(tokenize(f"{e['topic']} {e['text']}")) for e in entries]
+        doc_freq = Counter(term for terms in doc_terms for term in terms)
+        n_docs = len(entries)
+        self.idf = {term: math.log((1 + n_docs) / (1 + df)) + 1.0 for term, df in doc_freq.items()}
+
+        postings: Dict[str, List] = {}
+        for row, terms in enumerate(doc_terms):
+            weights = {t: (1 + math.log(c)) * self.idf[t] for t, c in terms.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for term, w in weights.items():
+                postings.setdefault(term, ([], []))
+                postings[term][0].append(row)
+                postings[term][1].append(w / norm)
+        self.postings = {
+            term: (np.array(rows, dtype=np.int32), np.array(ws, dtype=np.float32))
+            for term, (rows, ws) in postings.items()
+        }
+
+    def search(self, query: str, k: int, exclude: Iterable[str] = (), categories: Optional[Iterable[str]] = None) -> List[Dict]:
+        scores = self.prior.copy()
+        for term, count in Counter(tokenize(query)).items():
+            posting = self.postings.get(term)
+            if posting is not None:
+                rows, weights = posting
+                scores[rows] += weights * ((1 + math.log(count)) * self.idf[term])
+
+        if categories is not None:
+            allowed = np.zeros(len(scores), dtype=bool)
+            for category in categories:
+                mask = self.category_masks.get(category)
+                if mask is not None:
+                    allowed |= mask
+            scores[~allowed] = -np.inf
+        excluded = [self.id_to_row[qid] for qid in exclude if qid in self.id_to_row]
+        if excluded:
+            used = self.templates[excluded]
+            used = used[used >= 0]
+            if used.size:
+                used_lookup = np.zeros(self.n_templates + 1, dtype=bool)
+                used_lookup[used] = True
+                # Index -1 (no template) lands on the always-False padding slot.
+                scores[used_lookup[self.templates]] *= TEMPLATE_REPEAT_PENALTY
+            scores[excluded] = -np.inf
+
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [dict(self.entries[i], score=float(scores[i])) for i in top if np.isfinite(scores[i])]
+
+class QuestionBank:
+    """Per-role question corpus with fast local retrieval by focus area and resume profile.
+
+    The corpus is QUESTION_BANKS, the QUESTION_TEMPLATES x ROLE_TOPICS expansion, and any
+    *.jsonl files in the bank directory (one {"role", "category", "topic", "text"} object per line).
+    """
+
+    def __init__(self, bank_dir: Optional[str] = None):
+        self.bank_dir = Path(bank_dir or os.getenv("INTERVIEW_QUESTION_BANK_DIR", DEFAULT_BANK_DIR))
+        entries_by_role: Dict[str, List[Dict]] = {}
+        seen = set()
+        for entry in self._iter_entries():
+            if entry["id"] in seen:
+                continue
+            seen.add(entry["id"])
+            entries_by_role.setdefault(entry["role"], []).append(entry)
+        self._indexes = {role: _RoleIndex(entries) for role, entries in entries_by_role.items()}
+        logger.info(f"Question bank loaded: {', '.join(f'{r}={len(i.ids)}' for r, i in self._indexes.items())}")
+
+    def size(self, role: str) -> int:
+        index = self._indexes.get(role)
+        return len(index.ids) if index else 0
+
+    def search(self, role: str, query: str, k: int = 5, exclude: Iterable[str] = (),
+               categories: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Top-k questions for the role ranked by TF-IDF similarity to query, skipping excluded ids."""
+        index = self._indexes.get(role)
+        if index is None:
+            return []
+        return index.search(query, k, exclude, categories)
+
+    def _iter_entries(self) -> Iterable[Dict]:
+        for role, categories in QUESTION_BANKS.items():
+            for category, questions in categories.items():
+                if category == "opening":
+                    continue
+                for text in questions:
+                    yield self._entry(role, category, category.replace("_", " "), text, curated=True)
+
+        template_ids: Dict[str, int] = {}
+        for role, config in ROLE_CONFIGURATIONS.items():
+            for category in config["categories"]:
+                for template in QUESTION_TEMPLATES.get(category, []):
+                    template_id = template_ids.setdefault(template, len(template_ids))
+                    for topic in ROLE_TOPICS.get(role, []):
+                        yield self._entry(role, category, topic, template.format(topic=topic), template=template_id)
+
+        if self.bank_dir.is_dir():
+            for path in sorted(self.bank_dir.glob("*.jsonl")):
+                with open(path, "r", encoding="utf-8") as f:
+                    for line_no, line in enumerate(f, 1):
+                        try:
+                            raw = json.loads(line)
+                            yield self._entry(raw["role"], raw.get("category", "general"), raw.get("topic", ""),
+                                              raw["text"], qid=raw.get("id"), curated=raw.get("curated", False))
+                        except (ValueError, KeyError, TypeError):
+                            logger.warning(f"Skipping malformed question at {path.name}:{line_no}")
+
+    @staticmethod
+    def _entry(role: str, category: str, topic: str, text: str, qid: Optional[str] = None,
+               curated: bool = False, template: int = -1) -> Dict:
+        # Ids are content hashes so asked-question sets stay valid across workers and restarts.
+        qid = qid or hashlib.sha1(f"{role}|{text}".encode("utf-8")).hexdigest()[:12]
+        # Template expansions can read awkwardly for some topics; they only seed the generation prompt,
+        # while hand-written and JSONL questions may also be asked verbatim.
+        return {"id": qid, "role": role, "category": category, "topic": topic, "text": text,
+                "curated": curated, "template": template, "generated": template >= 0}
+
+_bank: Optional[QuestionBank] = None
+_bank_lock = threading.Lock()
+
+def get_question_bank() -> QuestionBank:
+    """Process-wide bank, built on first use."""
+    global _bank
+    if _bank is None:
+        with _bank_lock:
+            if _bank is None:
+                _bank = QuestionBank()
+    return _bank
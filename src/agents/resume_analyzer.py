@@ -1,26 +1,83 @@
 import os
-from typing import Dict, Any
+import logging
+from typing import Dict, Any, Optional
 from utils.api_client import RobustAPIClient
 from prompts.system_prompts import get_resume_analysis_prompt
+from utils.schemas import ResumePlan
+from utils.resume_digest import build_resume_digest
+from agents.role_configs import ROLE_CONFIGURATIONS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Estimated Jaccard similarity above which a resume re-uses a prior plan for the same role,
+# unless the role sets its own "duplicate_threshold".
+DEFAULT_DUPLICATE_THRESHOLD = 0.9
 
 class ResumeAnalyzer:
-    def __init__(self):
+    def __init__(self, resume_index=None, duplicate_thresholds: Optional[Dict[str, float]] = None):
         api_key = os.getenv("GROQ_API_KEY")
         self.api_client = RobustAPIClient(api_key)
+        self._resume_index = resume_index
+        self.duplicate_thresholds = {
+            role: config.get("duplicate_threshold", DEFAULT_DUPLICATE_THRESHOLD)
+            for role, config in ROLE_CONFIGURATIONS.items()
+        }
+        self.duplicate_thresholds.update(duplicate_thresholds or {})
+
+    @property
+    def resume_index(self):
+        # NumPy-backed; imported on first analysis so it stays off the worker import path.
+        if self._resume_index is None:
+            from utils.resume_index import ResumeIndex
+            self._resume_index = ResumeIndex()
+        return self._resume_index
 
     def analyze(self, role: str, resume_text: str) -> Dict[str, Any]:
         if not resume_text:
             return {}
-            
+
+        signature, duplicate = self._find_duplicate(role, resume_text)
+        if duplicate:
+            # A re-upload with small edits: keep the prior plan, refresh only the locally built parts.
+            logger.info(f"Resume matches indexed resume {duplicate['row']} ({duplicate['similarity']:.0%}); re-using its plan")
+            result = dict(duplicate["payload"]["plan"])
+            result["duplicate_of"] = {"resume_id": duplicate["row"], "similarity": duplicate["similarity"]}
+            result["resume_digest"] = build_resume_digest(resume_text)
+            return result
+
         prompt = get_resume_analysis_prompt(role, resume_text)
-        result = self.api_client.generate_json_content(prompt)
-        
-        if not result:
-            return {
+        result = self.api_client.generate_json_content(prompt, call_type="resume_analysis", schema=ResumePlan)
+
+        if result:
+            self._index_plan(role, signature, result)
+        else:
+            # Flagged so callers that persist plans (e.g. bulk screening) can retry instead of keeping it.
+            result = {
+                "analysis_failed": True,
                 "candidate_name": "Candidate",
                 "focus_areas": [
                     {"topic": "General Experience", "reason": "Resume analysis failed", "suggested_question": "Tell me about your background."}
                 ]
             }
-            
-        return result
\ No newline at end of file
+
+        # Prompts for every later turn use this digest instead of the raw resume text.
+        result["resume_digest"] = build_resume_digest(resume_text)
+        return result
+
+    def _find_duplicate(self, role: str, resume_text: str):
+        threshold = self.duplicate_thresholds.get(role, DEFAULT_DUPLICATE_THRESHOLD)
+        try:
+            return self.resume_index.find_duplicate(resume_text, role, threshold)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Near-duplicate lookup failed: {e}")
+            return None, None
+
+    def _index_plan(self, role: str, signature, plan: Dict[str, Any]):
+        # Only LLM plans are indexed; fallback plans should be retried on the next upload.
+        if signature is None:
+            return
+        try:
+            self.resume_index.add(role, signature, {"plan": plan})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not index resume plan: {e}")
@@ -2,17 +2,20 @@ ROLE_CONFIGURATIONS = {
     "Software Engineer": {
         "categories": ["technical", "behavioral", "problem_solving"],
         "competencies": ["coding", "system_design", "debugging", "collaboration"],
-        "duration": "30-45 minutes"
+        "duration": "30-45 minutes",
+        "duplicate_threshold": 0.9
     },
     "Sales Representative": {
         "categories": ["sales_methodology", "behavioral", "situational"],
         "competencies": ["persuasion", "objection_handling", "client_relationships", "closing"],
-        "duration": "30-40 minutes"
+        "duration": "30-40 minutes",
+        "duplicate_threshold": 0.85
     },
     "Retail Associate": {
         "categories": ["customer_service", "behavioral", "situational"],
         "competencies": ["customer_interaction", "conflict_resolution", "product_knowledge", "teamwork"],
-        "duration": "20-30 minutes"
+        "duration": "20-30 minutes",
+        "duplicate_threshold": 0.85
     }
 }
 
@@ -86,4 +89,163 @@ EVALUATION_RUBRICS = {
         "teamwork": 0.20,
         "cultural_fit": 0.20
     }
-}
\ No newline at end of file
+}
+# Templates and topics expanded into the full question corpus (see agents/question_bank.py).
+# Every template takes a noun-phrase {topic}; each role crosses its categories' templates with its topics.
+QUESTION_TEMPLATES = {
+    "technical": [
+        "Walk me through the hardest problem you've solved involving {topic}.",
+        "How would you explain the trade-offs of {topic} to a new engineer on your team?",
+        "Describe a production incident related to {topic}. How did you find the root cause?",
+        "What are the most common mistakes teams make with {topic}, and how do you avoid them?",
+        "How do you test and monitor code that depends on {topic}?",
+        "Tell me about a design decision you made around {topic} that you would change today.",
+        "How would you evaluate whether {topic} is the right choice for a new project?",
+        "What metrics would you watch to know that {topic} is working well in production?",
+        "Describe how {topic} behaves under heavy load and how you would scale it.",
+        "What did you learn the hard way about {topic}?",
+        "How have you improved the performance of a system built on {topic}?",
+        "How do you keep your knowledge of {topic} current?"
+    ],
+    "problem_solving": [
+        "If a service using {topic} suddenly became slow, how would you investigate?",
+        "How would you break down a vague requirement that touches {topic}?",
+        "Describe a time you had to choose between two approaches to {topic}. How did you decide?",
+        "How would you design a small system whose core is {topic}?",
+        "Tell me about a bug involving {topic} that took a long time to find.",
+        "What questions would you ask before committing to a deadline for work on {topic}?",
+        "How would you estimate the effort of migrating an existing system to {topic}?",
+        "Walk me through how you would prototype a solution using {topic} in a week.",
+        "How would you reduce the cost of running {topic} without hurting reliability?",
+        "What would you do if you inherited a poorly documented codebase built around {topic}?",
+        "How do you validate that a fix involving {topic} actually solved the problem?",
+        "Describe how you would handle a data-loss risk related to {topic}."
+    ],
+    "behavioral": [
+        "Tell me about a time you disagreed with a colleague about {topic}. How was it resolved?",
+        "Describe a situation where you had to learn {topic} quickly under pressure.",
+        "Tell me about a time you made a mistake with {topic}. What did you do next?",
+        "How have you helped a teammate who was struggling with {topic}?",
+        "Describe a time you received critical feedback about your work on {topic}.",
+        "Tell me about a goal related to {topic} that you did not meet. What did you learn?",
+        "Describe a time you took ownership of {topic} when nobody else would.",
+        "How do you prioritize when several urgent requests about {topic} arrive at once?",
+        "Tell me about a time you had to persuade your manager about {topic}.",
+        "Describe the accomplishment related to {topic} that you are most proud of.",
+        "Tell me about a time {topic} forced you to adapt to a sudden change.",
+        "How do you stay motivated when work on {topic} becomes repetitive?"
+    ],
+    "sales_methodology": [
+        "Walk me through how you approach {topic} from first contact to close.",
+        "What is your process for qualifying opportunities when it comes to {topic}?",
+        "How do you measure your own effectiveness at {topic}?",
+        "Describe the best deal you won where {topic} made the difference.",
+        "How do you tailor {topic} to different buyer personas?",
+        "What are the warning signs that {topic} is going badly in a deal?",
+        "How do you use your CRM to manage {topic}?",
+        "What has changed in how you handle {topic} over the last few years?",
+        "How would you coach a new rep who struggles with {topic}?",
+        "How do you forecast accurately when {topic} is a large part of your pipeline?",
+        "What questions do you ask a prospect to uncover needs around {topic}?",
+        "Describe how you recovered a stalled deal through better {topic}."
+    ],
+    "situational": [
+        "Imagine a situation involving {topic} goes wrong on your busiest day. What do you do?",
+        "How would you handle a customer who is unhappy about {topic}?",
+        "What would you do if your manager asked you to take on {topic} with no training?",
+        "How would you respond if a coworker handled {topic} in a way that broke policy?",
+        "If you had to improve {topic} in your first month, where would you start?",
+        "How would you handle conflicting instructions about {topic} from two supervisors?",
+        "What would you do if you noticed a recurring problem with {topic} that nobody had reported?",
+        "How would you manage your time if {topic} suddenly doubled your workload?",
+        "If a customer asked about {topic} and you did not know the answer, what would you do?",
+        "How would you handle a situation where {topic} put you behind on your targets?",
+        "What would you do if a mistake with {topic} affected a colleague's results?",
+        "How would you explain a change in {topic} to a frustrated customer?"
+    ],
+    "customer_service": [
+        "How do you handle {topic} when the store is busy?",
+        "Describe a time you turned a bad experience with {topic} into a positive one.",
+        "What does excellent service look like when it comes to {topic}?",
+        "How would you handle a customer who is upset about {topic}?",
+        "Tell me about a time you went above and beyond with {topic}.",
+        "How do you stay patient when {topic} keeps causing complaints?",
+        "How would you train a new teammate to handle {topic}?",
+        "What would you do if store policy on {topic} frustrated a loyal customer?",
+        "How do you make sure {topic} is handled consistently across shifts?",
+        "Describe how you would balance speed and friendliness during {topic}.",
+        "What information do you need from a customer to resolve {topic}?",
+        "How do you follow up after resolving a problem with {topic}?"
+    ]
+}
+
+ROLE_TOPICS = {
+    "Software Engineer": [
+        "REST API design", "GraphQL", "microservices", "monolith decomposition", "database indexing",
+        "SQL query optimization", "schema migrations", "PostgreSQL", "MySQL", "MongoDB", "Redis caching",
+        "cache invalidation", "message queues", "Kafka", "event-driven architecture", "idempotency",
+        "distributed transactions", "consensus and leader election", "rate limiting", "load balancing",
+        "horizontal scaling", "sharding", "replication", "consistency models", "concurrency and threading",
+        "async I/O", "memory leaks", "garbage collection tuning", "profiling", "latency optimization",
+        "observability", "logging", "distributed tracing", "alerting", "incident response", "on-call",
+        "CI/CD pipelines", "automated testing", "unit testing", "integration testing", "code review",
+        "feature flags", "blue-green deployments", "Docker", "Kubernetes", "infrastructure as code",
+        "Terraform", "AWS", "GCP", "Azure", "serverless functions", "authentication and OAuth",
+        "API security", "secrets management", "encryption", "data pipelines", "Spark", "Airflow",
+        "batch processing", "stream processing", "search indexing", "Elasticsearch", "machine learning models in production",
+        "recommendation systems", "frontend performance", "React", "state management", "mobile backends",
+        "API versioning", "backward compatibility", "technical debt", "refactoring legacy code",
+        "design patterns", "object-oriented design", "functional programming", "Python", "Java", "Go",
+        "TypeScript", "Rust", "C++", "algorithms and data structures", "system design", "capacity planning",
+        "cost optimization in the cloud", "disaster recovery", "backups", "high availability",
+        "networking and DNS", "TCP and HTTP", "WebSockets", "gRPC", "data modeling", "privacy and GDPR",
+        "accessibility", "documentation", "mentoring junior engineers", "cross-team collaboration",
+        "estimating engineering work", "open-source contributions"
+    ],
+    "Sales Representative": [
+        "cold calling", "cold email outreach", "social selling", "prospecting", "lead qualification",
+        "discovery calls", "needs analysis", "product demos", "value propositions", "pricing conversations",
+        "discount negotiation", "objection handling", "competitive displacement", "closing techniques",
+        "contract negotiation", "procurement processes", "multi-threading deals", "executive sponsors",
+        "champion building", "stakeholder mapping", "pipeline management", "sales forecasting",
+        "quota attainment", "territory planning", "account planning", "upselling", "cross-selling",
+        "renewals", "churn prevention", "customer onboarding handoffs", "referrals", "networking events",
+        "trade shows", "inbound leads", "outbound sequences", "CRM hygiene", "Salesforce", "HubSpot",
+        "sales enablement content", "ROI business cases", "enterprise deals", "SMB sales", "mid-market accounts",
+        "channel partners", "reseller relationships", "long sales cycles", "transactional sales",
+        "consultative selling", "solution selling", "SPIN selling", "MEDDIC qualification", "Challenger selling",
+        "storytelling in sales", "follow-up cadence", "time management", "rejection", "lost deals",
+        "win-loss analysis", "customer success collaboration", "marketing alignment", "product feedback loops",
+        "sales coaching", "team selling", "presentations to executives", "RFP responses", "security reviews",
+        "legal redlines", "payment terms", "budget objections", "timing objections", "incumbent vendors",
+        "relationship building", "trust with new buyers", "virtual selling", "video calls", "LinkedIn outreach",
+        "sales metrics", "activity goals", "commission plans", "ethics in sales", "overpromising",
+        "handling price increases", "expansion revenue", "customer references", "case studies",
+        "new market entry", "product launches", "seasonal demand", "key account management",
+        "government sales", "healthcare buyers", "technical buyers", "financial buyers", "end-user adoption",
+        "deal reviews", "sales playbooks"
+    ],
+    "Retail Associate": [
+        "returns and exchanges", "price checks", "checkout lines", "the point of sale system", "cash handling",
+        "gift cards", "loyalty programs", "store credit cards", "product recommendations", "upselling accessories",
+        "out-of-stock items", "special orders", "online order pickup", "curbside pickup", "inventory counts",
+        "receiving shipments", "restocking shelves", "visual merchandising", "planograms", "price tags and signage",
+        "seasonal displays", "holiday rushes", "Black Friday crowds", "store opening", "store closing",
+        "fitting rooms", "loss prevention", "shoplifting", "safety hazards", "spills and cleanliness",
+        "damaged merchandise", "product recalls", "warranty questions", "customer complaints", "angry customers",
+        "elderly customers", "customers with disabilities", "language barriers", "children in the store",
+        "phone inquiries", "long queues", "multiple customers at once", "coupon disputes", "price matching",
+        "receipt problems", "payment declines", "self-checkout issues", "shift handovers", "schedule changes",
+        "covering for absent coworkers", "training new hires", "teamwork on the floor", "manager instructions",
+        "store policies", "dress code", "punctuality", "breaks during busy periods", "slow periods",
+        "product knowledge", "new product launches", "promotions and sales events", "clearance items",
+        "stockroom organization", "backroom safety", "lifting heavy items", "ladder safety", "delivery scheduling",
+        "customer surveys", "mystery shoppers", "sales targets", "add-on sales", "membership signups",
+        "social media questions", "online reviews", "competitor prices", "local community events",
+        "accessibility requests", "lost items", "store emergencies", "fire drills", "power outages",
+        "register shortages", "counterfeit bills", "age-restricted products", "holiday returns",
+        "gift wrapping", "layaway", "bulk orders", "business customers", "repeat customers",
+        "customer names and preferences", "store layout questions", "product demonstrations",
+        "handling feedback from managers", "conflicts with coworkers", "time off requests"
+    ]
+}
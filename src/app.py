@@ -1,119 +1,171 @@
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
 import os
 import logging
-import plotly.graph_objects as go
+import hashlib
+import json
+from typing import Dict, List, Tuple
 
 sys.path.append(str(Path(__file__).parent))
 
-from agents.interviewer import InterviewAgent
-from agents.evaluator import InterviewEvaluator
-from agents.resume_analyzer import ResumeAnalyzer
-from utils.conversation_manager import ConversationManager
-from utils.resume_parser import ResumeParser
+from service.session_manager import InterviewSessionManager
 from utils.audio_manager import AudioManager
+from utils.report_export import ordinal, render_report_html
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
 
 st.set_page_config(page_title="AI Interview Partner", layout="wide")
 
-if "conversation_manager" not in st.session_state:
-    st.session_state.conversation_manager = ConversationManager()
-    st.session_state.interviewer = None
-    st.session_state.evaluator = InterviewEvaluator()
-    st.session_state.resume_analyzer = ResumeAnalyzer()
-    st.session_state.audio_manager = AudioManager()
+# Most recent messages rendered as chat bubbles; older ones collapse into one cached transcript block.
+CHAT_WINDOW = 10
+# Browser-reachable base URL of src/server.py; when set, questions are streamed from its speech endpoint.
+SPEECH_API_URL = os.getenv("INTERVIEW_SPEECH_API_URL", "").rstrip("/")
+
+@st.cache_resource
+def get_session_manager() -> InterviewSessionManager:
+    # Shared by every browser session in this process; each one only keeps its session_id.
+    return InterviewSessionManager()
+
+manager = get_session_manager()
+
+@st.cache_resource
+def get_audio_manager() -> AudioManager:
+    # Built on the first voice interaction only; AudioManager itself defers the audio imports.
+    return AudioManager()
+
+def queue_speech(text: str, from_session: bool = True):
+    """Stores the audio for the next render: a streaming URL for the session's latest question when the
+    API server is available, otherwise the synthesized clip."""
+    if SPEECH_API_URL and from_session:
+        url = f"{SPEECH_API_URL}/interviews/{st.session_state.session_id}/speech?turn={st.session_state.message_count}"
+        st.session_state.latest_audio_response = (url, "audio/mpeg")
+        return
+    audio_manager = get_audio_manager()
+    audio, mime = audio_manager.text_to_speech_with_mime(text)
+    st.session_state.latest_audio_response = (audio, mime) if audio else None
+
+@st.fragment(run_every=1)
+def resume_job_progress(job_id: str):
+    # Polls without rerunning the page; one full rerun once the analysis lands.
+    try:
+        job = manager.get_resume_job(job_id)
+    except KeyError:
+        # Evicted, or this worker never ran it; the full rerun drops the job from state.
+        st.rerun()
+    if job.finished:
+        st.rerun()
+    st.progress(job.progress, text=f"Resume: {job.status}...")
+
+if "session_id" not in st.session_state:
+    st.session_state.session_id = None
     st.session_state.interview_started = False
     st.session_state.interview_ended = False
     st.session_state.evaluation_report = None
     st.session_state.resume_text = ""
     st.session_state.interview_plan = None
+    st.session_state.resume_job_id = None
+    st.session_state.resume_upload_id = None
     st.session_state.interaction_mode = "Chat"
     
     st.session_state.audio_key = 0 
     st.session_state.latest_audio_response = None
+    st.session_state.message_count = 0
+    st.session_state.latest_thoughts = {}
 
-st.title("AI Interview Practice Partner")
-st.caption("Agentic Interview Simulation with Strategic Planning")
+    # Reattach to a stored session after a reconnect or a worker restart.
+    resumed_id = st.query_params.get("session")
+    if resumed_id:
+        try:
+            resumed = manager.get_session(resumed_id)
+            st.session_state.session_id = resumed_id
+            st.session_state.interview_started = True
+            st.session_state.interview_ended = resumed.ended
+            st.session_state.evaluation_report = resumed.evaluation_report
+            st.session_state.resume_text = resumed.agent.resume_text
+            st.session_state.interview_plan = resumed.agent.interview_plan or None
+            st.session_state.message_count = len(resumed.agent.conversation_history)
+            st.session_state.latest_thoughts = resumed.agent.get_latest_thought_process()
+        except (KeyError, ValueError):
+            del st.query_params["session"]
 
-with st.sidebar:
-    st.header("Setup")
-    role = st.selectbox("Target Role", ["Software Engineer", "Sales Representative", "Retail Associate"])
-    level = st.selectbox("Level", ["Entry", "Mid", "Senior"])
-    
-    st.session_state.interaction_mode = st.radio("Interaction Mode", ["Chat", "Voice"], horizontal=True)
-    
-    st.divider()
-    
-    uploaded_resume = st.file_uploader("Upload Resume (PDF)", type="pdf")
-    if uploaded_resume and not st.session_state.resume_text:
-        with st.spinner("Reading & Analyzing Resume..."):
-            text = ResumeParser.extract_text(uploaded_resume)
-            if text:
-                st.session_state.resume_text = text
-                plan = st.session_state.resume_analyzer.analyze(role, text)
-                st.session_state.interview_plan = plan
-                st.success("Resume Analyzed!")
-    
-    if st.session_state.interview_plan:
-        with st.expander("📋 Interview Strategy", expanded=True):
-            st.caption(f"Candidate: {st.session_state.interview_plan.get('candidate_name', 'Unknown')}")
-            st.markdown("**Focus Areas Detected:**")
-            for area in st.session_state.interview_plan.get('focus_areas', []):
-                st.warning(f"🎯 {area['topic']}")
-                st.caption(f"Reason: {area['reason']}")
+@st.cache_data(max_entries=64, show_spinner=False)
+def load_history(session_id: str, message_count: int) -> List[Dict]:
+    # Keyed by message count: reruns that add no message never touch the session store.
+    return manager.get_history(session_id)
 
-    st.divider()
-    
-    if not st.session_state.interview_started:
-        if st.button("Start Interview", type="primary", use_container_width=True):
-            try:
-                st.session_state.interviewer = InterviewAgent(
-                    role, level, st.session_state.resume_text, st.session_state.interview_plan
-                )
-                st.session_state.conversation_manager.initialize_conversation(role, level)
-                opening = st.session_state.interviewer.start_interview()
-                st.session_state.conversation_manager.add_message("assistant", opening)
-                st.session_state.interview_started = True
-                st.session_state.interview_ended = False
-                st.session_state.evaluation_report = None
+@st.cache_data(max_entries=64, show_spinner=False)
+def render_transcript(session_id: str, message_count: int, _messages: List[Dict]) -> str:
+    # _messages is excluded from the cache key; (session_id, message_count) identifies it.
+    return "\n\n".join(
+        f"{'🤖' if m['role'] == 'assistant' else '👤'} {m['content']}" for m in _messages
+    )
 
-                if st.session_state.interaction_mode == "Voice":
-                     audio_response = st.session_state.audio_manager.text_to_speech(opening)
-                     st.session_state.latest_audio_response = audio_response
-                
-                st.rerun()
-            except Exception as e:
-                st.error(f"Error: {e}")
+@st.cache_data(max_entries=64, show_spinner=False)
+def export_report_html(session_id: str, report_hash: str, _report: Dict) -> str:
+    # _report is excluded from the cache key; report_hash identifies it.
+    session = manager.get_session(session_id)
+    return render_report_html(_report, session.role, session.level)
 
-    if st.session_state.interview_started and not st.session_state.interview_ended:
-        if st.session_state.interviewer:
-            thoughts = st.session_state.interviewer.get_latest_thought_process()
-            if thoughts:
-                with st.expander("🧠 AI Thought Process", expanded=True):
-                    st.info(f"**Strategy:** {thoughts.get('strategy', 'N/A')}")
-                    st.markdown(f"*{thoughts.get('reasoning', 'Thinking...')}*")
+@st.cache_resource(max_entries=64, show_spinner=False)
+def build_radar_figure(report_hash: str, scores: Tuple[Tuple[str, int], ...]):
+    import plotly.graph_objects as go
 
-        if st.button("End Interview", use_container_width=True):
-            st.session_state.interview_ended = True
-            st.rerun()
+    fig = go.Figure(data=go.Scatterpolar(
+        r=[value for _, value in scores],
+        theta=[c.replace('_', ' ').title() for c, _ in scores],
+        fill='toself',
+        name='Candidate Profile'
+    ))
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        showlegend=False,
+        margin=dict(l=40, r=40, t=40, b=40)
+    )
+    return fig
 
-if st.session_state.interview_started and not st.session_state.interview_ended:
-    for msg in st.session_state.interviewer.conversation_history:
+def rerun_fragment():
+    """Fragment-scoped rerun when the fragment is rerunning on its own, full rerun otherwise."""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+@st.fragment
+def chat_pane():
+    """Reruns on its own for chat and audio input; render cost is bounded by CHAT_WINDOW, not interview length."""
+    session_id = st.session_state.session_id
+    history = load_history(session_id, st.session_state.message_count)
+
+    earlier, recent = history[:-CHAT_WINDOW], history[-CHAT_WINDOW:]
+    if earlier:
+        with st.expander(f"Earlier conversation ({len(earlier)} messages)"):
+            st.markdown(render_transcript(session_id, len(earlier), earlier))
+
+    for msg in recent:
         avatar = "🤖" if msg["role"] == "assistant" else "👤"
         with st.chat_message(msg["role"], avatar=avatar):
             st.write(msg["content"])
+
+    thoughts = st.session_state.latest_thoughts
+    if thoughts:
+        with st.expander("🧠 AI Thought Process", expanded=True):
+            st.info(f"**Strategy:** {thoughts.get('strategy', 'N/A')}")
+            st.markdown(f"*{thoughts.get('reasoning', 'Thinking...')}*")
+            if thoughts.get("source") == "local":
+                st.caption("Decided by the local persona classifier; the reasoning call was skipped.")
             
     user_input = None
+    voice_stats = None
     
     if st.session_state.interaction_mode == "Voice":
         audio_bytes = st.audio_input("Speak your answer...", key=f"audio_in_{st.session_state.audio_key}")
         if audio_bytes:
             with st.spinner("Transcribing..."):
-                text = st.session_state.audio_manager.speech_to_text(audio_bytes)
+                text, voice_stats = get_audio_manager().speech_to_text_with_stats(audio_bytes)
                 if text:
                     user_input = text
                 else:
@@ -126,56 +178,54 @@ if st.session_state.interview_started and not st.session_state.interview_ended:
             st.write(user_input)
         
         with st.spinner("Thinking..."):
-            response, _ = st.session_state.interviewer.generate_next_question(user_input)
+            result = manager.submit_answer(session_id, user_input, voice_stats)
+            response = result["response"]
+            st.session_state.latest_thoughts = result["thought_process"]
+            if result["error"]:
+                st.warning(response)
+            else:
+                st.session_state.message_count = result["message_count"]
             
             if st.session_state.interaction_mode == "Voice":
-                audio_response = st.session_state.audio_manager.text_to_speech(response)
-                if audio_response:
-                    st.session_state.latest_audio_response = audio_response
+                queue_speech(response, from_session=not result["error"])
+                if st.session_state.latest_audio_response:
                     st.session_state.audio_key += 1
             
-            st.rerun()
+            if not result["error"]:
+                rerun_fragment()
             
     if st.session_state.latest_audio_response:
-        st.audio(st.session_state.latest_audio_response, format="audio/mp3", autoplay=True)
+        audio_source, audio_format = st.session_state.latest_audio_response
+        st.audio(audio_source, format=audio_format, autoplay=True)
         st.session_state.latest_audio_response = None # Clear immediately so it plays only once
 
-elif st.session_state.interview_ended:
-    st.header("🏁 Interview Performance Report")
-    
-    if not st.session_state.evaluation_report:
-        with st.spinner("Compiling Comprehensive Analytics..."):
-            st.session_state.evaluation_report = st.session_state.evaluator.generate_comprehensive_report(
-                st.session_state.interviewer.conversation_history, role, level, st.session_state.interview_plan
-            )
-    
+@st.fragment
+def report_view():
     report = st.session_state.evaluation_report
+    report_hash = hashlib.sha1(json.dumps(report, sort_keys=True).encode()).hexdigest()
     scores = report.get('scores', {})
     
     col1, col2, col3 = st.columns(3)
     col1.metric("Decision", report.get('hiring_decision', 'N/A'))
     col2.metric("Technical Score", f"{scores.get('technical_depth', 0)}/100")
     col3.metric("Communication", f"{scores.get('communication_clarity', 0)}/100")
+
+    cohort = report.get('cohort')
+    if cohort:
+        percentiles = cohort['percentiles']
+        group = f"{cohort['role']} ({cohort['level']})" if cohort.get('level') else cohort['role']
+        st.caption(
+            f"Cohort: {ordinal(percentiles['overall'])} percentile overall among {cohort['size']} {group} interviews · "
+            f"Technical {ordinal(percentiles['technical_depth'])} · "
+            f"Communication {ordinal(percentiles['communication_clarity'])}"
+        )
     
     st.divider()
     
     chart_col, text_col = st.columns([1, 1])
     
     with chart_col:
-        categories = list(scores.keys())
-        values = list(scores.values())
-        
-        fig = go.Figure(data=go.Scatterpolar(
-            r=values,
-            theta=[c.replace('_', ' ').title() for c in categories],
-            fill='toself',
-            name='Candidate Profile'
-        ))
-        fig.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-            showlegend=False,
-            margin=dict(l=40, r=40, t=40, b=40)
-        )
+        fig = build_radar_figure(report_hash, tuple(scores.items()))
         st.plotly_chart(fig, use_container_width=True)
     
     with text_col:
@@ -197,9 +247,109 @@ elif st.session_state.interview_ended:
     else:
         st.caption("No specific claims verified.")
         
+    st.download_button(
+        "Download Report (HTML)", export_report_html(st.session_state.session_id, report_hash, report),
+        file_name=f"interview_report_{report_hash[:8]}.html", mime="text/html"
+    )
+
     if st.button("Start New Session"):
+        manager.close_session(st.session_state.session_id)
         st.session_state.clear()
+        st.query_params.clear()
         st.rerun()
 
+st.title("AI Interview Practice Partner")
+st.caption("Agentic Interview Simulation with Strategic Planning")
+
+with st.sidebar:
+    st.header("Setup")
+    role = st.selectbox("Target Role", ["Software Engineer", "Sales Representative", "Retail Associate"])
+    level = st.selectbox("Level", ["Entry", "Mid", "Senior"])
+    
+    st.session_state.interaction_mode = st.radio("Interaction Mode", ["Chat", "Voice"], horizontal=True)
+    
+    st.divider()
+    
+    uploaded_resume = st.file_uploader("Upload Resume (PDF)", type="pdf")
+    if uploaded_resume and uploaded_resume.file_id != st.session_state.resume_upload_id:
+        st.session_state.resume_upload_id = uploaded_resume.file_id
+        st.session_state.resume_job_id = manager.submit_resume(uploaded_resume.getvalue(), role)
+        st.session_state.resume_text = ""
+        st.session_state.interview_plan = None
+
+    if st.session_state.resume_job_id:
+        try:
+            job = manager.get_resume_job(st.session_state.resume_job_id)
+        except KeyError:
+            # Jobs live in one process and are evicted over time; keep any plan already received.
+            job = None
+            st.session_state.resume_job_id = None
+            if not st.session_state.interview_plan:
+                # Forget the upload so the same file, if still selected or uploaded again, starts a new job.
+                st.session_state.resume_upload_id = None
+                st.warning("The resume analysis is no longer available. Please upload the resume again.")
+
+        if job and job.role != role and not st.session_state.interview_started:
+            manager.reanalyze_resume(job.job_id, role)
+            st.session_state.interview_plan = None
+
+        if job and not job.finished:
+            resume_job_progress(job.job_id)
+        elif job and job.status == "failed":
+            st.error(f"Resume analysis failed: {job.error}")
+        elif job and st.session_state.interview_plan != job.interview_plan:
+            st.session_state.resume_text = job.resume_text
+            st.session_state.interview_plan = job.interview_plan
+            st.success("Resume Analyzed!")
+    
+    if st.session_state.interview_plan:
+        with st.expander("📋 Interview Strategy", expanded=True):
+            st.caption(f"Candidate: {st.session_state.interview_plan.get('candidate_name', 'Unknown')}")
+            st.markdown("**Focus Areas Detected:**")
+            for area in st.session_state.interview_plan.get('focus_areas', []):
+                st.warning(f"🎯 {area['topic']}")
+                st.caption(f"Reason: {area['reason']}")
+
+    st.divider()
+    
+    if not st.session_state.interview_started:
+        if st.button("Start Interview", type="primary", use_container_width=True):
+            try:
+                started = manager.create_session(
+                    role, level, st.session_state.resume_text, st.session_state.interview_plan,
+                    resume_job_id=st.session_state.resume_job_id
+                )
+                st.session_state.session_id = started["session_id"]
+                st.query_params["session"] = started["session_id"]
+                opening = started["opening"]
+                st.session_state.message_count = 1
+                st.session_state.interview_started = True
+                st.session_state.interview_ended = False
+                st.session_state.evaluation_report = None
+
+                if st.session_state.interaction_mode == "Voice":
+                     queue_speech(opening)
+                
+                st.rerun()
+            except Exception as e:
+                st.error(f"Error: {e}")
+
+    if st.session_state.interview_started and not st.session_state.interview_ended:
+        if st.button("End Interview", use_container_width=True):
+            st.session_state.interview_ended = True
+            st.rerun()
+
+if st.session_state.interview_started and not st.session_state.interview_ended:
+    chat_pane()
+
+elif st.session_state.interview_ended:
+    st.header("🏁 Interview Performance Report")
+    
+    if not st.session_state.evaluation_report:
+        with st.spinner("Compiling Comprehensive Analytics..."):
+            st.session_state.evaluation_report = manager.end_session(st.session_state.session_id)
+
+    report_view()
+
 elif not st.session_state.interview_started:
     st.info("👈 Upload a resume to see the Strategic Planning Agent in action.")
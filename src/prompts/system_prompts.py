@@ -30,7 +30,7 @@ def get_interviewer_prompt(role, experience_level, resume_context=None, focus_ar
     Your goal is to assess the candidate thoroughly."""
 
     if resume_context:
-        base_prompt += f"\n\nRESUME CONTEXT:\n{resume_context}"
+        base_prompt += f"\n\nRESUME PROFILE:\n{resume_context}"
     
     if focus_areas:
         focus_str = "\n".join([f"- {f['topic']}: {f['reason']}" for f in focus_areas])
@@ -46,12 +46,12 @@ def get_interviewer_prompt(role, experience_level, resume_context=None, focus_ar
     """
     return base_prompt
 
-def get_reasoning_prompt(role, experience_level, conversation_history, last_response, resume_text=None):
-    resume_snippet = resume_text[:1000] if resume_text else "No resume."
+def get_reasoning_prompt(role, experience_level, conversation_history, last_response, resume_context=None):
     return f"""You are the 'Brain' of the interviewer. Decide the next move.
 
     Role: {role} | Level: {experience_level}
-    Resume Context: {resume_snippet}
+    Resume Profile:
+    {resume_context or "No resume."}
 
     Conversation History:
     {conversation_history}
@@ -64,21 +64,34 @@ def get_reasoning_prompt(role, experience_level, conversation_history, last_resp
         "detected_persona": "One of [Professional, Efficient, Chatty, Nervous, Evasive]",
         "strategy": "One of [DRILL_DOWN, CLARIFY, FOLLOW_UP, MOVE_ON, GUIDE]",
         "reasoning": "Internal monologue justifying the strategy",
-        "next_focus": "Specific topic to address next"
+        "next_focus": "Specific topic to address next",
+        "confidence": "Float 0.0-1.0: how sure you are of the persona and strategy"
     }}
     """
 
-def get_robust_evaluation_prompt(role, experience_level, conversation_text, interview_plan):
+# Part of every stored report's artifact key: bump it whenever the evaluation prompt or its inputs change.
+EVALUATION_PROMPT_VERSION = 1
+
+def get_robust_evaluation_prompt(role, experience_level, conversation_text, interview_plan, evidence_table=None):
     plan_context = ""
     if interview_plan:
-        plan_context = f"Original Strategic Focus Areas: {interview_plan.get('focus_areas', [])}"
+        plan_context = f"Original Strategic Focus Areas: {[area.get('topic') for area in interview_plan.get('focus_areas', [])]}"
+
+    evidence_context = ""
+    if evidence_table:
+        evidence_context = f"""Claim Evidence (matched locally; quotes are verbatim from the candidate, A# = answer number):
+    {evidence_table}
+
+    For "evidence", give one item per claim above. Copy the quote from the table (or from the excerpts), or use 'Not found'."""
 
     return f"""You are a Lead Bar Raiser evaluating a {role} candidate ({experience_level}).
     
-    Conversation Transcript:
+    {"Transcript Excerpts (long answers clipped)" if evidence_table else "Conversation Transcript"}:
     {conversation_text}
     
     {plan_context}
+
+    {evidence_context}
     
     Task: Generate a comprehensive hiring assessment in strictly valid JSON.
     
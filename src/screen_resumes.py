@@ -0,0 +1,45 @@
+"""Bulk resume screening: analyzes every PDF in a directory for one role and writes a JSONL of interview plans.
+
+Re-running with the same --output resumes an interrupted batch: resumes already screened for the role
+are skipped and failed ones are retried.
+
+Usage:
+    python src/screen_resumes.py resumes/ --role "Software Engineer" [--output screening.jsonl]
+        [--parse-workers N] [--concurrency 4] [--recursive]
+"""
+import sys
+import json
+import argparse
+import logging
+from pathlib import Path
+from dotenv import load_dotenv
+
+sys.path.append(str(Path(__file__).parent))
+
+from agents.role_configs import ROLE_CONFIGURATIONS
+from service.resume_screening import ResumeScreeningPipeline, DEFAULT_ANALYSIS_CONCURRENCY, DEFAULT_PARSE_WORKERS
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("resume_dir")
+    parser.add_argument("--role", required=True, choices=list(ROLE_CONFIGURATIONS))
+    parser.add_argument("--output", default=None, help="JSONL file (default: data/screening/<role>.jsonl)")
+    parser.add_argument("--parse-workers", type=int, default=DEFAULT_PARSE_WORKERS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_ANALYSIS_CONCURRENCY,
+                        help="Concurrent LLM analyses")
+    parser.add_argument("--recursive", action="store_true")
+    args = parser.parse_args()
+
+    output = args.output or f"data/screening/{args.role.lower().replace(' ', '_')}.jsonl"
+    pipeline = ResumeScreeningPipeline(args.role, output, parse_workers=args.parse_workers,
+                                       analysis_concurrency=args.concurrency)
+    stats = pipeline.run(args.resume_dir, recursive=args.recursive)
+    print(json.dumps(stats, indent=2))
+    print(f"{stats['done']} screened, {stats['failed']} failed, {stats['skipped']} skipped: "
+          f"{stats['resumes_per_minute']} resumes/min -> {output}")
+
+if __name__ == "__main__":
+    main()
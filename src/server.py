@@ -0,0 +1,220 @@
+import sys
+import os
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+from dotenv import load_dotenv
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, StreamingResponse
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool, iterate_in_threadpool
+
+sys.path.append(str(Path(__file__).parent))
+
+from service.session_manager import InterviewSessionManager
+from utils.api_client import get_json_stats, get_latency_stats
+from utils.audio_manager import AudioManager
+from utils.persona_detector import get_persona_stats
+from utils.report_export import render_report_html
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="AI Interview Partner API")
+manager = InterviewSessionManager()
+# Audio stacks load on the first speech request.
+audio_manager = AudioManager()
+
+class StartInterviewRequest(BaseModel):
+    role: str
+    level: str
+    resume_text: str = ""
+    interview_plan: Optional[Dict] = None
+    resume_job_id: Optional[str] = None
+
+class AnswerRequest(BaseModel):
+    answer: str
+    voice_stats: Optional[Dict[str, float]] = None
+
+class ReanalyzeRequest(BaseModel):
+    role: str
+
+async def _lookup(session_id: str):
+    # Session and report reads hit the shared store (file I/O, flock waits); keep them off the event loop.
+    try:
+        return await run_in_threadpool(manager.get_session, session_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+@app.post("/interviews")
+async def start_interview(request: StartInterviewRequest):
+    return await run_in_threadpool(
+        manager.create_session, request.role, request.level, request.resume_text, request.interview_plan,
+        request.resume_job_id
+    )
+
+@app.get("/interviews/{session_id}")
+async def get_interview(session_id: str):
+    session = await _lookup(session_id)
+    return {
+        "session_id": session_id,
+        "role": session.role,
+        "level": session.level,
+        "ended": session.ended,
+        "history": session.agent.conversation_history,
+        "thought_process": session.agent.get_latest_thought_process()
+    }
+
+@app.post("/interviews/{session_id}/answers")
+async def submit_answer(session_id: str, request: AnswerRequest):
+    await _lookup(session_id)
+    try:
+        return await run_in_threadpool(manager.submit_answer, session_id, request.answer, request.voice_stats)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@app.websocket("/interviews/{session_id}/stream")
+async def stream_answers(websocket: WebSocket, session_id: str):
+    """Each {"answer": ..., "voice_stats": {...}?} message is answered with "chunk" events followed by one "done" event."""
+    await websocket.accept()
+    try:
+        await run_in_threadpool(manager.get_session, session_id)
+    except KeyError:
+        await websocket.close(code=4404, reason="Session not found")
+        return
+
+    try:
+        while True:
+            message = await websocket.receive_json()
+            answer = message.get("answer", "")
+            voice_stats = message.get("voice_stats")
+            try:
+                chunks = []
+                async for chunk in iterate_in_threadpool(manager.stream_answer(session_id, answer, voice_stats)):
+                    chunks.append(chunk)
+                    await websocket.send_json({"type": "chunk", "text": chunk})
+            except ValueError as e:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+                continue
+            await websocket.send_json({
+                "type": "done",
+                "response": "".join(chunks).strip(),
+                "thought_process": await run_in_threadpool(manager.get_thought_process, session_id)
+            })
+    except WebSocketDisconnect:
+        logger.info(f"Stream client for session {session_id} disconnected")
+
+@app.get("/interviews/{session_id}/speech")
+async def speak_latest_question(session_id: str):
+    """The latest interviewer message as chunked MP3; browsers start playing after the first part arrives."""
+    await _lookup(session_id)
+    text = await run_in_threadpool(manager.get_latest_question, session_id)
+    if not text:
+        raise HTTPException(status_code=404, detail="No question to speak yet")
+    return StreamingResponse(iterate_in_threadpool(audio_manager.stream_speech(text)), media_type="audio/mpeg",
+                             headers={"Cache-Control": "no-store"})
+
+@app.post("/interviews/{session_id}/end")
+async def end_interview(session_id: str):
+    await _lookup(session_id)
+    return await run_in_threadpool(manager.end_session, session_id)
+
+@app.get("/interviews/{session_id}/report.html", response_class=HTMLResponse)
+async def export_interview_report(session_id: str):
+    await _lookup(session_id)
+    try:
+        return await run_in_threadpool(manager.export_report_html, session_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@app.get("/reports/{report_key}")
+async def get_report(report_key: str):
+    try:
+        return await run_in_threadpool(manager.get_report_artifact, report_key)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Report not found")
+
+@app.get("/reports/{report_key}/html", response_class=HTMLResponse)
+async def export_report(report_key: str):
+    try:
+        artifact = await run_in_threadpool(manager.get_report_artifact, report_key)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Report not found")
+    report = dict(artifact["report"], artifact={"key": artifact["key"], "cached": True})
+    return render_report_html(report, artifact["role"], artifact["level"])
+
+@app.delete("/interviews/{session_id}")
+async def close_interview(session_id: str):
+    await run_in_threadpool(manager.close_session, session_id)
+    return {"session_id": session_id, "closed": True}
+
+@app.get("/stats/latency")
+async def latency_stats():
+    return get_latency_stats()
+
+@app.get("/stats/json")
+async def json_stats():
+    return get_json_stats()
+
+@app.get("/stats/audio")
+async def audio_stats():
+    return audio_manager.get_stats()
+
+@app.get("/stats/persona")
+async def persona_stats():
+    return get_persona_stats()
+
+@app.get("/analytics/cohort")
+async def cohort_summary(role: Optional[str] = None, level: Optional[str] = None):
+    return await run_in_threadpool(manager.score_store.summary, role, level)
+
+@app.get("/analytics/distribution")
+async def score_distribution(score: str = "overall", role: Optional[str] = None, level: Optional[str] = None,
+                             bins: int = 10):
+    try:
+        return await run_in_threadpool(manager.score_store.distribution, score, role, level, min(max(bins, 1), 100))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Unknown score: {score}")
+
+@app.get("/analytics/breakdown")
+async def cohort_breakdown(score: str = "overall"):
+    try:
+        return await run_in_threadpool(manager.score_store.breakdown, score)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Unknown score: {score}")
+
+@app.post("/resumes")
+async def upload_resume(role: str = Form(...), resume: UploadFile = File(...)):
+    return await run_in_threadpool(manager.analyze_resume, resume.file, role)
+
+@app.post("/resume-jobs")
+async def submit_resume_job(role: str = Form(...), resume: UploadFile = File(...)):
+    """Returns immediately; poll GET /resume-jobs/{job_id} or pass resume_job_id to POST /interviews."""
+    job_id = await run_in_threadpool(manager.submit_resume, await resume.read(), role)
+    job = await run_in_threadpool(manager.get_resume_job, job_id)
+    return job.to_dict()
+
+@app.get("/resume-jobs/{job_id}")
+async def get_resume_job(job_id: str):
+    try:
+        job = await run_in_threadpool(manager.get_resume_job, job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Resume job not found")
+    return job.to_dict()
+
+@app.post("/resume-jobs/{job_id}/reanalyze")
+async def reanalyze_resume_job(job_id: str, request: ReanalyzeRequest):
+    try:
+        job = await run_in_threadpool(manager.reanalyze_resume, job_id, request.role)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Resume job not found")
+    return job.to_dict()
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        app,
+        host=os.getenv("INTERVIEW_API_HOST", "127.0.0.1"),
+        port=int(os.getenv("INTERVIEW_API_PORT", "8000"))
+    )
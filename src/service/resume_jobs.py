@@ -0,0 +1,120 @@
+import io
+import uuid
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from agents.resume_analyzer import ResumeAnalyzer
+from utils.resume_parser import ResumeParser
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class ResumeAnalysisJob:
+    """Parses a resume once, then analyzes it for a role in the background.
+
+    A role change re-runs only the analysis step on the already-parsed text.
+    """
+
+    STATUS_PROGRESS = {"queued": 0.0, "parsing": 0.2, "analyzing": 0.5, "done": 1.0, "failed": 1.0}
+
+    def __init__(self, file_bytes: bytes, role: str, analyzer: ResumeAnalyzer, executor: ThreadPoolExecutor):
+        self.job_id = uuid.uuid4().hex
+        self.role = role
+        self.status = "queued"
+        self.resume_text = ""
+        self.interview_plan: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self._file_bytes = file_bytes
+        self._analyzer = analyzer
+        self._executor = executor
+        self._generation = 0
+        self._callbacks: List[Callable[["ResumeAnalysisJob"], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def progress(self) -> float:
+        return self.STATUS_PROGRESS[self.status]
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def start(self) -> "ResumeAnalysisJob":
+        self._executor.submit(self._run, self._generation, True)
+        return self
+
+    def reanalyze(self, role: str):
+        with self._lock:
+            if role == self.role:
+                return
+            self.role = role
+            self._generation += 1
+            generation = self._generation
+            needs_parse = not self.resume_text
+            if not needs_parse:
+                self.status = "analyzing"
+                self.interview_plan = None
+        self._executor.submit(self._run, generation, needs_parse)
+
+    def add_done_callback(self, callback: Callable[["ResumeAnalysisJob"], None]):
+        """Calls back once the current analysis lands (immediately if it already has)."""
+        with self._lock:
+            if not self.finished:
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "role": self.role,
+            "status": self.status,
+            "progress": self.progress,
+            "resume_text": self.resume_text,
+            "interview_plan": self.interview_plan,
+            "error": self.error
+        }
+
+    def _run(self, generation: int, needs_parse: bool):
+        try:
+            if needs_parse and not self.resume_text:
+                if not self._set_status(generation, "parsing"):
+                    return
+                text = ResumeParser.extract_text(io.BytesIO(self._file_bytes))
+                if not text:
+                    self._finish(generation, "failed", error="No text could be extracted from the resume.")
+                    return
+                with self._lock:
+                    self.resume_text = text
+
+            if not self._set_status(generation, "analyzing"):
+                return
+            plan = self._analyzer.analyze(self.role, self.resume_text)
+            self._finish(generation, "done", plan=plan)
+        except Exception as e:
+            logger.error(f"Resume job {self.job_id} failed: {e}")
+            self._finish(generation, "failed", error=str(e))
+
+    def _set_status(self, generation: int, status: str) -> bool:
+        """Returns False when a newer reanalyze() has superseded this run."""
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self.status = status
+            return True
+
+    def _finish(self, generation: int, status: str, plan: Optional[Dict] = None, error: Optional[str] = None):
+        with self._lock:
+            # A newer reanalyze() superseded this run; its result is stale.
+            if generation != self._generation:
+                return
+            self.status = status
+            self.interview_plan = plan
+            self.error = error
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                logger.error(f"Resume job callback failed: {e}")
@@ -0,0 +1,184 @@
+import os
+import json
+import time
+import hashlib
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from agents.resume_analyzer import ResumeAnalyzer
+from utils.resume_parser import ResumeParser
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARSE_WORKERS = max((os.cpu_count() or 2) - 1, 1)
+# Concurrent LLM analyses; keeps a large batch inside the provider's rate limits.
+DEFAULT_ANALYSIS_CONCURRENCY = 4
+# Parsed resumes waiting for an analysis slot, per slot; bounds memory on large directories.
+ANALYSIS_BACKLOG_PER_SLOT = 2
+PROGRESS_EVERY = 25
+
+def file_digest(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _parse_resume(path: str) -> Tuple[str, str, Optional[str], float]:
+    """Process-pool worker: (path, text, error, seconds)."""
+    start = time.perf_counter()
+    try:
+        with open(path, "rb") as f:
+            text = ResumeParser.extract_text(f)
+    except OSError as e:
+        return path, "", str(e), time.perf_counter() - start
+    error = None if text else "No text could be extracted from the resume."
+    return path, text, error, time.perf_counter() - start
+
+class ResumeScreeningPipeline:
+    """Screens a directory of resume PDFs for one role and appends one JSONL record per resume.
+
+    PDFs are parsed in a process pool and analyzed with at most `analysis_concurrency` LLM calls in
+    flight. Each record is written as soon as its resume finishes. On a rerun with the same output
+    file, resumes that already have a "done" record for this role (matched by content hash) are
+    skipped, so an interrupted batch picks up where it stopped. Failed ones are retried.
+    """
+
+    def __init__(self, role: str, output_path: str, analyzer: Optional[ResumeAnalyzer] = None,
+                 parse_workers: int = DEFAULT_PARSE_WORKERS, analysis_concurrency: int = DEFAULT_ANALYSIS_CONCURRENCY):
+        self.role = role
+        self.output_path = Path(output_path)
+        self.analyzer = analyzer or ResumeAnalyzer()
+        self.parse_workers = max(parse_workers, 1)
+        self.analysis_concurrency = max(analysis_concurrency, 1)
+        self.stats: Dict[str, Any] = {}
+
+    def completed_digests(self) -> Set[str]:
+        """Content hashes already screened successfully for this role; a truncated last line is ignored."""
+        done = set()
+        if not self.output_path.exists():
+            return done
+        with open(self.output_path, "r") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("status") == "done" and record.get("role") == self.role:
+                    done.add(record.get("sha1"))
+        return done
+
+    def run(self, resume_dir: str, recursive: bool = False) -> Dict[str, Any]:
+        root = Path(resume_dir)
+        paths = sorted(root.rglob("*.pdf") if recursive else root.glob("*.pdf"))
+        done = self.completed_digests()
+
+        todo: List[Tuple[Path, str]] = []
+        seen = set(done)
+        for path in paths:
+            digest = file_digest(path)
+            # Byte-identical copies in the same batch are screened once.
+            if digest not in seen:
+                seen.add(digest)
+                todo.append((path, digest))
+
+        self.stats = {
+            "role": self.role,
+            "found": len(paths),
+            "skipped": len(paths) - len(todo),
+            "done": 0,
+            "failed": 0,
+            "parse_seconds": 0.0,
+            "analysis_seconds": 0.0
+        }
+        logger.info(f"Screening {len(todo)} of {len(paths)} resumes for {self.role} ({self.stats['skipped']} already done)")
+
+        start = time.perf_counter()
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._terminate_partial_line()
+        with open(self.output_path, "a") as out:
+            for record in self._screen(root, todo):
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+                self._count(record, time.perf_counter() - start)
+
+        elapsed = time.perf_counter() - start
+        finished = self.stats["done"] + self.stats["failed"]
+        self.stats["elapsed_seconds"] = round(elapsed, 2)
+        self.stats["resumes_per_minute"] = round(finished / elapsed * 60, 1) if elapsed > 0 and finished else 0.0
+        for stage in ("parse_seconds", "analysis_seconds"):
+            self.stats[stage] = round(self.stats[stage], 2)
+        return self.stats
+
+    def _screen(self, root: Path, todo: List[Tuple[Path, str]]) -> Iterator[Dict[str, Any]]:
+        """Yields finished records in completion order; runs on the caller's thread only, so writes need no lock."""
+        digests = {str(path): digest for path, digest in todo}
+        queue = iter(todo)
+        max_backlog = self.analysis_concurrency * ANALYSIS_BACKLOG_PER_SLOT
+        parsing: Dict[Future, str] = {}
+        analyzing: Dict[Future, Dict[str, Any]] = {}
+
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as parse_pool, \
+                ThreadPoolExecutor(max_workers=self.analysis_concurrency, thread_name_prefix="screening") as llm_pool:
+            while True:
+                # Only parse ahead while the analysis backlog has room.
+                while len(parsing) < self.parse_workers * 2 and len(parsing) + len(analyzing) < max_backlog:
+                    item = next(queue, None)
+                    if item is None:
+                        break
+                    parsing[parse_pool.submit(_parse_resume, str(item[0]))] = str(item[0])
+                if not parsing and not analyzing:
+                    return
+
+                finished, _ = wait(list(parsing) + list(analyzing), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    if future in parsing:
+                        path = parsing.pop(future)
+                        record = {"file": os.path.relpath(path, root), "sha1": digests[path], "role": self.role}
+                        try:
+                            _, text, error, seconds = future.result()
+                        except Exception as e:
+                            text, error, seconds = "", f"Parser crashed: {e}", 0.0
+                        record["parse_seconds"] = round(seconds, 3)
+                        if error:
+                            yield dict(record, status="failed", error=error)
+                            continue
+                        record["chars"] = len(text)
+                        analyzing[llm_pool.submit(self._analyze, text)] = record
+                    else:
+                        record = analyzing.pop(future)
+                        try:
+                            plan, seconds = future.result()
+                        except Exception as e:
+                            logger.error(f"Analysis of {record['file']} failed: {e}")
+                            yield dict(record, status="failed", error=str(e))
+                            continue
+                        if plan.get("analysis_failed"):
+                            # The analyzer's generic fallback plan; record a failure so a rerun retries it.
+                            yield dict(record, status="failed", analysis_seconds=round(seconds, 3),
+                                       error="Resume analysis failed; got the fallback plan")
+                            continue
+                        yield dict(record, status="done", analysis_seconds=round(seconds, 3),
+                                   candidate_name=plan.get("candidate_name", "Candidate"), interview_plan=plan)
+
+    def _analyze(self, text: str) -> Tuple[Dict[str, Any], float]:
+        start = time.perf_counter()
+        plan = self.analyzer.analyze(self.role, text)
+        return plan, time.perf_counter() - start
+
+    def _count(self, record: Dict[str, Any], elapsed: float):
+        self.stats[record["status"]] += 1
+        self.stats["parse_seconds"] += record.get("parse_seconds", 0.0)
+        self.stats["analysis_seconds"] += record.get("analysis_seconds", 0.0)
+        finished = self.stats["done"] + self.stats["failed"]
+        if finished % PROGRESS_EVERY == 0:
+            logger.info(f"Screened {finished} resumes ({self.stats['failed']} failed), "
+                        f"{finished / elapsed * 60:.1f} resumes/min")
+
+    def _terminate_partial_line(self):
+        # A run killed mid-write leaves a partial last line; start the next record on a fresh one.
+        if not self.output_path.exists() or not self.output_path.stat().st_size:
+            return
+        with open(self.output_path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
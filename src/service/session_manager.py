@@ -0,0 +1,270 @@
+import uuid
+import time
+import logging
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional
+from agents.interviewer import InterviewAgent
+from agents.evaluator import InterviewEvaluator
+from agents.resume_analyzer import ResumeAnalyzer
+from utils.conversation_manager import ConversationManager
+from utils.resume_parser import ResumeParser
+from utils.session_store import SessionStore
+from utils.report_export import render_report_html
+from service.resume_jobs import ResumeAnalysisJob
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SESSION_RECORD_VERSION = 1
+# Finished resume jobs kept in memory for polling before the oldest are evicted.
+MAX_RESUME_JOBS = 256
+
+class InterviewSession:
+    def __init__(self, session_id: str, role: str, level: str, agent: InterviewAgent,
+                 conversation_manager: Optional[ConversationManager] = None):
+        self.session_id = session_id
+        self.role = role
+        self.level = level
+        self.agent = agent
+        self.conversation_manager = conversation_manager or ConversationManager()
+        self.ended = False
+        self.evaluation_report: Optional[Dict[str, Any]] = None
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "version": SESSION_RECORD_VERSION,
+            "session_id": self.session_id,
+            "role": self.role,
+            "level": self.level,
+            "ended": self.ended,
+            "evaluation_report": self.evaluation_report,
+            "agent": self.agent.to_state(),
+            "conversation": self.conversation_manager.to_state()
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "InterviewSession":
+        version = record.get("version")
+        if version != SESSION_RECORD_VERSION:
+            raise ValueError(f"Unsupported session record version: {version}")
+
+        session = cls(
+            record["session_id"], record["role"], record["level"],
+            InterviewAgent.from_state(record["agent"]),
+            ConversationManager.from_state(record.get("conversation", {}))
+        )
+        session.ended = record.get("ended", False)
+        session.evaluation_report = record.get("evaluation_report")
+        return session
+
+class InterviewSessionManager:
+    """Transport-agnostic owner of interviews, shared by the Streamlit app and the API server.
+
+    No session lives in process memory between calls: every operation restores the session from
+    the shared SessionStore and writes it back, so any worker can serve any turn.
+    """
+
+    def __init__(self, store: Optional[SessionStore] = None):
+        self.store = store or SessionStore()
+        self._evaluator: Optional[InterviewEvaluator] = None
+        self._resume_analyzer: Optional[ResumeAnalyzer] = None
+        self._score_store = None
+        self._resume_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="resume-job")
+        self._resume_jobs: "OrderedDict[str, ResumeAnalysisJob]" = OrderedDict()
+        self._resume_jobs_lock = threading.Lock()
+
+    @property
+    def evaluator(self) -> InterviewEvaluator:
+        if self._evaluator is None:
+            self._evaluator = InterviewEvaluator()
+        return self._evaluator
+
+    @property
+    def resume_analyzer(self) -> ResumeAnalyzer:
+        if self._resume_analyzer is None:
+            self._resume_analyzer = ResumeAnalyzer()
+        return self._resume_analyzer
+
+    @property
+    def score_store(self):
+        # NumPy-backed; imported on first use so it stays off the worker import path.
+        if self._score_store is None:
+            from utils.score_store import ScoreStore
+            self._score_store = ScoreStore()
+        return self._score_store
+
+    def create_session(self, role: str, level: str, resume_text: str = "", interview_plan: Dict = None,
+                       resume_job_id: Optional[str] = None) -> Dict[str, str]:
+        """resume_job_id links a still-running resume job; its plan is attached to the session when it lands."""
+        session_id = uuid.uuid4().hex
+        agent = InterviewAgent(role, level, resume_text, interview_plan)
+        session = InterviewSession(session_id, role, level, agent)
+
+        session.conversation_manager.initialize_conversation(role, level, session_id=f"interview_{session_id}")
+        opening = agent.start_interview()
+        session.conversation_manager.add_message("assistant", opening)
+
+        self._save(session)
+        logger.info(f"Started session {session_id} ({role}, {level})")
+
+        job = self._resume_jobs.get(resume_job_id) if resume_job_id else None
+        if job and not interview_plan:
+            job.add_done_callback(lambda finished: self._attach_job_result(session_id, role, finished))
+        return {"session_id": session_id, "opening": opening}
+
+    def get_session(self, session_id: str) -> InterviewSession:
+        record = self.store.load(session_id)
+        if record is None:
+            raise KeyError(f"Unknown session: {session_id}")
+        return InterviewSession.from_record(record)
+
+    def submit_answer(self, session_id: str, answer: str, voice_stats: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        with self.store.lock(session_id):
+            session = self._get_active_session(session_id)
+            response, error = session.agent.generate_next_question(answer, voice_stats=voice_stats)
+            if not error:
+                self._log_turn(session, answer, response)
+                self._save(session)
+            return {
+                "response": response,
+                "error": error,
+                "thought_process": session.agent.get_latest_thought_process(),
+                "message_count": len(session.agent.conversation_history)
+            }
+
+    def stream_answer(self, session_id: str, answer: str, voice_stats: Optional[Dict[str, float]] = None) -> Iterator[str]:
+        with self.store.lock(session_id):
+            session = self._get_active_session(session_id)
+            turns_before = session.agent.get_total_questions()
+            for chunk in session.agent.stream_next_question(answer, voice_stats=voice_stats):
+                yield chunk
+            if session.agent.get_total_questions() > turns_before:
+                self._log_turn(session, answer, session.agent.conversation_history[-1]["content"])
+                self._save(session)
+
+    def end_session(self, session_id: str) -> Dict[str, Any]:
+        with self.store.lock(session_id):
+            session = self.get_session(session_id)
+            if session.evaluation_report is None:
+                session.ended = True
+                session.conversation_manager.metadata["status"] = "completed"
+                session.conversation_manager.save_conversation()
+                report = self.evaluator.generate_comprehensive_report(
+                    session.agent.conversation_history, session.role, session.level, session.agent.interview_plan
+                )
+                session.conversation_manager.save_report(report)
+                cohort = self._record_scores(session, report)
+                session.evaluation_report = dict(report, cohort=cohort) if cohort else report
+                self._save(session)
+            return session.evaluation_report
+
+    def get_report_artifact(self, report_key: str) -> Dict[str, Any]:
+        artifact = self.evaluator.report_store.get(report_key)
+        if artifact is None:
+            raise KeyError(f"Unknown report: {report_key}")
+        return artifact
+
+    def export_report_html(self, session_id: str) -> str:
+        """Static HTML of an ended session's report; rendered from the stored report, no LLM call."""
+        session = self.get_session(session_id)
+        if session.evaluation_report is None:
+            raise ValueError(f"Session {session_id} has no report yet")
+        return render_report_html(session.evaluation_report, session.role, session.level)
+
+    def close_session(self, session_id: str):
+        self.store.delete(session_id)
+
+    def get_history(self, session_id: str) -> List[Dict]:
+        return self.get_session(session_id).agent.conversation_history
+
+    def get_latest_question(self, session_id: str) -> str:
+        """The interviewer's most recent message, e.g. for speaking it aloud."""
+        for message in reversed(self.get_history(session_id)):
+            if message["role"] == "assistant":
+                return message["content"]
+        return ""
+
+    def get_thought_process(self, session_id: str) -> Dict:
+        return self.get_session(session_id).agent.get_latest_thought_process()
+
+    def attach_interview_plan(self, session_id: str, resume_text: str, interview_plan: Dict):
+        with self.store.lock(session_id):
+            session = self.get_session(session_id)
+            if session.ended:
+                return
+            session.agent.update_interview_plan(resume_text, interview_plan)
+            self._save(session)
+        logger.info(f"Attached interview plan to session {session_id}")
+
+    def submit_resume(self, file_bytes: bytes, role: str) -> str:
+        """Starts parsing and analysis in the background and returns a job id to poll."""
+        job = ResumeAnalysisJob(file_bytes, role, self.resume_analyzer, self._resume_executor)
+        with self._resume_jobs_lock:
+            self._resume_jobs[job.job_id] = job
+            while len(self._resume_jobs) > MAX_RESUME_JOBS:
+                self._resume_jobs.popitem(last=False)
+        job.start()
+        return job.job_id
+
+    def get_resume_job(self, job_id: str) -> ResumeAnalysisJob:
+        job = self._resume_jobs.get(job_id)
+        if job is None:
+            raise KeyError(f"Unknown resume job: {job_id}")
+        return job
+
+    def reanalyze_resume(self, job_id: str, role: str) -> ResumeAnalysisJob:
+        job = self.get_resume_job(job_id)
+        job.reanalyze(role)
+        return job
+
+    def analyze_resume(self, file_obj, role: str) -> Dict[str, Any]:
+        resume_text = ResumeParser.extract_text(file_obj)
+        interview_plan = self.resume_analyzer.analyze(role, resume_text) if resume_text else None
+        return {"resume_text": resume_text, "interview_plan": interview_plan}
+
+    def _get_active_session(self, session_id: str) -> InterviewSession:
+        session = self.get_session(session_id)
+        if session.ended:
+            raise ValueError(f"Session {session_id} has already ended")
+        return session
+
+    def _attach_job_result(self, session_id: str, role: str, job: ResumeAnalysisJob):
+        if job.status != "done" or job.role != role:
+            return
+        try:
+            self.attach_interview_plan(session_id, job.resume_text, job.interview_plan)
+        except KeyError:
+            logger.info(f"Session {session_id} closed before its resume analysis finished")
+
+    def _record_scores(self, session: InterviewSession, report: Dict[str, Any]) -> Optional[Dict]:
+        """Ranks the report against its cohort so far, then adds it to the cohort score store.
+
+        Only full LLM evaluations (those carrying an artifact) are ranked; degraded, fallback and repaired
+        reports hold default scores that would skew the cohort.
+        """
+        artifact = report.get("artifact")
+        if not artifact:
+            return None
+        scores = report.get("scores", {})
+        personas = session.agent.persona_detector.persona_history
+        persona = Counter(personas).most_common(1)[0][0] if personas else session.agent.persona_detector.current_persona
+        try:
+            cohort = self.score_store.percentile_rank(scores, session.role, session.level)
+            if artifact.get("cached"):
+                # A replayed transcript was already counted when its report was first generated.
+                return cohort
+            self.score_store.append(session.role, session.level, scores, report.get("hiring_decision", ""),
+                                    persona, time.time())
+            return cohort
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not record scores for session {session.session_id}: {e}")
+            return None
+
+    def _save(self, session: InterviewSession):
+        self.store.save(session.session_id, session.to_record())
+
+    def _log_turn(self, session: InterviewSession, answer: str, response: str):
+        session.conversation_manager.add_message("user", answer)
+        session.conversation_manager.add_message("assistant", response)
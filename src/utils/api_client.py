@@ -1,81 +1,454 @@
 import os
 import time
 import logging
-import json
-import re
-import streamlit as st  
-from typing import Optional, Dict, Any
-from groq import Groq
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional, Dict, Any, Iterator, List, Callable, Type, Tuple, TYPE_CHECKING
+from pydantic import BaseModel
+from utils.json_repair import parse_json, repair_json
+from utils.schemas import coerce_to_schema
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from groq import Groq
+
+# One verified Groq client per API key, shared by every agent in the process.
+_shared_clients: Dict[str, "Groq"] = {}
+_shared_clients_lock = threading.Lock()
+
+def _get_shared_client(api_key: str) -> "Groq":
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            # Imported on first use: mock-mode sessions and cold workers never pay for the SDK.
+            from groq import Groq
+            # RobustAPIClient does its own deadline-aware retries; SDK-level retries would ignore the deadline.
+            client = Groq(api_key=api_key, max_retries=0)
+            client.models.list()
+            _shared_clients[api_key] = client
+        return client
+
+# Model tiers, overridable per deployment with GROQ_FAST_MODEL / GROQ_LARGE_MODEL.
+DEFAULT_MODEL_TIERS = {
+    "fast": "llama-3.1-8b-instant",
+    "large": "llama-3.3-70b-versatile"
+}
+
+# Which tier serves each call type. The reasoning step only emits a small classification-style JSON.
+DEFAULT_CALL_ROUTES = {
+    "reasoning": "fast",
+    "generation": "large",
+    "evaluation": "large",
+    "resume_analysis": "large"
+}
+
+ESCALATION_TIER = "large"
+
+# Hedging waits for this many samples before trusting a tier's p95 as the hedge delay.
+HEDGE_MIN_SAMPLES = 20
+
+_hedge_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="llm-hedge")
+
+def make_deadline(seconds: Optional[float]) -> Optional[float]:
+    """Absolute deadline on the time.monotonic() clock, or None for no limit."""
+    return None if seconds is None else time.monotonic() + seconds
+
+def remaining_time(deadline: Optional[float]) -> Optional[float]:
+    return None if deadline is None else deadline - time.monotonic()
+
+def deadline_passed(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.monotonic() >= deadline
+
+class LatencyStats:
+    """Rolling window of call latencies for one model tier."""
+
+    def __init__(self, window: int = 200):
+        self.samples = deque(maxlen=window)
+        self.total_calls = 0
+        self._lock = threading.Lock()
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self.samples)
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+            self.total_calls += 1
+
+    def percentile(self, pct: float) -> Optional[float]:
+        with self._lock:
+            ordered = sorted(self.samples)
+        return self._pick(ordered, pct)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            ordered = sorted(self.samples)
+            total_calls = self.total_calls
+        if not ordered:
+            return {"calls": total_calls}
+        return {
+            "calls": total_calls,
+            "mean_ms": round(1000 * sum(ordered) / len(ordered), 1),
+            "p50_ms": round(1000 * self._pick(ordered, 50), 1),
+            "p95_ms": round(1000 * self._pick(ordered, 95), 1),
+            "max_ms": round(1000 * ordered[-1], 1)
+        }
+
+    @staticmethod
+    def _pick(ordered: List[float], pct: float) -> Optional[float]:
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+# Process-wide, so stats aggregate over every agent's client.
+_latency_stats: Dict[str, LatencyStats] = {}
+_escalations: Dict[str, int] = {}
+_stats_lock = threading.Lock()
+
+_json_counters: Dict[str, int] = {"calls": 0, "regenerations": 0, "repairs": 0, "failures": 0}
+_hedge_counters: Dict[str, int] = {"hedged": 0, "hedge_wins": 0, "deadline_exceeded": 0}
+
+def _count_json(counter: str):
+    with _stats_lock:
+        _json_counters[counter] += 1
+
+def _count_hedge(counter: str):
+    with _stats_lock:
+        _hedge_counters[counter] += 1
+
+def _latency_for(tier: str) -> LatencyStats:
+    with _stats_lock:
+        return _latency_stats.setdefault(tier, LatencyStats())
+
+def _configured_tiers() -> Dict[str, str]:
+    return {tier: os.getenv(f"GROQ_{tier.upper()}_MODEL", model) for tier, model in DEFAULT_MODEL_TIERS.items()}
+
+def _hedging_enabled() -> bool:
+    return os.getenv("GROQ_HEDGE_REQUESTS", "False").lower() == "true"
+
+def get_json_stats() -> Dict[str, Any]:
+    """Process-wide JSON call, regeneration and repair counts; needs no client or API key."""
+    with _stats_lock:
+        counters = dict(_json_counters)
+    calls = counters["calls"] or 1
+    return {
+        **counters,
+        "retry_rate": round(counters["regenerations"] / calls, 3),
+        "repair_rate": round(counters["repairs"] / calls, 3)
+    }
+
+def get_latency_stats() -> Dict[str, Any]:
+    """Process-wide per-tier latency, escalation and hedging counts; needs no client or API key."""
+    model_tiers = _configured_tiers()
+    with _stats_lock:
+        tiers = dict(_latency_stats)
+        escalations = dict(_escalations)
+        hedging = dict(_hedge_counters)
+    return {
+        "tiers": {tier: {"model": model_tiers.get(tier), **stats.summary()} for tier, stats in tiers.items()},
+        "escalations": escalations,
+        "hedging": {"enabled": _hedging_enabled(), **hedging}
+    }
+
 class RobustAPIClient:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, call_routes: Optional[Dict[str, str]] = None):
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
-        self.model_name = "llama-3.3-70b-versatile" 
+        self.model_tiers = _configured_tiers()
+        self.call_routes = {**DEFAULT_CALL_ROUTES, **(call_routes or {})}
         self.is_mock = os.getenv("USE_MOCK_API", "False").lower() == "true"
         self.max_retries = 3
+        self.hedging = _hedging_enabled()
         
         if not self.is_mock:
             if not self.api_key:
-                st.error("🚨 CRITICAL: GROQ_API_KEY is missing from environment variables.")
-                st.stop()
+                self._fail("🚨 CRITICAL: GROQ_API_KEY is missing from environment variables.")
                 
             try:
-                self.client = Groq(api_key=self.api_key)
-                self.client.models.list() 
+                self.client = _get_shared_client(self.api_key)
             except Exception as e:
                 logger.error(f"Failed to init Groq client: {e}")
-                st.error(f"🚨 ERROR CONNECTING TO GROQ API: {e}")
-                st.info("Please check your internet connection and verify the API Key is correct.")
-                st.stop()
+                self._fail(
+                    f"🚨 ERROR CONNECTING TO GROQ API: {e}",
+                    "Please check your internet connection and verify the API Key is correct."
+                )
         else:
             self.is_mock = True
 
-    def generate_content(self, prompt: str) -> Optional[str]:
+    @staticmethod
+    def _fail(message: str, hint: Optional[str] = None):
+        """Stops the Streamlit script, or raises when running headless (e.g. the API server)."""
+        import streamlit as st
+        if not st.runtime.exists():
+            raise RuntimeError(f"{message} {hint or ''}".strip())
+        st.error(message)
+        if hint:
+            st.info(hint)
+        st.stop()
+
+    def generate_content(self, prompt: str, call_type: str = "generation", deadline: Optional[float] = None) -> Optional[str]:
+        """deadline (see make_deadline) bounds the whole call, retries included; None is returned once it passes."""
         if self.is_mock: return self._mock_text()
 
+        tiers = self._tiers_for(call_type)
+        for tier in tiers:
+            is_last_tier = tier == tiers[-1]
+            attempts = self.max_retries if is_last_tier else 1
+            for attempt in range(attempts):
+                if self._deadline_exceeded(deadline, call_type):
+                    return None
+                try:
+                    completion = self._complete(
+                        tier,
+                        deadline,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.6,
+                        max_tokens=1024,
+                        top_p=1,
+                        stop=None,
+                        stream=False
+                    )
+                    return completion.choices[0].message.content.strip()
+                except Exception as e:
+                    logger.error(f"API Attempt {attempt+1} ({tier}) failed: {e}")
+                    if is_last_tier:
+                        self._backoff(deadline)
+            if not is_last_tier:
+                self._record_escalation(call_type)
+        
+        return None
+
+    def generate_content_stream(self, prompt: str, call_type: str = "generation", deadline: Optional[float] = None) -> Iterator[str]:
+        """Yields the completion in chunks as they arrive. Yields nothing if every attempt fails.
+
+        The deadline is checked on every chunk; once it passes the stream is closed and iteration ends early.
+        """
+        if self.is_mock:
+            for word in self._mock_text().split(" "):
+                yield word + " "
+            return
+
+        tier = self.call_routes.get(call_type, ESCALATION_TIER)
         for attempt in range(self.max_retries):
+            if self._deadline_exceeded(deadline, call_type):
+                return
+            emitted = False
+            started = time.perf_counter()
             try:
-                completion = self.client.chat.completions.create(
-                    model=self.model_name,
+                timeout = remaining_time(deadline)
+                stream = self.client.chat.completions.create(
+                    model=self.model_tiers[tier],
                     messages=[{"role": "user", "content": prompt}],
                     temperature=0.6,
                     max_tokens=1024,
                     top_p=1,
                     stop=None,
-                    stream=False
+                    stream=True,
+                    **({"timeout": timeout} if timeout is not None else {})
                 )
-                return completion.choices[0].message.content.strip()
+                try:
+                    for chunk in stream:
+                        if deadline_passed(deadline):
+                            logger.warning(f"Deadline passed mid-stream for {call_type}; closing the stream.")
+                            return
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            emitted = True
+                            yield delta
+                finally:
+                    # Also runs when the consumer stops early, so the connection is released either way.
+                    stream.close()
+                _latency_for(tier).record(time.perf_counter() - started)
+                return
             except Exception as e:
-                logger.error(f"API Attempt {attempt+1} failed: {e}")
-                time.sleep(2)
-        
-        return None
+                logger.error(f"Stream Attempt {attempt+1} failed: {e}")
+                # Chunks already sent cannot be taken back, so only retry a stream that never started.
+                if emitted:
+                    return
+                self._backoff(deadline)
 
-    def generate_json_content(self, prompt: str) -> Optional[Dict[str, Any]]:
-        if self.is_mock: return self._mock_json()
+    def generate_json_content(self, prompt: str, call_type: str = "generation",
+                              validate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                              schema: Optional[Type[BaseModel]] = None,
+                              deadline: Optional[float] = None,
+                              escalate: bool = True) -> Optional[Dict[str, Any]]:
+        """Parses locally (strict, then repair) and only re-generates when nothing usable comes back.
 
-        for attempt in range(self.max_retries):
-            try:
-                completion = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant that outputs ONLY valid JSON."},
-                        {"role": "user", "content": f"{prompt}\n\nRespond ONLY with a JSON object."}
-                    ],
-                    temperature=0.1,
-                    response_format={"type": "json_object"} 
-                )
-                
-                text = completion.choices[0].message.content.strip()
-                return json.loads(text)
-            except Exception as e:
-                logger.error(f"JSON Attempt {attempt+1} failed: {e}")
-                time.sleep(2)
-                
-        return None
+        validate() decides whether a small-tier answer is trusted; if not, the call escalates to the large tier.
+        schema fills missing or invalid fields with defaults instead of rejecting the whole answer.
+        escalate=False keeps the call on the routed tier and skips validate().
+        """
+        return self.generate_json_content_with_status(prompt, call_type, validate, schema, deadline, escalate)[0]
+
+    def generate_json_content_with_status(self, prompt: str, call_type: str = "generation",
+                                          validate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                                          schema: Optional[Type[BaseModel]] = None,
+                                          deadline: Optional[float] = None,
+                                          escalate: bool = True) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Like generate_json_content, plus whether the result was locally repaired or had fields
+        filled from schema defaults, for callers that must not persist such results."""
+        if self.is_mock: return self._coerce(self._mock_json(), schema)
+
+        _count_json("calls")
+        tiers = self._tiers_for(call_type) if escalate else self._tiers_for(call_type)[:1]
+        for tier in tiers:
+            is_last_tier = tier == tiers[-1]
+            attempts = self.max_retries if is_last_tier else 1
+            for attempt in range(attempts):
+                if self._deadline_exceeded(deadline, call_type):
+                    _count_json("failures")
+                    return None, False
+                if attempt > 0:
+                    _count_json("regenerations")
+                try:
+                    completion = self._complete(
+                        tier,
+                        deadline,
+                        messages=[
+                            {"role": "system", "content": "You are a helpful assistant that outputs ONLY valid JSON."},
+                            {"role": "user", "content": f"{prompt}\n\nRespond ONLY with a JSON object."}
+                        ],
+                        temperature=0.1,
+                        response_format={"type": "json_object"} 
+                    )
+                    text = completion.choices[0].message.content
+                except Exception as e:
+                    # JSON-mode rejections still carry the model's output, which is often repairable.
+                    text = self._failed_generation(e)
+                    if text is None:
+                        logger.error(f"JSON Attempt {attempt+1} ({tier}) failed: {e}")
+                        if is_last_tier:
+                            self._backoff(deadline)
+                        continue
+
+                raw, repaired = self._parse_json(text)
+                if raw is None:
+                    logger.error(f"JSON Attempt {attempt+1} ({tier}) returned unrepairable output.")
+                    continue
+
+                if not (is_last_tier or validate is None or validate(raw)):
+                    logger.warning(f"Low-confidence {call_type} output from '{tier}' tier.")
+                    break
+
+                result, coerced = self._coerce(raw, schema)
+                if result is not None:
+                    if repaired or coerced:
+                        _count_json("repairs")
+                    return result, repaired or coerced
+            if not is_last_tier:
+                self._record_escalation(call_type)
+
+        _count_json("failures")
+        return None, False
+
+    def get_json_stats(self) -> Dict[str, Any]:
+        return get_json_stats()
+
+    def get_latency_stats(self) -> Dict[str, Any]:
+        return get_latency_stats()
+
+    def _tiers_for(self, call_type: str) -> List[str]:
+        tier = self.call_routes.get(call_type, ESCALATION_TIER)
+        return [tier] if tier == ESCALATION_TIER else [tier, ESCALATION_TIER]
+
+    def _complete(self, tier: str, deadline: Optional[float] = None, **params):
+        timeout = remaining_time(deadline)
+        if timeout is not None:
+            if timeout <= 0:
+                raise TimeoutError("Deadline exceeded before the request was sent")
+            params["timeout"] = timeout
+
+        hedge_delay = self._hedge_delay(tier)
+        if hedge_delay is None:
+            return self._timed_create(tier, params)
+        return self._hedged_create(tier, params, hedge_delay, deadline)
+
+    def _timed_create(self, tier: str, params: Dict[str, Any]):
+        started = time.perf_counter()
+        completion = self.client.chat.completions.create(model=self.model_tiers[tier], **params)
+        _latency_for(tier).record(time.perf_counter() - started)
+        return completion
+
+    def _hedge_delay(self, tier: str) -> Optional[float]:
+        if not self.hedging:
+            return None
+        stats = _latency_for(tier)
+        if stats.count() < HEDGE_MIN_SAMPLES:
+            return None
+        return stats.percentile(95)
+
+    def _hedged_create(self, tier: str, params: Dict[str, Any], hedge_delay: float, deadline: Optional[float]):
+        """Fires a duplicate request once the first outlives the tier's p95 and returns whichever succeeds first."""
+        primary = _hedge_pool.submit(self._timed_create, tier, params)
+        done, _ = wait([primary], timeout=hedge_delay)
+        if done:
+            return primary.result()
+
+        timeout = remaining_time(deadline)
+        if timeout is not None and timeout <= 0:
+            raise TimeoutError("Deadline exceeded while waiting for the primary request")
+        _count_hedge("hedged")
+        backup = _hedge_pool.submit(self._timed_create, tier, params if timeout is None else {**params, "timeout": timeout})
+
+        pending = {primary, backup}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, timeout=remaining_time(deadline), return_when=FIRST_COMPLETED)
+            if not done:
+                raise TimeoutError("Deadline exceeded while waiting for hedged requests")
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        _count_hedge("hedge_wins")
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    @staticmethod
+    def _deadline_exceeded(deadline: Optional[float], call_type: str) -> bool:
+        if not deadline_passed(deadline):
+            return False
+        logger.warning(f"Deadline exceeded for {call_type} call; giving up.")
+        _count_hedge("deadline_exceeded")
+        return True
+
+    @staticmethod
+    def _backoff(deadline: Optional[float], seconds: float = 2.0):
+        timeout = remaining_time(deadline)
+        time.sleep(seconds if timeout is None else max(0.0, min(seconds, timeout)))
+
+    @staticmethod
+    def _parse_json(text: Optional[str]) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Returns (parsed object, whether local repair was needed)."""
+        if not text:
+            return None, False
+        result = parse_json(text.strip())
+        if result is not None:
+            return result, False
+        return repair_json(text), True
+
+    @staticmethod
+    def _coerce(result: Dict[str, Any], schema: Optional[Type[BaseModel]]) -> Tuple[Optional[Dict[str, Any]], bool]:
+        if schema is None:
+            return result, False
+        return coerce_to_schema(result, schema)
+
+    @staticmethod
+    def _failed_generation(error: Exception) -> Optional[str]:
+        body = getattr(error, "body", None)
+        if not isinstance(body, dict):
+            return None
+        if isinstance(body.get("error"), dict):
+            body = body["error"]
+        return body.get("failed_generation")
+
+    @staticmethod
+    def _record_escalation(call_type: str):
+        with _stats_lock:
+            _escalations[call_type] = _escalations.get(call_type, 0) + 1
 
     def _mock_text(self):
         time.sleep(0.5)
@@ -1,54 +1,332 @@
-import speech_recognition as sr
-from gtts import gTTS
-from pydub import AudioSegment
 import io
 import logging
 import os
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterator, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Silences at least this long, and this many dB below the clip's average loudness, count as pauses.
+PAUSE_MIN_MS = 400
+PAUSE_THRESHOLD_DB = 16
+# Worker processes for decoding, resampling and synthesis; 0 runs them on the calling thread.
+DEFAULT_AUDIO_WORKERS = 0
+# Recent samples kept per stage for get_stats().
+STAGE_WINDOW = 200
+# Spoken-output codecs: name -> (pydub/FFmpeg format, FFmpeg codec, MIME type). gTTS itself returns
+# 24 kHz mono MP3 at 32 kbps, which is sent as-is unless a codec or bitrate is configured.
+TTS_CODECS = {
+    "mp3": ("mp3", None, "audio/mpeg"),
+    "opus": ("ogg", "libopus", "audio/ogg")
+}
+DEFAULT_TTS_CODEC = "mp3"
+
+def _read_audio(audio_file) -> bytes:
+    """Raw bytes of a Streamlit UploadedFile, a file object, a path or bytes."""
+    if isinstance(audio_file, (bytes, bytearray, memoryview)):
+        return bytes(audio_file)
+    if hasattr(audio_file, "getvalue"):
+        return audio_file.getvalue()
+    if hasattr(audio_file, "read"):
+        return audio_file.read()
+    with open(audio_file, "rb") as f:
+        return f.read()
+
+def speech_timing(audio) -> Dict[str, int]:
+    """Spoken span and internal pauses of a pydub segment, in milliseconds."""
+    from pydub.silence import detect_silence
+    duration_ms = len(audio)
+    silences = detect_silence(
+        audio, min_silence_len=PAUSE_MIN_MS, silence_thresh=audio.dBFS - PAUSE_THRESHOLD_DB, seek_step=10
+    ) if duration_ms else []
+
+    start, end = 0, duration_ms
+    if silences and silences[0][0] == 0:
+        start = silences.pop(0)[1]
+    if silences and silences[-1][1] >= duration_ms - 10:
+        end = silences.pop()[0]
+    return {
+        "duration_ms": duration_ms,
+        "spoken_ms": max(end - start, 1),
+        "pause_ms": sum(e - s for s, e in silences),
+        "pause_count": len(silences)
+    }
+
+def stats_from_timing(timing: Dict[str, int], text: str) -> Dict[str, float]:
+    spoken_ms, pause_ms, pause_count = timing["spoken_ms"], timing["pause_ms"], timing["pause_count"]
+    return {
+        "duration_seconds": round(timing["duration_ms"] / 1000, 2),
+        "speech_seconds": round(spoken_ms / 1000, 2),
+        "words_per_minute": round(len(text.split()) / (spoken_ms / 60000), 1),
+        "pause_count": pause_count,
+        "pause_ratio": round(pause_ms / spoken_ms, 3),
+        "mean_pause_seconds": round(pause_ms / pause_count / 1000, 2) if pause_count else 0.0
+    }
+
+def prepare_speech(data) -> Tuple[bytes, Dict]:
+    """CPU-bound half of transcription: recorded audio -> (16 kHz mono WAV, {"timing", "stages"}).
+
+    Module-level so AudioWorkerPool can run it in a worker; data may be a shared-memory view. pydub needs
+    a file object, so the view is copied once into a BytesIO here.
+    """
+    from pydub import AudioSegment
+    timings = {}
+    start = time.perf_counter()
+    # Browser recordings from st.audio_input are WAV, which pydub reads without spawning FFmpeg.
+    audio_format = "wav" if bytes(data[:4]) == b"RIFF" else None
+    audio = AudioSegment.from_file(io.BytesIO(data), format=audio_format)
+    timings["decode"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    audio = audio.set_channels(1).set_frame_rate(16000)
+    timings["resample"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    wav_io = io.BytesIO()
+    audio.export(wav_io, format="wav")
+    timings["export"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    timing = speech_timing(audio)
+    timings["silence"] = time.perf_counter() - start
+    return wav_io.getvalue(), {"timing": timing, "stages": timings}
+
+def encode_speech(data, codec: str, bitrate: Optional[str]) -> Tuple[bytes, Dict]:
+    """gTTS MP3 -> (audio in codec at bitrate, {"stages"}); needs FFmpeg."""
+    from pydub import AudioSegment
+    audio_format, ffmpeg_codec, _ = TTS_CODECS[codec]
+    start = time.perf_counter()
+    out = io.BytesIO()
+    AudioSegment.from_file(io.BytesIO(data), format="mp3").export(
+        out, format=audio_format, codec=ffmpeg_codec, bitrate=bitrate, parameters=["-ac", "1"]
+    )
+    return out.getvalue(), {"stages": {"encode": time.perf_counter() - start}}
+
+def synthesize_speech(_, text: str, codec: str = DEFAULT_TTS_CODEC, bitrate: Optional[str] = None) -> Tuple[bytes, Dict]:
+    """text -> (audio bytes, {"stages", "encoded"}); the unused first argument is the pool's input buffer slot.
+
+    The gTTS MP3 is transcoded only for a non-MP3 codec or an explicit bitrate. If that fails
+    (typically FFmpeg missing), the MP3 is returned with "encoded" False and the error.
+    """
+    from gtts import gTTS
+    start = time.perf_counter()
+    mp3_fp = io.BytesIO()
+    gTTS(text=text, lang='en').write_to_fp(mp3_fp)
+    extra = {"stages": {"synthesize": time.perf_counter() - start}, "encoded": False}
+    if codec == "mp3" and not bitrate:
+        return mp3_fp.getvalue(), extra
+    try:
+        audio, encoded = encode_speech(mp3_fp.getvalue(), codec, bitrate)
+    except Exception as e:
+        return mp3_fp.getvalue(), dict(extra, error=str(e))
+    extra["stages"].update(encoded["stages"])
+    return audio, dict(extra, encoded=True)
+
 class AudioManager:
-    def __init__(self):
-        self.recognizer = sr.Recognizer()
+    """STT/TTS wrapper. The speech, TTS and pydub stacks are imported on first use, so chat-only
+    sessions never load them.
+
+    With `workers` > 0 (or INTERVIEW_AUDIO_WORKERS), decoding, resampling, silence detection and
+    synthesis run in a bounded process pool so they do not hold the server's GIL; see utils/audio_pool.py.
+    Spoken output uses `codec` / `bitrate` (INTERVIEW_TTS_CODEC, INTERVIEW_TTS_BITRATE, e.g. "opus", "24k").
+    """
+
+    def __init__(self, workers: Optional[int] = None, codec: Optional[str] = None, bitrate: Optional[str] = None):
+        self.workers = int(os.getenv("INTERVIEW_AUDIO_WORKERS", DEFAULT_AUDIO_WORKERS)) if workers is None else workers
+        self.codec = (codec or os.getenv("INTERVIEW_TTS_CODEC") or DEFAULT_TTS_CODEC).lower()
+        if self.codec not in TTS_CODECS:
+            raise ValueError(f"Unknown TTS codec {self.codec!r}; expected one of {sorted(TTS_CODECS)}")
+        self.bitrate = bitrate or os.getenv("INTERVIEW_TTS_BITRATE") or None
+        self._recognizer = None
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._stages_lock = threading.Lock()
+        self._stages: Dict[str, deque] = {}
+        self._output_bytes: Dict[str, deque] = {}
+
+    @property
+    def recognizer(self):
+        if self._recognizer is None:
+            import speech_recognition as sr
+            self._recognizer = sr.Recognizer()
+        return self._recognizer
+
+    @property
+    def pool(self):
+        if self._pool is None and self.workers > 0:
+            with self._pool_lock:
+                if self._pool is None:
+                    from utils.audio_pool import AudioWorkerPool
+                    self._pool = AudioWorkerPool(self.workers)
+        return self._pool
 
     def speech_to_text(self, audio_file) -> str:
         """Converts Streamlit audio_input (wav/webm bytes) to text."""
+        return self.speech_to_text_with_stats(audio_file)[0]
+
+    def speech_to_text_with_stats(self, audio_file) -> Tuple[str, Optional[Dict[str, float]]]:
+        """Like speech_to_text, plus speaking-rate and pause statistics for the persona classifier."""
+        import speech_recognition as sr
+        from utils.audio_pool import AudioPoolBusy
         try:
-            audio = AudioSegment.from_file(audio_file)
-            audio = audio.set_channels(1).set_frame_rate(16000)
-            wav_io = io.BytesIO()
-            audio.export(wav_io, format="wav")
-            wav_io.seek(0)
+            wav_bytes, extra = self._run(prepare_speech, _read_audio(audio_file))
+            timings = extra["stages"]
 
-            with sr.AudioFile(wav_io) as source:
+            start = time.perf_counter()
+            with sr.AudioFile(io.BytesIO(wav_bytes)) as source:
                 audio_data = self.recognizer.record(source)
-                text = self.recognizer.recognize_google(audio_data)
+                try:
+                    text = self.recognizer.recognize_google(audio_data)
+                finally:
+                    timings["recognize"] = time.perf_counter() - start
+                    self._record("speech_to_text", timings)
                 logger.info(f"Transcribed: {text}")
-                return text
+                return text, stats_from_timing(extra["timing"], text)
                 
         except sr.UnknownValueError:
             logger.warning("Speech Recognition: Audio was empty or unintelligible")
-            return ""
+            return "", None
         except sr.RequestError as e:
             logger.error(f"STT Service Error: {e}")
-            return ""
+            return "", None
+        except AudioPoolBusy as e:
+            logger.warning(f"Audio workers busy, dropping recording: {e}")
+            return "", None
         except Exception as e:
             logger.error(f"Audio Processing Error: {e}")
             if "ffmpeg" in str(e).lower():
                  logger.error("CRITICAL: FFmpeg not found. Please install FFmpeg on your system.")
-            return ""
+            return "", None
+
+    @property
+    def mime_type(self) -> str:
+        """MIME type of text_to_speech output."""
+        return TTS_CODECS[self.codec][2]
 
     def text_to_speech(self, text: str) -> bytes:
-        """Converts text to MP3 audio bytes."""
+        """Converts text to audio bytes in the configured codec (MP3 by default)."""
+        return self.text_to_speech_with_mime(text)[0]
+
+    def text_to_speech_with_mime(self, text: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """Like text_to_speech, but also returns the clip's MIME type, which is MP3 when transcoding failed."""
         try:
             if not text:
-                return None
-            tts = gTTS(text=text, lang='en')
-            mp3_fp = io.BytesIO()
-            tts.write_to_fp(mp3_fp)
-            mp3_fp.seek(0)
-            return mp3_fp.read()
+                return None, None
+            start = time.perf_counter()
+            codec = self.codec
+            audio, extra = self._run(synthesize_speech, None, text, codec, self.bitrate)
+            if extra.get("error"):
+                self._disable_encoding(extra["error"])
+                codec = DEFAULT_TTS_CODEC
+            # The clip is delivered whole, so the first audio is the last byte.
+            self._record("text_to_speech", dict(extra["stages"], first_audio=time.perf_counter() - start))
+            self._record_output("text_to_speech", len(audio))
+            return audio, TTS_CODECS[codec][2]
         except Exception as e:
             logger.error(f"TTS Error: {e}")
-            return None
+            return None, None
+
+    def stream_speech(self, text: str) -> Iterator[bytes]:
+        """Yields MP3 audio part by part as gTTS synthesizes it (gTTS splits text at sentence and clause
+        boundaries), so playback can start after the first part. Concatenated parts form one valid MP3.
+
+        Always MP3, since Ogg/Opus parts cannot simply be concatenated; a configured bitrate applies per part.
+        """
+        if not text:
+            return
+        from gtts import gTTS
+        start = time.perf_counter()
+        total, synthesize, encode = 0, 0.0, 0.0
+        timings = {}
+        try:
+            parts = gTTS(text=text, lang='en').stream()
+            while True:
+                part_start = time.perf_counter()
+                part = next(parts, None)
+                synthesize += time.perf_counter() - part_start
+                if part is None:
+                    break
+                if self.bitrate:
+                    try:
+                        part, extra = self._run(encode_speech, part, "mp3", self.bitrate)
+                        encode += extra["stages"]["encode"]
+                    except Exception as e:
+                        self._disable_encoding(str(e))
+                if not total:
+                    timings["first_audio"] = time.perf_counter() - start
+                total += len(part)
+                yield part
+        except Exception as e:
+            logger.error(f"TTS Stream Error: {e}")
+        finally:
+            if total:
+                timings["synthesize"] = synthesize
+                if encode:
+                    timings["encode"] = encode
+                self._record("stream_speech", timings)
+                self._record_output("stream_speech", total)
+
+    def get_stats(self) -> Dict:
+        """Per-stage latency (count, mean and p95 in ms) over recent calls, plus pool queue counters."""
+        with self._stages_lock:
+            stages = {name: list(samples) for name, samples in self._stages.items()}
+        summary = {}
+        for name, samples in sorted(stages.items()):
+            ordered = sorted(samples)
+            summary[name] = {
+                "count": len(ordered),
+                "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+                "p95_ms": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] * 1000, 2)
+            }
+        with self._stages_lock:
+            outputs = {name: list(sizes) for name, sizes in self._output_bytes.items()}
+        output = {
+            name: {"turns": len(sizes), "mean_bytes": round(sum(sizes) / len(sizes)), "max_bytes": max(sizes)}
+            for name, sizes in sorted(outputs.items())
+        }
+        return {
+            "stages": summary,
+            "output": dict(output, codec=self.codec, bitrate=self.bitrate, mime_type=self.mime_type),
+            "pool": self._pool.get_stats() if self._pool else None
+        }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _run(self, fn, data: Optional[bytes], *args):
+        """fn(data, *args) -> (bytes, extra) inline or on the pool; pool queue and transfer times join extra["stages"]."""
+        pool = self.pool
+        if pool is None:
+            return fn(data, *args)
+        payload, extra, pool_timings = pool.run(fn, data, *args)
+        extra["stages"].update(queue_wait=pool_timings["queue_wait"], ipc=pool_timings["transfer"])
+        return payload, extra
+
+    def _disable_encoding(self, error: str):
+        """Falls back to gTTS's MP3 for this clip; only a missing FFmpeg turns transcoding off for good."""
+        if "ffmpeg" not in error.lower():
+            logger.warning(f"TTS transcoding to {self.codec} {self.bitrate or ''} failed ({error}); sending this clip as MP3")
+            return
+        # Without FFmpeg every later turn would fail the same way; send gTTS's MP3 from now on.
+        if self.codec != DEFAULT_TTS_CODEC or self.bitrate:
+            logger.warning(f"TTS transcoding to {self.codec} {self.bitrate or ''} failed ({error}); sending MP3 as-is")
+        self.codec, self.bitrate = DEFAULT_TTS_CODEC, None
+
+    def _record_output(self, operation: str, size: int):
+        with self._stages_lock:
+            if operation not in self._output_bytes:
+                self._output_bytes[operation] = deque(maxlen=STAGE_WINDOW)
+            self._output_bytes[operation].append(size)
+
+    def _record(self, operation: str, timings: Dict[str, float]):
+        with self._stages_lock:
+            for stage, seconds in timings.items():
+                key = f"{operation}.{stage}"
+                if key not in self._stages:
+                    self._stages[key] = deque(maxlen=STAGE_WINDOW)
+                self._stages[key].append(seconds)
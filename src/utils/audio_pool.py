@@ -0,0 +1,127 @@
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Jobs queued or running per worker before callers wait, and how long they wait before giving up.
+QUEUE_DEPTH_PER_WORKER = 4
+QUEUE_TIMEOUT_SECONDS = 5.0
+
+class AudioPoolBusy(RuntimeError):
+    """Raised when the audio queue stays full for QUEUE_TIMEOUT_SECONDS."""
+
+def _share(data: bytes) -> SharedMemory:
+    shm = SharedMemory(create=True, size=max(len(data), 1))
+    shm.buf[:len(data)] = data
+    return shm
+
+def _run_job(fn: Callable, input_name: Optional[str], input_size: int, args: Tuple) -> Tuple:
+    """Worker side: maps the input block, runs fn(view, *args) -> (bytes or None, extra), shares the output bytes.
+
+    Audio travels through shared memory blocks; only their names and small results cross the pool's pipe,
+    so nothing is pickled. This is not zero-copy: the parent copies input into its block and output out of
+    the worker's block, and fn may copy the view (prepare_speech does, for pydub).
+    """
+    started = time.monotonic()
+    if input_name is None:
+        payload, extra = fn(None, *args)
+    else:
+        shm = SharedMemory(name=input_name)
+        view = shm.buf[:input_size]
+        try:
+            payload, extra = fn(view, *args)
+        finally:
+            view.release()
+            shm.close()
+
+    output = None
+    if payload is not None:
+        out = _share(payload)
+        output = (out.name, len(payload))
+        # Ownership passes to the parent, which unlinks the block after reading it. Spawned workers share the
+        # parent's resource tracker, so a block is still reclaimed if the parent dies first.
+        out.close()
+    return output, extra, started, time.monotonic()
+
+def _warm_up():
+    # Imported once per worker instead of on its first job.
+    import pydub  # noqa: F401
+
+class AudioWorkerPool:
+    """Bounded process pool for CPU-bound audio stages, with shared-memory buffers and queue-depth backpressure."""
+
+    def __init__(self, workers: int, max_queue_depth: Optional[int] = None):
+        self.workers = workers
+        self.max_queue_depth = max_queue_depth or workers * QUEUE_DEPTH_PER_WORKER
+        # Spawned, not forked: the Streamlit and uvicorn parents are multi-threaded.
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                             initializer=_warm_up)
+        self._slots = threading.BoundedSemaphore(self.max_queue_depth)
+        self._stats_lock = threading.Lock()
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0, "queue_depth": 0, "peak_queue_depth": 0}
+
+    def run(self, fn: Callable, data: Optional[bytes], *args) -> Tuple[Optional[bytes], Any, Dict[str, float]]:
+        """Runs fn in a worker; returns (output bytes, extra, {"queue_wait", "worker", "transfer"} seconds).
+
+        fn must be a module-level function taking (memoryview or None, *args) and returning (bytes or None, extra).
+        """
+        if not self._slots.acquire(timeout=QUEUE_TIMEOUT_SECONDS):
+            self._count("rejected")
+            raise AudioPoolBusy(f"Audio queue full ({self.max_queue_depth} jobs)")
+
+        submitted = time.monotonic()
+        shm = _share(data) if data is not None else None
+        self._track_depth(+1)
+        try:
+            future = self._executor.submit(_run_job, fn, shm.name if shm else None, len(data or b""), args)
+            output, extra, started, finished = future.result()
+        except Exception:
+            self._count("failed")
+            raise
+        finally:
+            self._track_depth(-1)
+            self._slots.release()
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        payload = None
+        if output is not None:
+            out = SharedMemory(name=output[0])
+            try:
+                payload = bytes(out.buf[:output[1]])
+            finally:
+                out.close()
+                out.unlink()
+        self._count("completed")
+        total = time.monotonic() - submitted
+        timings = {
+            "queue_wait": max(started - submitted, 0.0),
+            "worker": finished - started,
+            "transfer": max(total - (finished - started) - max(started - submitted, 0.0), 0.0)
+        }
+        return payload, extra, timings
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats, workers=self.workers, max_queue_depth=self.max_queue_depth)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _count(self, counter: str):
+        with self._stats_lock:
+            self._stats[counter] += 1
+
+    def _track_depth(self, delta: int):
+        with self._stats_lock:
+            self._stats["queue_depth"] += delta
+            if delta > 0:
+                self._stats["submitted"] += 1
+                self._stats["peak_queue_depth"] = max(self._stats["peak_queue_depth"], self._stats["queue_depth"])
@@ -3,14 +3,16 @@ import os
 from datetime import datetime
 from typing import List, Dict, Optional
 
+LOG_DIR = "data/conversation_logs"
+
 class ConversationManager:
     def __init__(self):
         self.conversation_history: List[Dict] = []
         self.session_id: Optional[str] = None
         self.metadata: Dict = {}
         
-    def initialize_conversation(self, role: str, experience_level: str) -> str:
-        self.session_id = f"interview_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    def initialize_conversation(self, role: str, experience_level: str, session_id: Optional[str] = None) -> str:
+        self.session_id = session_id or f"interview_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.metadata = {
             "role": role,
             "experience_level": experience_level,
@@ -36,24 +38,44 @@ class ConversationManager:
             for msg in self.conversation_history
         ]
     
+    def to_state(self) -> Dict:
+        return {
+            "session_id": self.session_id,
+            "metadata": self.metadata,
+            "conversation": self.conversation_history
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "ConversationManager":
+        manager = cls()
+        manager.session_id = state.get("session_id")
+        manager.metadata = state.get("metadata", {})
+        manager.conversation_history = list(state.get("conversation", []))
+        return manager
+    
     def save_conversation(self):
         if not self.session_id:
             return
         
-        os.makedirs("data/conversation_logs", exist_ok=True)
-        filepath = f"data/conversation_logs/{self.session_id}.json"
+        os.makedirs(LOG_DIR, exist_ok=True)
+        filepath = f"{LOG_DIR}/{self.session_id}.json"
         
-        data = {
-            "session_id": self.session_id,
-            "metadata": self.metadata,
-            "conversation": self.conversation_history
-        }
+        data = self.to_state()
         
         with open(filepath, "w") as f:
             json.dump(data, f, indent=2)
+
+    def save_report(self, report: Dict):
+        """Stores the evaluation report next to the transcript, so it outlives the session."""
+        if not self.session_id:
+            return
+
+        os.makedirs(LOG_DIR, exist_ok=True)
+        with open(f"{LOG_DIR}/{self.session_id}.report.json", "w") as f:
+            json.dump({"session_id": self.session_id, "metadata": self.metadata, "report": report}, f, indent=2)
     
     def load_conversation(self, session_id: str) -> bool:
-        filepath = f"data/conversation_logs/{session_id}.json"
+        filepath = f"{LOG_DIR}/{session_id}.json"
         
         if not os.path.exists(filepath):
             return False
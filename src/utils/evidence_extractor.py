@@ -0,0 +1,150 @@
+import re
+import math
+from typing import Dict, List, Optional
+
+MAX_CLAIMS = 10
+SPAN_SENTENCES = 2
+MAX_QUOTE_CHARS = 220
+# Share of a claim's (idf-weighted) terms a span must contain to count as strong / partial support.
+STRONG_COVERAGE = 0.6
+PARTIAL_COVERAGE = 0.3
+
+_WORD_PATTERN = re.compile(r"[a-z0-9+#]+")
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+_SUFFIXES = ("ations", "ation", "ings", "ing", "ions", "ion", "ed", "es", "s")
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "i", "in", "into", "is",
+    "it", "its", "of", "on", "or", "our", "that", "the", "this", "to", "was", "we", "were", "with", "but",
+    "lists", "claims", "candidate", "needs", "probing", "why", "how", "what", "only", "shows", "specific",
+    "experience", "years", "year", "vague", "about", "their", "they", "he", "she", "my", "me", "you"
+}
+
+def _terms(text: str) -> List[str]:
+    terms = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        if word in _STOPWORDS or len(word) < 2:
+            continue
+        for suffix in _SUFFIXES:
+            if len(word) > len(suffix) + 3 and word.endswith(suffix):
+                word = word[:-len(suffix)]
+                break
+        terms.append(word)
+    return terms
+
+def extract_claims(interview_plan: Optional[Dict]) -> List[Dict]:
+    """Claims worth verifying: the Architect's focus areas first, then achievement lines from the resume digest."""
+    plan = interview_plan or {}
+    claims = []
+    for area in plan.get("focus_areas", []):
+        topic = area.get("topic", "")
+        claims.append({"claim": f"{topic}: {area.get('reason', '')}".strip(": "), "source": "focus_area",
+                       "match_text": f"{topic} {topic} {area.get('reason', '')}"})
+    for claim in (plan.get("resume_digest") or {}).get("claims", []):
+        claims.append({"claim": claim, "source": "resume", "match_text": claim})
+    return claims[:MAX_CLAIMS]
+
+class AnswerIndex:
+    """Inverted index over short spans of the candidate's answers, for lexical quote lookup."""
+
+    def __init__(self, conversation_history: List[Dict]):
+        self.spans: List[Dict] = []
+        for turn, msg in enumerate(m for m in conversation_history if m["role"] == "user"):
+            sentences = [s.strip() for s in _SENTENCE_SPLIT.split(msg["content"]) if s.strip()]
+            for i in range(max(len(sentences) - SPAN_SENTENCES + 1, 1)):
+                text = " ".join(sentences[i:i + SPAN_SENTENCES])
+                self.spans.append({"answer": turn + 1, "text": text, "terms": set(_terms(text))})
+
+        self.postings: Dict[str, List[int]] = {}
+        for span_id, span in enumerate(self.spans):
+            for term in span["terms"]:
+                self.postings.setdefault(term, []).append(span_id)
+        n_spans = len(self.spans)
+        self.idf = {t: math.log(1 + n_spans / len(ids)) for t, ids in self.postings.items()}
+
+    def best_match(self, text: str) -> Optional[Dict]:
+        """The span covering the largest idf-weighted share of text's terms, or None if nothing overlaps."""
+        query = set(_terms(text))
+        if not query:
+            return None
+        # Terms missing from every answer get the highest possible idf, so they count fully against coverage.
+        missing_idf = math.log(1 + max(len(self.spans), 1))
+        total = sum(self.idf.get(t, missing_idf) for t in query)
+
+        scores: Dict[int, float] = {}
+        for term in query:
+            for span_id in self.postings.get(term, ()):
+                scores[span_id] = scores.get(span_id, 0.0) + self.idf[term]
+        if not scores:
+            return None
+        span_id = max(scores, key=lambda i: (scores[i], -len(self.spans[i]["text"])))
+        span = self.spans[span_id]
+        return {"answer": span["answer"], "quote": _clip(span["text"]), "coverage": round(scores[span_id] / total, 2)}
+
+def build_evidence(conversation_history: List[Dict], interview_plan: Optional[Dict]) -> List[Dict]:
+    """Pre-ranked evidence rows: each claim with its best-matching candidate quote and match strength."""
+    claims = extract_claims(interview_plan)
+    if not claims:
+        return []
+    index = AnswerIndex(conversation_history)
+    rows = []
+    for claim in claims:
+        match = index.best_match(claim["match_text"])
+        coverage = match["coverage"] if match else 0.0
+        strength = "strong" if coverage >= STRONG_COVERAGE else "partial" if coverage >= PARTIAL_COVERAGE else "none"
+        rows.append({
+            "claim": claim["claim"],
+            "source": claim["source"],
+            "match": strength,
+            "answer": match["answer"] if match and strength != "none" else None,
+            "quote": match["quote"] if match and strength != "none" else "Not found"
+        })
+    order = {"strong": 0, "partial": 1, "none": 2}
+    return sorted(rows, key=lambda r: order[r["match"]])
+
+def format_evidence_table(rows: List[Dict]) -> str:
+    if not rows:
+        return "No resume claims to verify."
+    lines = ["# | claim | match | answer | quote"]
+    first_seen: Dict[str, int] = {}
+    for i, row in enumerate(rows, 1):
+        answer = f"A{row['answer']}" if row["answer"] else "-"
+        if row["answer"] is None:
+            quote = "Not found"
+        elif row["quote"] in first_seen:
+            quote = f"(same as #{first_seen[row['quote']]})"
+        else:
+            first_seen[row["quote"]] = i
+            quote = f"\"{row['quote']}\""
+        lines.append(f"{i} | {row['claim']} | {row['match']} | {answer} | {quote}")
+    return "\n".join(lines)
+
+def ground_evidence(report_evidence: List[Dict], rows: List[Dict], conversation_history: List[Dict]) -> List[Dict]:
+    """Keeps LLM evidence quotes only if they occur in the candidate's answers; otherwise swaps in the local match.
+
+    With no LLM evidence at all, the local rows become the evidence section.
+    """
+    if not report_evidence:
+        verdicts = {"strong": "Verified", "partial": "Partially Verified", "none": "Flagged"}
+        return [{"claim": r["claim"], "verdict": verdicts[r["match"]], "quote": r["quote"]} for r in rows]
+
+    answers = _normalize(" ".join(m["content"] for m in conversation_history if m["role"] == "user"))
+    by_claim = {_normalize(r["claim"]): r for r in rows}
+    index = None
+    grounded = []
+    for item in report_evidence:
+        quote = item.get("quote", "")
+        if quote and quote != "Not found" and _normalize(quote).strip(". ") not in answers:
+            row = by_claim.get(_normalize(item.get("claim", "")))
+            if row is None:
+                index = index or AnswerIndex(conversation_history)
+                match = index.best_match(item.get("claim", ""))
+                row = {"quote": match["quote"] if match and match["coverage"] >= PARTIAL_COVERAGE else "Not found"}
+            item = dict(item, quote=row["quote"])
+        grounded.append(item)
+    return grounded
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().replace("...", " ").replace('"', "").split())
+
+def _clip(text: str) -> str:
+    return text if len(text) <= MAX_QUOTE_CHARS else text[:MAX_QUOTE_CHARS - 3].rstrip() + "..."
@@ -0,0 +1,79 @@
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL | re.IGNORECASE)
+_TRAILING_COMMA_PATTERN = re.compile(r",\s*([}\]])")
+_CLOSERS = {"{": "}", "[": "]"}
+
+def parse_json(text: str) -> Optional[Dict[str, Any]]:
+    """Strict parse. Returns None unless the text is a JSON object."""
+    try:
+        result = json.loads(text)
+    except (TypeError, ValueError):
+        return None
+    return result if isinstance(result, dict) else None
+
+def repair_json(text: str) -> Optional[Dict[str, Any]]:
+    """Best-effort local recovery of a JSON object from fenced, chatty, or truncated LLM output."""
+    if not text:
+        return None
+
+    fenced = _FENCE_PATTERN.search(text)
+    if fenced:
+        text = fenced.group(1)
+
+    start = text.find("{")
+    if start == -1:
+        return None
+    text = text[start:]
+
+    end = text.rfind("}")
+    candidates = [text[:end + 1]] if end != -1 else []
+    candidates.append(text)
+    for candidate in candidates:
+        result = parse_json(candidate) or parse_json(_TRAILING_COMMA_PATTERN.sub(r"\1", candidate))
+        if result is not None:
+            return result
+
+    return _close_truncated(text)
+
+def _close_truncated(text: str) -> Optional[Dict[str, Any]]:
+    """Cuts truncated JSON back to the last complete element and closes every open bracket."""
+    stack: List[str] = []
+    cut_points = []
+    in_string = False
+    escaped = False
+
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(char)
+        elif char in "}]":
+            if not stack:
+                break
+            stack.pop()
+            cut_points.append((i + 1, list(stack)))
+        elif char == ",":
+            cut_points.append((i, list(stack)))
+
+    # Keep the tail only if it ends on a complete value; a cut-off string or number could be wrong
+    # (e.g. "7" from "75"), so otherwise back off to the last complete element.
+    attempts = [(text[:pos], open_stack) for pos, open_stack in reversed(cut_points)]
+    if not in_string and text.rstrip().endswith(('"', "}", "]", "true", "false", "null")):
+        attempts.insert(0, (text, stack))
+    for prefix, open_stack in attempts:
+        closed = prefix.rstrip().rstrip(",") + "".join(_CLOSERS[c] for c in reversed(open_stack))
+        result = parse_json(closed)
+        if result is not None:
+            return result
+    return None
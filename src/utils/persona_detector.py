@@ -1,52 +1,301 @@
-from typing import List, Dict
+import re
+import math
+import threading
+from collections import deque
+from typing import List, Dict, Optional
+
+PERSONAS = ["Professional", "Efficient", "Chatty", "Nervous", "Evasive"]
+WINDOW_SIZE = 20
+
+# At or above this local confidence the reasoning LLM call is skipped, but only at the unambiguous
+# extremes: (min, max) answer length in words per persona, i.e. very short evasions and long rambles...
+SKIP_CONFIDENCE = 0.85
+LONG_ANSWER_WORDS = 150
+SKIP_WORD_RANGES = {"Evasive": (0, 8), "Chatty": (LONG_ANSWER_WORDS, float("inf"))}
+# ...and at or above this one it runs on the fast tier only, without escalation.
+DOWNGRADE_CONFIDENCE = 0.7
+# Length alone does not make a ramble: a Chatty label, or any answer of LONG_ANSWER_WORDS or more, only
+# skips or downgrades the reasoning call when the answer shows at least this many rambling signals.
+CHATTY_MIN_RAMBLING_SIGNALS = 2
+RAMBLING_HEDGE_RATE = 0.03
+RAMBLING_FILLER_RATE = 0.03
+RAMBLING_MAX_SPECIFICITY = 0.005
+RAMBLING_MAX_DIVERSITY = 0.45
+
+_WORD_PATTERN = re.compile(r"[a-z0-9']+")
+_HEDGES = re.compile(
+    r"\b(maybe|perhaps|probably|possibly|i think|i guess|i suppose|i believe|kind of|sort of|"
+    r"not sure|might|somewhat|more or less|i'm not certain)\b"
+)
+_FILLERS = re.compile(r"\b(um+|uh+|er+|hmm+|like|you know|basically|actually|literally|i mean|so yeah)\b")
+_EVASIONS = re.compile(
+    r"\b(i don'?t know|i do not know|no idea|can'?t remember|don'?t remember|can'?t recall|"
+    r"rather not|prefer not|not sure what you mean|skip (this|that)|no comment)\b"
+)
+_SPECIFICS = re.compile(r"\d|%|\$")
+
+FEATURES = [
+    "bias", "short", "long", "hedge_rate", "filler_rate", "evasion", "specificity",
+    "low_diversity", "fast_speech", "pause_ratio"
+]
+# Hand-set linear model (persona x feature), scored with a softmax. Rows follow PERSONAS.
+_WEIGHTS = [
+    # bias  short  long  hedge  filler  evasion  specific  low_div  fast  pause
+    [1.0,  -2.0,  -1.0,  -1.5,  -1.5,   -3.0,     2.0,     -1.0,    0.0,  -1.0],   # Professional
+    [0.5,   1.5,  -2.5,  -1.0,  -1.0,   -2.0,     1.5,     -0.5,    0.0,  -0.5],   # Efficient
+    [-0.5, -2.5,   2.5,   1.5,   2.5,   -1.0,    -2.0,      3.0,    1.0,  -0.5],   # Chatty
+    [-0.5,  0.5,   0.0,   3.5,   3.0,    0.5,    -0.5,      0.0,    0.5,   2.5],   # Nervous
+    [-1.0,  3.0,  -1.0,   0.5,   0.0,    4.5,    -2.5,      0.0,    0.0,   0.0]    # Evasive
+]
+_weight_matrix = None
+
+_stats_lock = threading.Lock()
+_counters = {"classified": 0, "skipped": 0, "downgraded": 0, "compared": 0, "agreed": 0}
+_confusion: Dict[str, int] = {}
+
+def _weights():
+    # NumPy is only needed once a turn is classified; keeps it off the worker import path.
+    global _weight_matrix
+    if _weight_matrix is None:
+        import numpy as np
+        _weight_matrix = np.array(_WEIGHTS, dtype=np.float64)
+    return _weight_matrix
+
+def _count(counter: str):
+    with _stats_lock:
+        _counters[counter] += 1
+
+def get_persona_stats() -> Dict:
+    """Process-wide local classifier usage and agreement with the LLM's persona labels."""
+    with _stats_lock:
+        counters = dict(_counters)
+        confusion = dict(_confusion)
+    classified = counters["classified"]
+    compared = counters["compared"]
+    return {
+        **counters,
+        "skip_rate": counters["skipped"] / classified if classified else 0.0,
+        "downgrade_rate": counters["downgraded"] / classified if classified else 0.0,
+        "agreement_rate": counters["agreed"] / compared if compared else None,
+        "confusion": confusion
+    }
+
+def extract_measures(text: str, voice_stats: Optional[Dict] = None) -> Dict[str, float]:
+    """Raw per-answer measures; voice_stats comes from AudioManager.speech_to_text_with_stats."""
+    lowered = text.lower()
+    words = _WORD_PATTERN.findall(lowered)
+    n = len(words)
+    measures = {
+        "words": float(n),
+        "hedge_rate": len(_HEDGES.findall(lowered)) / n if n else 0.0,
+        "filler_rate": len(_FILLERS.findall(lowered)) / n if n else 0.0,
+        "evasion": 1.0 if _EVASIONS.search(lowered) else 0.0,
+        "specificity": len(_SPECIFICS.findall(text)) / n if n else 0.0,
+        "diversity": len(set(words)) / n if n else 1.0
+    }
+    if voice_stats:
+        measures["words_per_minute"] = float(voice_stats.get("words_per_minute") or 0.0)
+        measures["pause_ratio"] = float(voice_stats.get("pause_ratio") or 0.0)
+    return measures
+
+def feature_vector(measures: Dict[str, float]) -> List[float]:
+    """Maps raw measures onto the roughly 0-1 features the weights expect (order: FEATURES)."""
+    words = measures["words"]
+    wpm = measures.get("words_per_minute", 0.0)
+    return [
+        1.0,
+        max(0.0, 1.0 - words / 40.0),
+        min(1.0, max(0.0, (words - 120.0) / 120.0)),
+        min(1.0, measures["hedge_rate"] * 10.0),
+        min(1.0, measures["filler_rate"] * 10.0),
+        measures["evasion"],
+        min(1.0, measures["specificity"] * 10.0),
+        # Type-token ratio naturally drops with length, so only flag it on longer answers.
+        max(0.0, 0.45 - measures["diversity"]) * 2.0 if words >= 60 else 0.0,
+        min(1.0, max(0.0, (wpm - 170.0) / 60.0)),
+        min(1.0, measures.get("pause_ratio", 0.0) * 2.0)
+    ]
+
+def rambling_signals(measures: Dict[str, float]) -> int:
+    """How many of: high hedge rate, high filler rate, no specifics, low lexical diversity (longer answers only)."""
+    return sum((
+        measures["hedge_rate"] >= RAMBLING_HEDGE_RATE,
+        measures["filler_rate"] >= RAMBLING_FILLER_RATE,
+        measures["specificity"] <= RAMBLING_MAX_SPECIFICITY,
+        measures["words"] >= 60 and measures["diversity"] < RAMBLING_MAX_DIVERSITY
+    ))
+
+class RunningWindow:
+    """Last `size` values with O(1) push, mean and standard deviation."""
+
+    def __init__(self, size: int = WINDOW_SIZE, values: List[float] = ()):
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.total_sq = 0.0
+        for value in values:
+            self.push(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, value: float):
+        if len(self.values) == self.values.maxlen:
+            evicted = self.values[0]
+            self.total -= evicted
+            self.total_sq -= evicted * evicted
+        self.values.append(value)
+        self.total += value
+        self.total_sq += value * value
+
+    @property
+    def mean(self) -> float:
+        return self.total / len(self.values) if self.values else 0.0
+
+    @property
+    def std(self) -> float:
+        if not self.values:
+            return 0.0
+        return math.sqrt(max(self.total_sq / len(self.values) - self.mean ** 2, 0.0))
 
 class PersonaDetector:
+    WINDOWED_MEASURES = ("words", "hedge_rate", "filler_rate", "words_per_minute", "pause_ratio")
+
     def __init__(self):
         self.current_persona = "Neutral"
         self.persona_history = []
-        self.response_lengths = []
+        self.windows = {name: RunningWindow() for name in self.WINDOWED_MEASURES}
         self.engagement_score = 0.5
-        
+        self.agreement = {"compared": 0, "agreed": 0}
+        self.last_local: Optional[Dict] = None
+        self._pending_local: Optional[Dict] = None
+
+    @property
+    def response_lengths(self) -> List[float]:
+        return list(self.windows["words"].values)
+
+    def to_state(self) -> Dict:
+        return {
+            "current_persona": self.current_persona,
+            "persona_history": self.persona_history,
+            "windows": {name: list(window.values) for name, window in self.windows.items()},
+            "engagement_score": self.engagement_score,
+            "agreement": self.agreement,
+            "last_local": self.last_local
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "PersonaDetector":
+        detector = cls()
+        detector.current_persona = state.get("current_persona", "Neutral")
+        detector.persona_history = list(state.get("persona_history", []))
+        windows = state.get("windows") or {"words": state.get("response_lengths", [])}
+        for name, values in windows.items():
+            if name in detector.windows:
+                detector.windows[name] = RunningWindow(values=values)
+        detector.engagement_score = state.get("engagement_score", 0.5)
+        detector.agreement = dict(state.get("agreement", detector.agreement))
+        detector.last_local = state.get("last_local")
+        return detector
+
+    def observe(self, response_text: str, voice_stats: Optional[Dict] = None) -> Dict:
+        """Records the answer in the running windows and classifies it locally, before any LLM call."""
+        measures = extract_measures(response_text, voice_stats)
+        for name, value in measures.items():
+            if name in self.windows:
+                self.windows[name].push(value)
+
+        import numpy as np
+        logits = _weights() @ np.asarray(feature_vector(measures))
+        probs = np.exp(logits - logits.max())
+        probs /= probs.sum()
+        best = int(probs.argmax())
+
+        self.last_local = {
+            "persona": PERSONAS[best],
+            "words": int(measures["words"]),
+            "confidence": round(float(probs[best]), 3),
+            "rambling_signals": rambling_signals(measures),
+            "probabilities": {p: round(float(v), 3) for p, v in zip(PERSONAS, probs)}
+        }
+        self._pending_local = self.last_local
+        _count("classified")
+        return self.last_local
+
+    def reasoning_route(self, local: Dict) -> str:
+        """"skip" (answer locally), "fast" (fast tier, no escalation) or "full" for the reasoning call."""
+        long_or_chatty = local["persona"] == "Chatty" or local["words"] >= LONG_ANSWER_WORDS
+        if long_or_chatty and local.get("rambling_signals", 0) < CHATTY_MIN_RAMBLING_SIGNALS:
+            return "full"
+        low, high = SKIP_WORD_RANGES.get(local["persona"], (1, 0))
+        if local["confidence"] >= SKIP_CONFIDENCE and low <= local["words"] <= high:
+            _count("skipped")
+            return "skip"
+        if local["confidence"] >= DOWNGRADE_CONFIDENCE:
+            _count("downgraded")
+            return "fast"
+        return "full"
+
     def update_from_llm_analysis(self, analysis_json: Dict, response_text: str):
         if not analysis_json:
             return
+        if self._pending_local is None:
+            self.observe(response_text)
 
         detected = analysis_json.get("detected_persona", "Neutral")
         self.current_persona = detected
         self.persona_history.append(detected)
-        
-        word_count = len(response_text.split())
-        self.response_lengths.append(word_count)
-        
+
+        local, self._pending_local = self._pending_local, None
+        if analysis_json.get("source") != "local" and detected in PERSONAS:
+            self._record_agreement(local["persona"], detected)
+
         self._update_engagement_score(analysis_json)
-        
+
+    def _record_agreement(self, local_persona: str, llm_persona: str):
+        agreed = local_persona == llm_persona
+        self.agreement["compared"] += 1
+        self.agreement["agreed"] += int(agreed)
+        with _stats_lock:
+            _counters["compared"] += 1
+            _counters["agreed"] += int(agreed)
+            key = f"{local_persona}->{llm_persona}"
+            _confusion[key] = _confusion.get(key, 0) + 1
+
     def _update_engagement_score(self, analysis: Dict):
         base_score = 0.5
-        
+
         positive_personas = ["Professional", "Efficient", "Expert"]
         negative_personas = ["Evasive", "Confused", "Vague"]
-        
+
         if self.current_persona in positive_personas:
             base_score += 0.3
         elif self.current_persona in negative_personas:
             base_score -= 0.2
-            
-        if len(self.response_lengths) > 0:
-            avg_len = sum(self.response_lengths) / len(self.response_lengths)
-            if 40 <= avg_len <= 150: 
+
+        if len(self.windows["words"]) > 0:
+            avg_len = self.windows["words"].mean
+            if 40 <= avg_len <= 150:
                 base_score += 0.1
-        
+
         self.engagement_score = min(max(base_score, 0.1), 1.0)
 
     def get_engagement_score(self) -> float:
         return self.engagement_score
-    
+
     def get_current_persona(self) -> str:
         return self.current_persona
 
     def get_stats(self) -> Dict:
-        return {
+        compared = self.agreement["compared"]
+        stats = {
             "current_persona": self.current_persona,
             "history_count": len(self.persona_history),
-            "engagement": f"{self.engagement_score:.0%}"
-        }
\ No newline at end of file
+            "engagement": f"{self.engagement_score:.0%}",
+            "avg_words": round(self.windows["words"].mean, 1),
+            "local_persona": (self.last_local or {}).get("persona"),
+            "local_agreement": f"{self.agreement['agreed'] / compared:.0%}" if compared else "n/a"
+        }
+        if len(self.windows["words_per_minute"]):
+            stats["avg_words_per_minute"] = round(self.windows["words_per_minute"].mean, 1)
+            stats["avg_pause_ratio"] = round(self.windows["pause_ratio"].mean, 3)
+        return stats
@@ -0,0 +1,112 @@
+import math
+from html import escape
+from typing import Dict, List, Optional, Tuple
+
+RADAR_SIZE = 360
+RADAR_RINGS = (20, 40, 60, 80, 100)
+
+_STYLE = """
+body { font-family: -apple-system, "Segoe UI", Helvetica, Arial, sans-serif; color: #1f2933; max-width: 960px;
+       margin: 2rem auto; padding: 0 1rem; line-height: 1.5; }
+h1 { margin-bottom: 0.2rem; } .meta { color: #616e7c; margin-top: 0; }
+.metrics { display: flex; gap: 1rem; margin: 1.5rem 0; }
+.metric { flex: 1; border: 1px solid #e4e7eb; border-radius: 8px; padding: 0.8rem 1rem; }
+.metric .label { font-size: 0.85rem; color: #616e7c; } .metric .value { font-size: 1.6rem; font-weight: 600; }
+.columns { display: flex; gap: 2rem; align-items: flex-start; } .columns > div { flex: 1; }
+.tip { background: #e8f4fd; border-radius: 6px; padding: 0.5rem 0.8rem; margin: 0.4rem 0; }
+.evidence { border-left: 3px solid #cbd2d9; padding: 0.2rem 0.8rem; margin: 0.6rem 0; }
+.evidence .quote { font-style: italic; color: #3e4c59; } .cohort { color: #616e7c; }
+table { border-collapse: collapse; } td { padding: 0.15rem 1rem 0.15rem 0; }
+"""
+
+def ordinal(n: int) -> str:
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+def radar_svg(scores: Dict[str, int], size: int = RADAR_SIZE) -> str:
+    """Self-contained SVG radar chart of 0-100 scores, the offline counterpart of the app's plotly chart."""
+    items = list(scores.items())
+    if len(items) < 3:
+        return ""
+    # Extra width on both sides leaves room for the axis labels.
+    width = size + 240
+    center_x, center_y = width / 2, size / 2
+    radius = size / 2 - 50
+
+    def point(index: int, value: float) -> Tuple[float, float]:
+        angle = -math.pi / 2 + 2 * math.pi * index / len(items)
+        r = radius * min(max(value, 0), 100) / 100
+        return center_x + r * math.cos(angle), center_y + r * math.sin(angle)
+
+    def polygon(values: List[float]) -> str:
+        return " ".join(f"{x:.1f},{y:.1f}" for x, y in (point(i, v) for i, v in enumerate(values)))
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{size}" viewBox="0 0 {width} {size}" '
+             f'role="img" aria-label="Score radar chart">']
+    for ring in RADAR_RINGS:
+        parts.append(f'<polygon points="{polygon([ring] * len(items))}" fill="none" stroke="#e4e7eb"/>')
+    for i, (name, value) in enumerate(items):
+        x, y = point(i, 100)
+        lx, ly = point(i, 118)
+        anchor = "middle" if abs(lx - center_x) < 1 else ("start" if lx > center_x else "end")
+        parts.append(f'<line x1="{center_x}" y1="{center_y}" x2="{x:.1f}" y2="{y:.1f}" stroke="#e4e7eb"/>')
+        parts.append(f'<text x="{lx:.1f}" y="{ly:.1f}" font-size="12" text-anchor="{anchor}" '
+                     f'dominant-baseline="middle" fill="#3e4c59">{escape(name.replace("_", " ").title())} ({value})</text>')
+    parts.append(f'<polygon points="{polygon([v for _, v in items])}" fill="rgba(99,110,250,0.35)" '
+                 f'stroke="#636efa" stroke-width="2"/>')
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+def render_report_html(report: Dict, role: str = "", level: str = "", title: Optional[str] = None) -> str:
+    """Standalone HTML page (inline CSS and SVG, no scripts or network) for a stored evaluation report."""
+    scores = {name: int(value) for name, value in (report.get("scores") or {}).items() if isinstance(value, (int, float))}
+    feedback = report.get("feedback") or {}
+    artifact = report.get("artifact") or {}
+    heading = title or "Interview Performance Report"
+    meta = " · ".join(part for part in (role, level) if part)
+
+    metrics = [("Decision", report.get("hiring_decision", "N/A")),
+               ("Technical Score", f"{scores.get('technical_depth', 0)}/100"),
+               ("Communication", f"{scores.get('communication_clarity', 0)}/100")]
+    html = [
+        "<!DOCTYPE html>", '<html lang="en">', "<head>", '<meta charset="utf-8">',
+        f"<title>{escape(heading)}</title>", f"<style>{_STYLE}</style>", "</head>", "<body>",
+        f"<h1>{escape(heading)}</h1>", f'<p class="meta">{escape(meta)}</p>',
+        '<div class="metrics">',
+        *(f'<div class="metric"><div class="label">{escape(label)}</div><div class="value">{escape(str(value))}</div></div>'
+          for label, value in metrics),
+        "</div>"
+    ]
+
+    cohort = report.get("cohort")
+    if cohort:
+        group = f"{cohort['role']} ({cohort['level']})" if cohort.get("level") else cohort["role"]
+        html.append(f'<p class="cohort">Cohort: {ordinal(cohort["percentiles"].get("overall", 0))} percentile overall among '
+                    f'{cohort["size"]} {escape(group)} interviews.</p>')
+
+    html += ['<div class="columns">', f"<div>{radar_svg(scores)}</div>", "<div>",
+             "<h2>Executive Summary</h2>", f"<p>{escape(report.get('executive_summary', 'No summary available.'))}</p>",
+             "<h2>Coach's Tips</h2>"]
+    html += [f'<div class="tip">{escape(tip)}</div>' for tip in feedback.get("coach_tips", [])]
+    html += ["</div>", "</div>"]
+
+    for label, key in (("Strengths", "strengths"), ("Weaknesses", "weaknesses")):
+        if feedback.get(key):
+            html += [f"<h2>{label}</h2>", "<ul>", *(f"<li>{escape(item)}</li>" for item in feedback[key]), "</ul>"]
+
+    html.append("<h2>Scores</h2><table>")
+    html += [f"<tr><td>{escape(name.replace('_', ' ').title())}</td><td>{value}/100</td></tr>" for name, value in scores.items()]
+    html.append("</table>")
+
+    html.append("<h2>Evidence &amp; Verification</h2>")
+    evidence = report.get("evidence") or []
+    if not evidence:
+        html.append("<p>No specific claims verified.</p>")
+    for item in evidence:
+        html.append(f'<div class="evidence"><strong>{escape(item.get("verdict", "Neutral"))}:</strong> '
+                    f'{escape(item.get("claim", "Claim"))}<div class="quote">"{escape(item.get("quote", "N/A"))}"</div></div>')
+
+    if artifact.get("key"):
+        html.append(f'<p class="meta">Report {escape(artifact["key"][:12])}</p>')
+    html += ["</body>", "</html>"]
+    return "\n".join(html)
@@ -0,0 +1,74 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from typing import Dict, List, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REPORT_ARTIFACT_VERSION = 1
+DEFAULT_REPORT_DIR = "data/reports"
+
+def report_key(conversation_history: List[Dict], role: str, level: str, interview_plan: Optional[Dict],
+               prompt_version: int) -> str:
+    """Content hash identifying one evaluation: transcript text, role, level, plan and prompt version."""
+    payload = {
+        "transcript": [[m["role"], m["content"]] for m in conversation_history],
+        "role": role,
+        "level": level,
+        "plan": interview_plan or {},
+        "prompt_version": prompt_version
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class ReportStore:
+    """Finished evaluation reports as immutable JSON artifacts, one file per report key."""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.getenv("INTERVIEW_REPORT_DIR", DEFAULT_REPORT_DIR)
+        os.makedirs(self.root, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """The stored artifact ({key, prompt_version, role, level, created_at, report}) or None."""
+        try:
+            with open(self._path(key), "r") as f:
+                artifact = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable report artifact {key}: {e}")
+            return None
+        if artifact.get("version") != REPORT_ARTIFACT_VERSION:
+            return None
+        return artifact
+
+    def put(self, key: str, report: Dict, role: str, level: str, prompt_version: int) -> Dict:
+        artifact = {
+            "version": REPORT_ARTIFACT_VERSION,
+            "key": key,
+            "prompt_version": prompt_version,
+            "role": role,
+            "level": level,
+            "created_at": time.time(),
+            "report": report
+        }
+        # Write-then-rename so concurrent readers never see a half-written artifact.
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(artifact, f, separators=(",", ":"))
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return artifact
+
+    def _path(self, key: str) -> str:
+        if len(key) != 64 or not all(c in "0123456789abcdef" for c in key):
+            raise KeyError(f"Invalid report key: {key}")
+        return os.path.join(self.root, f"{key}.json")
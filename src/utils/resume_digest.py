@@ -0,0 +1,180 @@
+import re
+from typing import Dict, List, Optional
+
+DIGEST_VERSION = 1
+
+MAX_ROLES = 6
+MAX_SKILLS = 20
+MAX_PROJECTS = 5
+MAX_CLAIMS = 6
+MAX_ITEM_CHARS = 120
+
+_SECTION_HEADINGS = {
+    "summary": ("summary", "profile", "objective", "about me", "professional summary"),
+    "experience": ("experience", "work experience", "professional experience", "employment", "work history", "career history"),
+    "skills": ("skills", "technical skills", "core competencies", "competencies", "technologies", "tools", "key skills"),
+    "projects": ("projects", "personal projects", "selected projects", "key projects"),
+    "education": ("education", "academic background", "qualifications"),
+    "certifications": ("certifications", "certificates", "licenses", "awards", "achievements")
+}
+_HEADING_LOOKUP = {alias: section for section, aliases in _SECTION_HEADINGS.items() for alias in aliases}
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+\d{{4}}|\d{{1,2}}/\d{{4}}|\d{{4}})"
+_DATE_RANGE = re.compile(rf"({_DATE})\s*(?:-|–|—|to)\s*({_DATE}|present|current|now|today)", re.IGNORECASE)
+_YEAR = re.compile(r"(19|20)\d{2}")
+_BULLET = re.compile(r"^\s*(?:[-•●▪◦*·]|\d+[.)])\s*")
+_METRIC = re.compile(r"\d+(?:\.\d+)?\s*(?:%|x\b|k\b|m\b|\+)|\$\s*\d|\b(?!(?:19|20)\d{2}\b)\d{2,}\b", re.IGNORECASE)
+_SKILL_SPLIT = re.compile(r"[,|;•●▪]|\s{2,}")
+
+_TITLE_WORDS = {
+    "engineer", "developer", "manager", "analyst", "scientist", "intern", "lead", "architect",
+    "consultant", "director", "associate", "representative", "specialist", "administrator",
+    "designer", "cashier", "supervisor", "head", "officer", "executive", "coordinator", "founder"
+}
+_CLAIM_VERBS = {
+    "led", "built", "designed", "architected", "launched", "reduced", "improved", "increased",
+    "grew", "managed", "owned", "delivered", "migrated", "scaled", "optimized", "automated",
+    "developed", "implemented", "created", "exceeded", "achieved", "mentored", "drove", "closed"
+}
+# Matched anywhere in the text so skills outside a "Skills" section are still picked up.
+_KNOWN_SKILLS = {
+    "python", "java", "javascript", "typescript", "golang", "rust", "c++", "c#", "ruby", "kotlin",
+    "swift", "scala", "sql", "postgresql", "mysql", "mongodb", "redis", "kafka", "spark", "hadoop",
+    "aws", "gcp", "azure", "docker", "kubernetes", "terraform", "linux", "git", "react", "angular",
+    "vue", "node.js", "django", "flask", "fastapi", "spring", "graphql", "rest api", "restful", "microservices",
+    "tensorflow", "pytorch", "pandas", "numpy", "machine learning", "ci/cd", "airflow", "snowflake",
+    "salesforce", "hubspot", "crm", "cold calling", "negotiation", "lead generation", "account management",
+    "point of sale", "inventory", "merchandising", "customer service", "cash handling", "excel", "tableau"
+}
+_KNOWN_SKILL_PATTERN = re.compile(
+    r"(?<![\w+#.])(" + "|".join(re.escape(s) for s in sorted(_KNOWN_SKILLS, key=len, reverse=True)) + r")(?![\w+#])",
+    re.IGNORECASE
+)
+
+def build_resume_digest(resume_text: str) -> Dict:
+    """Compact structured profile of a resume (roles, skills, dates, projects, claims), built locally in one pass."""
+    if not resume_text:
+        return {}
+
+    sections = _split_sections(resume_text)
+    experience = sections.get("experience") or sections.get("other", [])
+
+    roles = _extract_roles(experience)
+    date_ranges = [m.group(0) for m in _DATE_RANGE.finditer(resume_text)]
+    years = [int(y.group(0)) for y in _YEAR.finditer(" ".join(date_ranges))]
+
+    return {
+        "version": DIGEST_VERSION,
+        "roles": roles,
+        "skills": _extract_skills(sections.get("skills", []), resume_text),
+        "dates": {
+            "earliest": min(years) if years else None,
+            "latest": max(years) if years else None,
+            "current": any(re.search(r"present|current|now|today", d, re.IGNORECASE) for d in date_ranges)
+        },
+        "projects": _extract_projects(sections.get("projects", [])),
+        "claims": _extract_claims(experience + sections.get("projects", []) + sections.get("summary", [])),
+        "education": [_clip(line) for line in _content_lines(sections.get("education", []))[:2]]
+    }
+
+def format_digest(digest: Optional[Dict]) -> str:
+    """Renders a digest as the short text block embedded in prompts."""
+    if not digest:
+        return ""
+
+    lines = []
+    if digest.get("roles"):
+        lines.append("Roles: " + "; ".join(
+            f"{r['title']} ({r['dates']})" if r.get("dates") else r["title"] for r in digest["roles"]
+        ))
+    dates = digest.get("dates") or {}
+    if dates.get("earliest"):
+        end = "present" if dates.get("current") else dates.get("latest")
+        lines.append(f"Timeline: {dates['earliest']}-{end}")
+    if digest.get("skills"):
+        lines.append("Skills: " + ", ".join(digest["skills"]))
+    if digest.get("projects"):
+        lines.append("Projects: " + "; ".join(digest["projects"]))
+    if digest.get("education"):
+        lines.append("Education: " + "; ".join(digest["education"]))
+    if digest.get("claims"):
+        lines.append("Claims:\n" + "\n".join(f"- {c}" for c in digest["claims"]))
+    return "\n".join(lines)
+
+def _split_sections(text: str) -> Dict[str, List[str]]:
+    sections: Dict[str, List[str]] = {}
+    current = "other"
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        heading = _HEADING_LOOKUP.get(line.lower().strip(":").strip())
+        if heading:
+            current = heading
+            continue
+        sections.setdefault(current, []).append(line)
+    return sections
+
+def _content_lines(lines: List[str]) -> List[str]:
+    return [_BULLET.sub("", line).strip() for line in lines if _BULLET.sub("", line).strip()]
+
+def _extract_roles(lines: List[str]) -> List[Dict]:
+    roles = []
+    for line in lines:
+        if _BULLET.match(line):
+            continue
+        date_match = _DATE_RANGE.search(line)
+        words = set(re.findall(r"[a-z]+", line.lower()))
+        if not date_match and not (words & _TITLE_WORDS and len(line) < 80):
+            continue
+        title = _DATE_RANGE.sub("", line).strip(" ,|-–—()")
+        if not title:
+            # Dates on their own line belong to the role above them.
+            if roles and not roles[-1]["dates"] and date_match:
+                roles[-1]["dates"] = date_match.group(0)
+            continue
+        roles.append({"title": _clip(title, 80), "dates": date_match.group(0) if date_match else ""})
+        if len(roles) >= MAX_ROLES:
+            break
+    return roles
+
+def _extract_skills(skill_lines: List[str], text: str) -> List[str]:
+    skills: List[str] = []
+    seen = set()
+
+    def add(skill: str):
+        key = skill.lower()
+        if key not in seen and 1 < len(skill) <= 40:
+            seen.add(key)
+            skills.append(skill)
+
+    for line in _content_lines(skill_lines):
+        if ":" in line:
+            line = line.split(":", 1)[1]
+        for part in _SKILL_SPLIT.split(line):
+            add(part.strip(" .()"))
+    for match in _KNOWN_SKILL_PATTERN.finditer(text):
+        add(match.group(1))
+    return skills[:MAX_SKILLS]
+
+def _extract_projects(lines: List[str]) -> List[str]:
+    headers = [line for line in lines if not _BULLET.match(line)]
+    return [_clip(line, 80) for line in (headers or _content_lines(lines))[:MAX_PROJECTS]]
+
+def _extract_claims(lines: List[str]) -> List[str]:
+    """Achievement statements, metric-bearing ones first; these are what the interview should verify."""
+    scored = []
+    for i, line in enumerate(_content_lines(lines)):
+        words = line.lower().split()
+        if len(words) < 4 or _DATE_RANGE.search(line):
+            continue
+        has_metric = bool(_METRIC.search(line))
+        has_verb = words[0].strip(",.") in _CLAIM_VERBS or bool(set(words[:4]) & _CLAIM_VERBS)
+        if has_metric or has_verb:
+            scored.append((-(2 * has_metric + has_verb), i, _clip(line)))
+    return [claim for _, _, claim in sorted(scored)[:MAX_CLAIMS]]
+
+def _clip(text: str, limit: int = MAX_ITEM_CHARS) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 3].rstrip() + "..."
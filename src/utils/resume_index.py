@@ -0,0 +1,259 @@
+import os
+import re
+import json
+import zlib
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RESUME_INDEX_VERSION = 1
+DEFAULT_INDEX_DIR = "data/resume_index"
+
+NUM_PERM = 128
+# 16 bands of 8 rows: pairs above ~0.7 Jaccard share a band with high probability, pairs below ~0.5 rarely do.
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_WORDS = 3
+MIN_SHINGLES = 20
+# Rows appended after the last sort are scanned linearly; past this many the band index is re-sorted.
+MERGE_EVERY = 4096
+_COLUMN_DTYPES = {"signatures": np.uint32, "bands": np.uint64, "roles": np.uint16, "entries": np.int64}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_rng = np.random.default_rng(20240601)
+# Fixed seed: signatures written by one process must be comparable with those of every other.
+_PERM_A = _rng.integers(1, 1 << 63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_PERM_B = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64)
+_BAND_MIX = _rng.integers(1, 1 << 63, ROWS_PER_BAND, dtype=np.uint64) | np.uint64(1)
+_SHINGLE_MIX = np.array([0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D], dtype=np.uint64)
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    """MinHash of the text's word 3-gram shingles (NUM_PERM uint32 values); None if the text is too short."""
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) < SHINGLE_WORDS + MIN_SHINGLES - 1:
+        return None
+    token_hashes = np.fromiter((zlib.crc32(t.encode()) for t in tokens), dtype=np.uint64, count=len(tokens))
+    n = len(tokens) - SHINGLE_WORDS + 1
+    shingles = np.zeros(n, dtype=np.uint64)
+    for i in range(SHINGLE_WORDS):
+        shingles ^= token_hashes[i:i + n] * _SHINGLE_MIX[i]
+    shingles = np.unique(shingles & np.uint64(0xFFFFFFFF))
+    # Multiply-shift hashing: the high 32 bits of (a * x + b) mod 2^64, computed in place; no modulo pass.
+    hashed = np.multiply(_PERM_A[:, None], shingles)
+    np.add(hashed, _PERM_B[:, None], out=hashed)
+    np.right_shift(hashed, np.uint64(32), out=hashed)
+    return hashed.min(axis=1).astype(np.uint32)
+
+def band_hashes(signatures: np.ndarray) -> np.ndarray:
+    """One 64-bit key per LSH band: (rows, NUM_PERM) signatures -> (rows, BANDS)."""
+    bands = signatures.reshape(len(signatures), BANDS, ROWS_PER_BAND).astype(np.uint64)
+    return (bands * _BAND_MIX).sum(axis=2, dtype=np.uint64)
+
+class ResumeIndex:
+    """Persistent MinHash/LSH index of analyzed resumes, for near-duplicate lookups.
+
+    Layout under root: append-only binary columns (`signatures.bin`, `bands.bin`, `roles.bin`,
+    `entries.bin` with offsets into `entries.jsonl`) plus `meta.json` holding the committed row count,
+    so readers in other processes never see a half-written row. Lookups binary-search per-band sorted
+    keys, scan the few rows appended since the last sort, and verify candidates on the full signature.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.getenv("INTERVIEW_RESUME_INDEX_DIR", DEFAULT_INDEX_DIR)
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._meta: Dict = self._empty_meta()
+        self._meta_mtime = None
+        self._columns: Dict[str, np.ndarray] = {}
+        self._sorted_rows = 0
+        self._sorted_keys = np.empty((BANDS, 0), dtype=np.uint64)
+        self._sorted_order = np.empty((BANDS, 0), dtype=np.int32)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return self._meta["rows"]
+
+    def add(self, role: str, signature: np.ndarray, payload: Dict) -> int:
+        """Stores one resume's signature with its payload (e.g. the interview plan); returns its row."""
+        return self.add_many([(role, signature, payload)])[0]
+
+    def add_many(self, items: Iterable[Tuple[str, np.ndarray, Dict]]) -> List[int]:
+        items = list(items)
+        if not items:
+            return []
+        with self._write_lock():
+            meta = self._read_meta()
+            rows, entries_bytes = meta["rows"], meta["entries_bytes"]
+            signatures = np.stack([signature for _, signature, _ in items]).astype(np.uint32)
+            role_codes, lines, offsets = [], [], []
+            for role, _, payload in items:
+                if role not in meta["roles"]:
+                    meta["roles"].append(role)
+                role_codes.append(meta["roles"].index(role))
+                line = (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+                offsets.append((entries_bytes, len(line)))
+                entries_bytes += len(line)
+                lines.append(line)
+
+            columns = {
+                "signatures": signatures,
+                "bands": band_hashes(signatures),
+                "roles": np.asarray(role_codes, dtype=np.uint16),
+                "entries": np.asarray(offsets, dtype=np.int64)
+            }
+            for name, values in columns.items():
+                self._append_column(name, values, rows)
+            self._append_bytes("entries.jsonl", b"".join(lines), meta["entries_bytes"])
+
+            meta["rows"] = rows + len(items)
+            meta["entries_bytes"] = entries_bytes
+            self._write_meta(meta)
+        return list(range(rows, rows + len(items)))
+
+    def query(self, signature: np.ndarray, role: Optional[str] = None, threshold: float = 0.0,
+              k: int = 1) -> List[Dict]:
+        """Up to k stored resumes sharing an LSH band with signature, at or above threshold, most similar first."""
+        with self._lock:
+            self._refresh()
+            rows = self._meta["rows"]
+            if not rows:
+                return []
+            if role is not None and role not in self._meta["roles"]:
+                return []
+            if rows - self._sorted_rows > MERGE_EVERY:
+                self._merge()
+
+            keys = band_hashes(signature[None, :])[0]
+            candidates = []
+            for band in range(BANDS):
+                sorted_keys = self._sorted_keys[band]
+                lo = np.searchsorted(sorted_keys, keys[band], side="left")
+                hi = np.searchsorted(sorted_keys, keys[band], side="right")
+                if hi > lo:
+                    candidates.append(self._sorted_order[band, lo:hi])
+            if rows > self._sorted_rows:
+                recent = self._columns["bands"][self._sorted_rows:rows]
+                candidates.append(np.flatnonzero((recent == keys).any(axis=1)).astype(np.int32) + self._sorted_rows)
+            if not candidates:
+                return []
+
+            candidates = np.unique(np.concatenate(candidates))
+            if role is not None:
+                candidates = candidates[self._columns["roles"][candidates] == self._meta["roles"].index(role)]
+            similarity = (self._columns["signatures"][candidates] == signature).mean(axis=1)
+            keep = similarity >= threshold
+            candidates, similarity = candidates[keep], similarity[keep]
+            best = np.argsort(-similarity, kind="stable")[:k]
+            return [{"row": int(candidates[i]), "similarity": round(float(similarity[i]), 3)} for i in best]
+
+    def payload(self, row: int) -> Dict:
+        with self._lock:
+            self._refresh()
+            offset, length = self._columns["entries"][row]
+        with open(os.path.join(self.root, "entries.jsonl"), "rb") as f:
+            f.seek(int(offset))
+            return json.loads(f.read(int(length)))
+
+    def find_duplicate(self, text: str, role: str, threshold: float) -> Tuple[Optional[np.ndarray], Optional[Dict]]:
+        """(signature, best match with its payload or None); the signature is None for texts too short to index."""
+        signature = minhash_signature(text)
+        if signature is None:
+            return None, None
+        matches = self.query(signature, role=role, threshold=threshold, k=1)
+        if not matches:
+            return signature, None
+        return signature, dict(matches[0], payload=self.payload(matches[0]["row"]))
+
+    def _refresh(self):
+        """Picks up rows committed by this or another process; only the memory maps are rebuilt."""
+        try:
+            stat = os.stat(self._meta_path())
+        except FileNotFoundError:
+            return
+        # meta.json is replaced on every commit, so a new inode or mtime means new rows.
+        mtime = (stat.st_ino, stat.st_mtime_ns)
+        if mtime == self._meta_mtime:
+            return
+        meta = self._read_meta()
+        rows = meta["rows"]
+        shapes = {"signatures": (rows, NUM_PERM), "bands": (rows, BANDS), "roles": (rows,), "entries": (rows, 2)}
+        self._columns = {
+            name: np.memmap(self._column_path(name), dtype=_COLUMN_DTYPES[name], mode="r", shape=shape)
+            for name, shape in shapes.items()
+        } if rows else {}
+        self._meta, self._meta_mtime = meta, mtime
+        self._sorted_rows = min(self._sorted_rows, rows)
+
+    def _merge(self):
+        rows = self._meta["rows"]
+        bands = np.ascontiguousarray(self._columns["bands"][:rows].T)
+        self._sorted_order = np.argsort(bands, axis=1, kind="stable").astype(np.int32)
+        self._sorted_keys = np.take_along_axis(bands, self._sorted_order, axis=1)
+        self._sorted_rows = rows
+
+    def _append_column(self, name: str, values: np.ndarray, rows: int):
+        row_bytes = values.itemsize * (values.size // len(values))
+        self._append_bytes(f"{name}.bin", np.ascontiguousarray(values).tobytes(), rows * row_bytes)
+
+    def _append_bytes(self, filename: str, data: bytes, committed_bytes: int):
+        # Bytes past the committed size are left over from an interrupted append; overwrite them.
+        with open(os.path.join(self.root, filename), "ab+") as f:
+            f.truncate(committed_bytes)
+            f.write(data)
+
+    def _empty_meta(self) -> Dict:
+        return {"version": RESUME_INDEX_VERSION, "num_perm": NUM_PERM, "bands": BANDS, "rows": 0,
+                "entries_bytes": 0, "roles": []}
+
+    def _read_meta(self) -> Dict:
+        try:
+            with open(self._meta_path(), "r") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return self._empty_meta()
+        if (meta.get("version"), meta.get("num_perm"), meta.get("bands")) != (RESUME_INDEX_VERSION, NUM_PERM, BANDS):
+            raise ValueError(f"Incompatible resume index in {self.root}")
+        return meta
+
+    def _write_meta(self, meta: Dict):
+        # Write-then-rename: the row count only moves once every column has its new rows.
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".meta.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(meta, f, separators=(",", ":"))
+            os.replace(tmp_path, self._meta_path())
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(self.root, "append.lock"), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _column_path(self, name: str) -> str:
+        return os.path.join(self.root, f"{name}.bin")
+
+    def _meta_path(self) -> str:
+        return os.path.join(self.root, "meta.json")
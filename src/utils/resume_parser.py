@@ -1,5 +1,3 @@
-import io
-from pypdf import PdfReader
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -12,6 +10,7 @@ class ResumeParser:
             if not file_obj:
                 return ""
             
+            from pypdf import PdfReader
             reader = PdfReader(file_obj)
             text = ""
             for page in reader.pages:
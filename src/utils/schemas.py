@@ -0,0 +1,125 @@
+import logging
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class LLMOutput(BaseModel):
+    # Keep any extra keys the model adds; every field has a default so partial output still validates.
+    model_config = ConfigDict(extra="allow")
+    # Fields the model must actually send; filling one of these from its default counts as a repair.
+    required_keys: ClassVar[Tuple[str, ...]] = ()
+
+class FocusArea(LLMOutput):
+    topic: str = "General Experience"
+    reason: str = ""
+    suggested_question: str = "Tell me about your background."
+
+class ResumePlan(LLMOutput):
+    candidate_name: str = "Candidate"
+    years_experience: str = ""
+    strengths: List[str] = []
+    focus_areas: List[FocusArea] = []
+
+    @field_validator("candidate_name", "years_experience", mode="before")
+    @classmethod
+    def _stringify(cls, value: Any) -> Any:
+        return str(value) if isinstance(value, (int, float)) else value
+
+class ReasoningOutput(LLMOutput):
+    analysis: str = ""
+    detected_persona: str = "Neutral"
+    strategy: str = "MOVE_ON"
+    reasoning: str = ""
+    next_focus: str = "experience"
+    confidence: Optional[float] = None
+
+    @field_validator("strategy", mode="before")
+    @classmethod
+    def _normalize_strategy(cls, value: Any) -> Any:
+        return value.strip().upper().replace(" ", "_") if isinstance(value, str) else value
+
+class Scores(LLMOutput):
+    required_keys = ("technical_depth", "communication_clarity", "problem_solving", "culture_fit", "consistency")
+
+    technical_depth: int = 50
+    communication_clarity: int = 50
+    problem_solving: int = 50
+    culture_fit: int = 50
+    consistency: int = 50
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def _clamp(cls, value: Any) -> Any:
+        if isinstance(value, str) and value.strip().split("/")[0].strip().replace(".", "", 1).isdigit():
+            value = float(value.strip().split("/")[0])
+        if isinstance(value, (int, float)):
+            return int(min(max(round(value), 0), 100))
+        return value
+
+class Feedback(LLMOutput):
+    strengths: List[str] = []
+    weaknesses: List[str] = []
+    coach_tips: List[str] = []
+
+class EvidenceItem(LLMOutput):
+    claim: str = "Claim"
+    verdict: str = "Neutral"
+    quote: str = "Not found"
+
+class EvaluationReport(LLMOutput):
+    required_keys = ("scores", "hiring_decision", "executive_summary")
+
+    scores: Scores = Scores()
+    feedback: Feedback = Feedback()
+    evidence: List[EvidenceItem] = []
+    hiring_decision: str = "Pending Review"
+    executive_summary: str = "No summary available."
+
+def coerce_to_schema(data: Dict[str, Any], schema: Type[BaseModel], max_fixes: int = 50) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """Validates data against schema, dropping invalid fields or list items so their defaults apply.
+
+    Returns (validated dict or None, whether anything had to be dropped or a required key was missing).
+    """
+    if not isinstance(data, dict):
+        return None, False
+
+    repaired = False
+    for _ in range(max_fixes):
+        try:
+            model = schema.model_validate(data)
+            return model.model_dump(), repaired or _missing_required(model)
+        except ValidationError as e:
+            if not _drop_at(data, e.errors()[0]["loc"]):
+                break
+            repaired = True
+
+    logger.warning(f"Could not coerce output into {schema.__name__}.")
+    return None, repaired
+
+def _missing_required(model: BaseModel) -> bool:
+    """True if the model, or any nested model, filled one of its required_keys from a default."""
+    if any(key not in model.model_fields_set for key in getattr(model, "required_keys", ())):
+        return True
+    for name in model.model_fields_set:
+        value = getattr(model, name, None)
+        if isinstance(value, BaseModel) and _missing_required(value):
+            return True
+    return False
+
+def _drop_at(data: Any, loc: Tuple) -> bool:
+    """Removes the value at loc (a dict key or list index) from the nested data."""
+    if not loc:
+        return False
+    parent = data
+    for part in loc[:-1]:
+        try:
+            parent = parent[part]
+        except (KeyError, IndexError, TypeError):
+            return False
+    try:
+        del parent[loc[-1]]
+        return True
+    except (KeyError, IndexError, TypeError):
+        return False
@@ -0,0 +1,293 @@
+import os
+import json
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SCORE_STORE_VERSION = 1
+DEFAULT_SCORE_DIR = "data/conversation_logs/scores"
+
+SCORE_COLUMNS = ["technical_depth", "communication_clarity", "problem_solving", "culture_fit", "consistency"]
+CATEGORY_COLUMNS = ["role", "level", "decision", "persona"]
+# One flat binary file per column; rows are appended, never rewritten.
+COLUMN_DTYPES = {
+    **{name: np.uint8 for name in SCORE_COLUMNS},
+    **{name: np.uint8 for name in CATEGORY_COLUMNS},
+    "ended_at": np.float64
+}
+# Category codes are uint8; values beyond the first MAX_CATEGORIES share one code.
+MAX_CATEGORIES = 255
+OTHER_CATEGORY = "Other"
+DECISIONS = ["STRONG HIRE", "HIRE", "NO HIRE"]
+HIRE_DECISIONS = {"STRONG HIRE", "HIRE"}
+SCORE_NAMES = SCORE_COLUMNS + ["overall"]
+# Scores are kept in fifths of a point, the resolution of the five-score mean.
+SCORE_BINS = 100 * len(SCORE_COLUMNS) + 1
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+# Below this many interviews a role+level cohort falls back to the whole role.
+MIN_COHORT_SIZE = 5
+
+def normalize_decision(decision: str) -> Optional[str]:
+    """Maps the evaluator's free-text hiring decision onto DECISIONS; None for pending or unknown ones."""
+    text = " ".join((decision or "").upper().replace("-", " ").split())
+    if "HIRE" not in text:
+        return None
+    if text.startswith(("NO ", "NOT ", "DO NOT", "DON'T")) or " NO HIRE" in f" {text}":
+        return "NO HIRE"
+    return "STRONG HIRE" if "STRONG" in text else "HIRE"
+
+class ScoreStore:
+    """Columnar, append-only store of interview scores, memory-mapped for vectorized cohort queries.
+
+    Layout under root: one `<column>.bin` per column plus `meta.json` with the committed row count
+    and the category vocabularies. Bytes past the committed count (an interrupted append) are ignored
+    by readers and overwritten by the next append.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.getenv("INTERVIEW_SCORE_DIR", DEFAULT_SCORE_DIR)
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._cache_key = None
+        self._cache: Dict[str, np.ndarray] = {}
+        self._meta: Dict = {}
+
+    def __len__(self) -> int:
+        return self._load_meta()["rows"]
+
+    def append(self, role: str, level: str, scores: Dict[str, int], decision: str, persona: str,
+               ended_at: float) -> bool:
+        """Adds one finished interview; reports without a recognizable hiring decision are skipped."""
+        return self.append_many([{"role": role, "level": level, "scores": scores, "decision": decision,
+                                  "persona": persona, "ended_at": ended_at}]) == 1
+
+    def append_many(self, records: Iterable[Dict]) -> int:
+        """Appends records shaped like append()'s arguments in one locked write; returns how many were stored."""
+        with self._write_lock():
+            meta = self._load_meta()
+            columns: Dict[str, List] = {name: [] for name in COLUMN_DTYPES}
+            for record in records:
+                decision = normalize_decision(record.get("decision", ""))
+                if decision is None:
+                    continue
+                scores = record.get("scores") or {}
+                for name in SCORE_COLUMNS:
+                    columns[name].append(int(min(max(scores.get(name, 0) or 0, 0), 100)))
+                values = {"role": record["role"], "level": record["level"], "decision": decision,
+                          "persona": record.get("persona") or "Neutral"}
+                for name, value in values.items():
+                    vocab = meta["vocab"][name]
+                    if value not in vocab and len(vocab) >= MAX_CATEGORIES:
+                        value = OTHER_CATEGORY
+                    if value not in vocab:
+                        vocab.append(value)
+                    columns[name].append(vocab.index(value))
+                columns["ended_at"].append(record.get("ended_at", 0.0))
+
+            added = len(columns["ended_at"])
+            if not added:
+                return 0
+            rows = meta["rows"]
+            for name, dtype in COLUMN_DTYPES.items():
+                with open(self._column_path(name), "ab+") as f:
+                    f.truncate(rows * np.dtype(dtype).itemsize)
+                    f.write(np.asarray(columns[name], dtype=dtype).tobytes())
+            meta["rows"] = rows + added
+            self._save_meta(meta)
+        return added
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Read-only memory-mapped columns holding the committed rows; remapped only after new appends."""
+        meta = self._load_meta()
+        # The vocabularies only grow together with the row count, so the count alone identifies a snapshot.
+        key = meta["rows"]
+        if key != self._cache_key:
+            rows = meta["rows"]
+            self._cache = {
+                name: np.memmap(self._column_path(name), dtype=dtype, mode="r", shape=(rows,)) if rows
+                else np.empty(0, dtype=dtype)
+                for name, dtype in COLUMN_DTYPES.items()
+            }
+            self._meta, self._cache_key = meta, key
+        return self._cache
+
+    def cohort_mask(self, role: Optional[str] = None, level: Optional[str] = None) -> np.ndarray:
+        cols = self.columns()
+        mask = np.ones(len(cols["ended_at"]), dtype=bool)
+        for name, value in (("role", role), ("level", level)):
+            if value is None:
+                continue
+            vocab = self._meta["vocab"][name]
+            if value not in vocab:
+                return np.zeros_like(mask)
+            mask &= cols[name] == vocab.index(value)
+        return mask
+
+    def score_values(self, score: str, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """One score per row in fifths of a point (0-500), so "overall", the mean of the five scores, stays integral."""
+        cols = self.columns()
+        if score == "overall":
+            values = np.zeros(len(cols["ended_at"]), dtype=np.int16)
+            for name in SCORE_COLUMNS:
+                values += cols[name]
+        elif score in SCORE_COLUMNS:
+            values = cols[score].astype(np.int16) * len(SCORE_COLUMNS)
+        else:
+            raise ValueError(f"Unknown score: {score}")
+        return values if mask is None else values[mask]
+
+    def score_counts(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cohort histogram per score (SCORE_NAMES x 501 bins of one fifth of a point each).
+
+        Percentiles, means and ranks are all read off these counts, which avoids sorting the cohort.
+        """
+        return np.stack([np.bincount(self.score_values(name, mask), minlength=SCORE_BINS) for name in SCORE_NAMES])
+
+    def summary(self, role: Optional[str] = None, level: Optional[str] = None,
+                percentiles=DEFAULT_PERCENTILES) -> Dict:
+        """Score percentiles and means, decision and hire rates, and persona mix for one cohort."""
+        mask = self.cohort_mask(role, level)
+        count = int(mask.sum())
+        result = {"role": role, "level": level, "count": count}
+        if not count:
+            return result
+
+        counts = self.score_counts(mask)
+        table = _percentiles_from_counts(counts, percentiles)
+        means = counts @ np.arange(SCORE_BINS) / count / len(SCORE_COLUMNS)
+        result["scores"] = {
+            name: {"mean": round(float(means[i]), 1),
+                   **{f"p{p}": round(float(table[i, j]), 1) for j, p in enumerate(percentiles)}}
+            for i, name in enumerate(SCORE_NAMES)
+        }
+        decisions = self._shares("decision", mask, count)
+        result["decisions"] = decisions
+        result["hire_rate"] = round(float(self._hired()[mask].mean()), 3)
+        result["persona_mix"] = self._shares("persona", mask, count)
+        return result
+
+    def distribution(self, score: str = "overall", role: Optional[str] = None, level: Optional[str] = None,
+                     bins: int = 10) -> Dict:
+        """Histogram of one score (or "overall") over 0-100 for a cohort."""
+        values = self.score_values(score, self.cohort_mask(role, level))
+        bin_of = np.minimum(np.arange(SCORE_BINS) * bins // (SCORE_BINS - 1), bins - 1)
+        counts = np.bincount(bin_of[values], minlength=bins)
+        edges = np.linspace(0, 100, bins + 1)
+        return {"score": score, "role": role, "level": level, "count": int(len(values)),
+                "edges": [round(float(e), 1) for e in edges], "counts": counts.tolist()}
+
+    def breakdown(self, score: str = "overall", percentiles=(25, 50, 75)) -> List[Dict]:
+        """Per role and level: interview count, score percentiles and hire rate, from one grouped bincount."""
+        if score not in SCORE_NAMES:
+            raise ValueError(f"Unknown score: {score}")
+        cols = self.columns()
+        if not len(cols["ended_at"]):
+            return []
+        n_levels = max(len(self._meta["vocab"]["level"]), 1)
+        groups = cols["role"].astype(np.int64) * n_levels + cols["level"]
+        n_groups = int(groups.max()) + 1
+        counts = np.bincount(groups * SCORE_BINS + self.score_values(score),
+                             minlength=n_groups * SCORE_BINS).reshape(n_groups, SCORE_BINS)
+        hires = np.bincount(groups, weights=self._hired(), minlength=n_groups)
+
+        totals = counts.sum(axis=1)
+        present = np.flatnonzero(totals)
+        table = _percentiles_from_counts(counts[present], percentiles)
+        return [{
+            "role": self._meta["vocab"]["role"][group // n_levels],
+            "level": self._meta["vocab"]["level"][group % n_levels],
+            "count": int(totals[group]),
+            **{f"p{p}": round(float(v), 1) for p, v in zip(percentiles, table[i])},
+            "hire_rate": round(float(hires[group] / totals[group]), 3)
+        } for i, group in enumerate(present)]
+
+    def percentile_rank(self, scores: Dict[str, int], role: str, level: str) -> Optional[Dict]:
+        """Where a report's scores fall within its role+level cohort (or the whole role if that is too small)."""
+        cohort = {"role": role, "level": level}
+        mask = self.cohort_mask(role, level)
+        if mask.sum() < MIN_COHORT_SIZE:
+            cohort = {"role": role, "level": None}
+            mask = self.cohort_mask(role)
+        count = int(mask.sum())
+        if count < MIN_COHORT_SIZE:
+            return None
+
+        counts = self.score_counts(mask)
+        cumulative = counts.cumsum(axis=1)
+        candidate = [int(min(max(scores.get(name, 0) or 0, 0), 100)) * len(SCORE_COLUMNS) for name in SCORE_COLUMNS]
+        candidate.append(sum(candidate) // len(SCORE_COLUMNS))
+        rows = np.arange(len(SCORE_NAMES))
+        below = np.where(np.array(candidate) > 0, cumulative[rows, np.maximum(np.array(candidate) - 1, 0)], 0)
+        # Mid-rank percentile: ties count half, so a cohort of identical scores puts everyone at 50.
+        ranks = (below + 0.5 * counts[rows, candidate]) / count * 100
+        return {**cohort, "size": count,
+                "percentiles": {name: int(round(float(r))) for name, r in zip(SCORE_NAMES, ranks)}}
+
+    def _hired(self) -> np.ndarray:
+        vocab = self._meta["vocab"]["decision"]
+        return np.isin(self.columns()["decision"], [vocab.index(d) for d in HIRE_DECISIONS if d in vocab])
+
+    def _shares(self, name: str, mask: np.ndarray, count: int) -> Dict[str, float]:
+        counts = np.bincount(self.columns()[name][mask], minlength=len(self._meta["vocab"][name]))
+        return {label: round(int(n) / count, 3) for label, n in zip(self._meta["vocab"][name], counts) if n}
+
+    def _load_meta(self) -> Dict:
+        try:
+            with open(self._meta_path(), "r") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            meta = {"version": SCORE_STORE_VERSION, "rows": 0, "vocab": {name: [] for name in CATEGORY_COLUMNS}}
+        if meta.get("version") != SCORE_STORE_VERSION:
+            raise ValueError(f"Unsupported score store version: {meta.get('version')}")
+        return meta
+
+    def _save_meta(self, meta: Dict):
+        # Write-then-rename: the row count only moves once every column has its new value.
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".meta.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(meta, f, separators=(",", ":"))
+            os.replace(tmp_path, self._meta_path())
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(self.root, "append.lock"), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _column_path(self, name: str) -> str:
+        return os.path.join(self.root, f"{name}.bin")
+
+    def _meta_path(self) -> str:
+        return os.path.join(self.root, "meta.json")
+
+def _percentiles_from_counts(counts: np.ndarray, percentiles) -> np.ndarray:
+    """Percentiles (in points) of each row of a fifths-of-a-point histogram; rows x percentiles."""
+    cumulative = counts.cumsum(axis=1)
+    table = np.empty((len(counts), len(percentiles)))
+    for i, row in enumerate(cumulative):
+        targets = np.maximum(np.ceil(np.asarray(percentiles) / 100 * row[-1]), 1)
+        table[i] = np.searchsorted(row, targets) / len(SCORE_COLUMNS)
+    return table
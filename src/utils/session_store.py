@@ -0,0 +1,83 @@
+import os
+import json
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class SessionStore:
+    """Shared on-disk store of session snapshots, so any worker process can serve any session."""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.getenv("INTERVIEW_SESSION_DIR", "data/sessions")
+        os.makedirs(self.root, exist_ok=True)
+        self._thread_locks: Dict[str, threading.Lock] = {}
+        self._thread_locks_guard = threading.Lock()
+
+    def save(self, session_id: str, record: Dict):
+        # Write-then-rename so readers in other processes never see a half-written snapshot.
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=f".{session_id}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(record, f, separators=(",", ":"))
+            os.replace(tmp_path, self._path(session_id))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def load(self, session_id: str) -> Optional[Dict]:
+        try:
+            with open(self._path(session_id), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def delete(self, session_id: str):
+        # Under the session lock, so an in-flight save cannot recreate the record afterwards. The .lock file
+        # stays: unlinking it would let a waiter and a newcomer flock two different inodes at once.
+        with self.lock(session_id):
+            path = self._path(session_id)
+            if os.path.exists(path):
+                os.remove(path)
+            with self._thread_locks_guard:
+                self._thread_locks.pop(session_id, None)
+
+    @contextmanager
+    def lock(self, session_id: str) -> Iterator[None]:
+        """Exclusive access to one session across threads and, where supported, across processes."""
+        with self._thread_lock(session_id):
+            if fcntl is None:
+                yield
+                return
+            with open(self._lock_path(session_id), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _thread_lock(self, session_id: str) -> threading.Lock:
+        with self._thread_locks_guard:
+            return self._thread_locks.setdefault(session_id, threading.Lock())
+
+    def _path(self, session_id: str) -> str:
+        return os.path.join(self.root, f"{self._safe_id(session_id)}.json")
+
+    def _lock_path(self, session_id: str) -> str:
+        return os.path.join(self.root, f"{self._safe_id(session_id)}.lock")
+
+    @staticmethod
+    def _safe_id(session_id: str) -> str:
+        if not session_id or not session_id.replace("-", "").replace("_", "").isalnum():
+            raise KeyError(f"Invalid session id: {session_id}")
+        return session_id
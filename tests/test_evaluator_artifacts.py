@@ -0,0 +1,51 @@
+import json
+from types import SimpleNamespace
+import pytest
+from agents.evaluator import InterviewEvaluator
+from utils.report_store import ReportStore
+
+REPORT = {
+    "scores": {"technical_depth": 70, "communication_clarity": 80, "problem_solving": 60, "culture_fit": 75,
+               "consistency": 70},
+    "feedback": {"strengths": ["Clear examples"], "weaknesses": ["Little testing"], "coach_tips": ["Quantify impact"]},
+    "evidence": [],
+    "hiring_decision": "HIRE",
+    "executive_summary": "Solid answers."
+}
+HISTORY = [{"role": "assistant", "content": "How did you scale reads?"},
+           {"role": "user", "content": "I added a Redis cache in front of Postgres."}]
+
+def _evaluator(monkeypatch, tmp_path, completion_text):
+    monkeypatch.setenv("USE_MOCK_API", "true")
+    evaluator = InterviewEvaluator(report_store=ReportStore(str(tmp_path)))
+    evaluator.api_client.is_mock = False
+    reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=completion_text))])
+    evaluator.api_client._complete = lambda tier, deadline, **params: reply
+    return evaluator
+
+@pytest.mark.parametrize("text", [
+    json.dumps(REPORT)[:-1] + ",}",
+    json.dumps(dict(REPORT, scores={"technical_depth": "high"}))
+], ids=["repaired", "defaulted"])
+def test_repaired_or_defaulted_report_is_not_stored(monkeypatch, tmp_path, text):
+    report = _evaluator(monkeypatch, tmp_path, text).generate_comprehensive_report(HISTORY, "Software Engineer", "Mid")
+    assert report["hiring_decision"] == "HIRE"
+    assert "artifact" not in report
+    assert not list(tmp_path.glob("*.json"))
+
+def test_clean_report_is_stored(monkeypatch, tmp_path):
+    report = _evaluator(monkeypatch, tmp_path, json.dumps(REPORT)).generate_comprehensive_report(
+        HISTORY, "Software Engineer", "Mid")
+    assert report["artifact"]["cached"] is False
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+@pytest.mark.parametrize("raw", [
+    {},
+    {"hiring_decision": "HIRE"},
+    {"scores": {"technical_depth": 90}}
+], ids=["empty", "decision-only", "partial-scores"])
+def test_report_missing_required_keys_is_not_stored(monkeypatch, tmp_path, raw):
+    report = _evaluator(monkeypatch, tmp_path, json.dumps(raw)).generate_comprehensive_report(
+        HISTORY, "Software Engineer", "Mid")
+    assert "artifact" not in report
+    assert not list(tmp_path.glob("*.json"))
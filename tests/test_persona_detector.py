@@ -0,0 +1,48 @@
+import pytest
+from utils.persona_detector import PersonaDetector
+
+SPECIFIC_ANSWER = (
+    "At my last company I led the migration of our payments service from a monolith to three services. "
+    "We started by measuring: p99 latency was 840 ms and deploys took 45 minutes. I wrote the design doc, split the "
+    "ledger writes behind an outbox table in Postgres, and used Kafka to publish events to the new settlement service. "
+    "The hardest part was idempotency, so every request carried a key stored with a unique index, and retries became safe. "
+    "We ran both paths in shadow mode for two weeks and compared 1.2 million transactions nightly with a reconciliation job. "
+    "We found 14 mismatches, all caused by rounding in currency conversion, and fixed them with integer minor units. "
+    "After cutover p99 dropped to 210 ms, deploys went to 8 minutes, and on-call pages fell by 60% over the next quarter. "
+    "I also mentored two junior engineers through the rollout, paired with them on the consumer code, and wrote the "
+    "runbook that the team still uses for incident response today. Later I extended the reconciliation job to cover "
+    "refunds, which caught 3 double refunds in its first month, and moved the settlement batch from hourly to every "
+    "5 minutes so finance could close the books 2 days earlier each month."
+)
+
+RAMBLING_ANSWER = (
+    "Um, so yeah, basically, like, I mean I did a lot of things there, you know, and it was kind of a big place, "
+    "like really big, and I guess I was sort of doing a bit of everything, you know, like, um, the stuff with the team "
+    "and the stuff with the other team and, like, basically the whole thing was, I mean, it was a lot, you know? And "
+    "like I think maybe I was doing the thing with the servers or something, I'm not sure, it was kind of a long time "
+    "ago, and um, yeah, so basically it was fine, I guess, and like the people were nice, you know, and I mean we had "
+    "lunch and stuff, and so yeah, I think that kind of covers it, like, more or less, you know what I mean, basically. "
+) * 2
+
+def _route(text: str):
+    detector = PersonaDetector()
+    local = detector.observe(text)
+    return local, detector.reasoning_route(local)
+
+@pytest.mark.parametrize("words", [195, 234])
+def test_long_specific_answer_gets_full_reasoning(words):
+    text = " ".join(SPECIFIC_ANSWER.split()[:words])
+    local, route = _route(text)
+    assert route == "full"
+    assert local["persona"] != "Chatty"
+
+def test_long_rambling_answer_is_skipped_as_chatty():
+    local, route = _route(RAMBLING_ANSWER)
+    assert local["persona"] == "Chatty"
+    assert route == "skip"
+
+@pytest.mark.parametrize("text", ["I don't know, I'd rather not say.", "No idea really."])
+def test_short_evasive_answer_is_skipped(text):
+    local, route = _route(text)
+    assert local["persona"] == "Evasive"
+    assert route == "skip"
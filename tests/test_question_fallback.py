@@ -0,0 +1,27 @@
+import pytest
+from agents import question_bank
+from agents.interviewer import InterviewAgent
+from agents.role_configs import QUESTION_BANKS
+
+@pytest.fixture
+def agent(monkeypatch, tmp_path):
+    monkeypatch.setenv("USE_MOCK_API", "true")
+    monkeypatch.setattr(question_bank, "_bank", question_bank.QuestionBank(bank_dir=str(tmp_path)))
+    return InterviewAgent("Software Engineer", "Mid")
+
+def _force_match(monkeypatch, match):
+    monkeypatch.setattr(question_bank.QuestionBank, "search", lambda self, *args, **kwargs: [match])
+
+def test_generated_question_is_not_asked_verbatim(agent, monkeypatch):
+    match = dict(question_bank.QuestionBank._entry(
+        "Software Engineer", "technical", "on-call", "How do you keep your knowledge of on-call current?", template=11))
+    _force_match(monkeypatch, match)
+    response = agent._fallback_response("MOVE_ON", "experience")
+    assert match["text"] not in response
+    assert "on-call" in response
+
+def test_hand_written_question_is_asked_verbatim(agent, monkeypatch):
+    text = QUESTION_BANKS["Software Engineer"]["technical"][0]
+    match = question_bank.QuestionBank._entry("Software Engineer", "technical", "technical", text, curated=True)
+    _force_match(monkeypatch, match)
+    assert text in agent._fallback_response("MOVE_ON", "experience")
@@ -0,0 +1,49 @@
+import time
+from types import SimpleNamespace
+import pytest
+from agents.interviewer import InterviewAgent
+from utils.api_client import make_deadline
+
+class SlowStream:
+    """Stands in for a Groq chat stream that emits one word every `delay` seconds."""
+
+    def __init__(self, words, delay):
+        self.words, self.delay, self.closed = words, delay, False
+
+    def __iter__(self):
+        for word in self.words:
+            time.sleep(self.delay)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=word + " "))])
+
+    def close(self):
+        self.closed = True
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv("USE_MOCK_API", "true")
+    agent = InterviewAgent("Software Engineer", "Mid")
+    agent.api_client.is_mock = False
+    return agent
+
+def _patch_stream(agent, stream):
+    agent.api_client.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **params: stream)))
+
+def test_stream_stops_at_deadline(agent):
+    stream = SlowStream(["word"] * 50, delay=0.02)
+    _patch_stream(agent, stream)
+    start = time.monotonic()
+    chunks = list(agent.api_client.generate_content_stream("prompt", deadline=make_deadline(0.1)))
+    assert time.monotonic() - start < 0.5
+    assert 0 < len(chunks) < 50
+    assert stream.closed
+
+def test_cut_off_stream_finishes_with_fallback_question(agent, monkeypatch):
+    monkeypatch.setattr(agent, "_begin_turn", lambda *args: None)
+    agent.last_brain_output = {"strategy": "DRILL_DOWN", "reasoning": "Vague answer."}
+    agent.last_strategy = "DRILL_DOWN"
+    monkeypatch.setattr(agent, "_fallback_response", lambda strategy, focus: "Could you give a concrete example?")
+    _patch_stream(agent, SlowStream(["word"] * 50, delay=0.02))
+    reply = "".join(agent.stream_next_question("I built a cache.", deadline=make_deadline(0.1)))
+    assert reply.endswith("Could you give a concrete example?")
+    assert agent.conversation_history[-1]["content"].split() == reply.split()